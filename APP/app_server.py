@@ -1,22 +1,53 @@
 #!/usr/bin/env python3
-from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from http.server import HTTPServer, SimpleHTTPRequestHandler
 import os
 import json
+import atexit
 import subprocess
 import time
 import uuid
 import hashlib
+import bisect
+import collections
+import functools
+import itertools
+import operator
+import queue
+import gzip
+import heapq
+import math
+import re
+import unicodedata
+import sqlite3
 import threading
-from urllib.parse import urlparse, unquote
+from urllib.parse import urlparse, unquote, parse_qs
 from pathlib import Path
 
+try:  # optional fast JSON backend
+    import orjson
+except ImportError:
+    orjson = None
+try:  # optional binary format for state files
+    import msgpack
+except ImportError:
+    msgpack = None
+try:  # optional response compression (preferred over gzip when the client accepts it)
+    import brotli
+except ImportError:
+    brotli = None
+
 BASE = Path(__file__).resolve().parent
 REPO_ROOT = BASE.parent  # /root/.openclaw/workspace-stark
 DATA_FILE = BASE / 'data.json'
 DATA_SEED_FILE = BASE / 'data.sample.json'
+DATA_DB_FILE = BASE / 'data.db'
+DATA_JOURNAL_FILE = BASE / 'data.journal.jsonl'
 TRAIL_FILE = BASE / 'MISSOES_TRAJETO.md'
+# Trail archive: monthly shards + per-shard card index (MISSOES_TRAJETO.md is the legacy single file).
+TRAIL_DIR = BASE / 'trail'
 MISSION_FILE = BASE / 'MISSAO.md'
-CHAT_FILE = BASE / 'agent-chat.json'
+CHAT_FILE = BASE / 'agent-chat.json'  # legacy whole-file chat, imported once into the log
+CHAT_LOG_FILE = BASE / 'agent-chat.jsonl'
 PROJECT_REGISTRY_FILE = Path('/root/.openclaw/PROJECT_REGISTRY.json')
 
 # External messaging must be explicitly enabled and configured via env.
@@ -24,6 +55,29 @@ PROJECT_REGISTRY_FILE = Path('/root/.openclaw/PROJECT_REGISTRY.json')
 WHATSAPP_TARGETS = [x.strip() for x in (os.getenv('WHATSAPP_TARGETS') or '').split(',') if x.strip()]
 WHATSAPP_CLARIFY_ENABLED = os.getenv('WHATSAPP_CLARIFY_ENABLED', '').strip() in ('1', 'true', 'yes', 'on')
 
+# Board state storage engine: "json" (data.json, default), "journal" (data.json snapshot +
+# data.journal.jsonl mutation log) or "sqlite" (data.db in WAL mode).
+# Move an existing board with: python3 app_server.py --import-json (and back with --export-json).
+STORAGE_BACKEND = (os.getenv('MC_STORAGE') or 'json').strip().lower()
+# Serializer for state files, logs and API responses: "auto" (orjson when installed, else stdlib
+# json), "json", "orjson", or "msgpack" (MessagePack state files, when installed). JSON is always
+# written compact; readers sniff the format of state files, so switching needs no conversion.
+SERIALIZER = (os.getenv('MC_SERIALIZER') or 'auto').strip().lower()
+# Journal compaction thresholds (a new snapshot is written when either is exceeded).
+JOURNAL_MAX_ENTRIES = int(os.getenv('MC_JOURNAL_MAX_ENTRIES') or 500)
+JOURNAL_MAX_BYTES = int(os.getenv('MC_JOURNAL_MAX_BYTES') or 4 * 1024 * 1024)
+# Responses at least this big are compressed (br when available, else gzip) if the client
+# sends a matching Accept-Encoding; 0 disables compression.
+COMPRESS_MIN_BYTES = int(os.getenv('MC_COMPRESS_MIN_BYTES') or 1024)
+# HTTP server: address, worker pool size, accept queue (connections beyond it get a 503) and how
+# long an idle keep-alive connection may hold a worker. --host/--port/--workers/--idle-timeout
+# override these.
+HTTP_HOST = os.getenv('MC_HOST') or '0.0.0.0'
+HTTP_PORT = int(os.getenv('MC_PORT') or 8080)
+HTTP_WORKERS = int(os.getenv('MC_HTTP_WORKERS') or 32)
+HTTP_QUEUE = int(os.getenv('MC_HTTP_QUEUE') or 64)
+HTTP_IDLE_TIMEOUT_S = float(os.getenv('MC_HTTP_IDLE_TIMEOUT_S') or 5)
+
 DEFAULT_DATA = {
     'agents': [],
     'columns': [
@@ -44,7 +98,6 @@ DEFAULT_DATA = {
     'auditTrail': [],
     'missionRuns': {},
     'transitionKeys': {},
-    'telemetryCache': {'updatedAt': 0, 'payload': {}},
     'taskSeq': 0,
     'boardRules': {
         'requireApprovalForDone': True,
@@ -110,55 +163,155 @@ def _read_text_snippet(path: Path, start: str = '', end: str = '', max_chars: in
     return txt
 
 
-def infer_context_area(text: str):
-    t = (text or '').lower()
-    if any(k in t for k in ['yt-automator', 'yt automator', 'youtube', 'yt_automator']):
-        return 'yt_automator'
-    if any(k in t for k in ['escala']):
-        return 'escala'
-    if any(k in t for k in ['header', 'topbar', 'brand', 'mission control', 'titulo', 'título', 'métrica', 'metric', 'númer', 'numero', 'contagem', 'count']):
-        return 'topbar'
-    if any(k in t for k in ['kanban', 'board', 'coluna', 'inbox', 'assigned', 'review', 'done', 'fluxo']):
-        return 'board'
-    if any(k in t for k in ['live', 'histórico', 'historico', 'timeline', 'trajeto', 'evidência', 'evidence', 'proof']):
-        return 'live'
-    if any(k in t for k in ['agente', 'agents', 'jarvis', 'wanda', 'thanos', 'alfred', 'oráculo', 'oraculo', 'modelo', 'config']):
-        return 'agents'
-    if any(k in t for k in ['broadcast', 'comando', 'comandos', 'command']):
-        return 'broadcast'
-    if any(k in t for k in ['api', 'backend', 'server', 'endpoint', 'app_server.py']):
-        return 'backend'
-    return 'general'
+# Declarative keyword rules for triage and context routing. Keywords match as substrings of
+# the lowercased text (like `k in text`); within a table the first matching rule wins.
+CONTEXT_AREA_RULES = [
+    ('yt_automator', ['yt-automator', 'yt automator', 'youtube', 'yt_automator']),
+    ('escala', ['escala']),
+    ('topbar', ['header', 'topbar', 'brand', 'mission control', 'titulo', 'título', 'métrica', 'metric', 'númer', 'numero', 'contagem', 'count']),
+    ('board', ['kanban', 'board', 'coluna', 'inbox', 'assigned', 'review', 'done', 'fluxo']),
+    ('live', ['live', 'histórico', 'historico', 'timeline', 'trajeto', 'evidência', 'evidence', 'proof']),
+    ('agents', ['agente', 'agents', 'jarvis', 'wanda', 'thanos', 'alfred', 'oráculo', 'oraculo', 'modelo', 'config']),
+    ('broadcast', ['broadcast', 'comando', 'comandos', 'command']),
+    ('backend', ['api', 'backend', 'server', 'endpoint', 'app_server.py']),
+]
+# Every keyword group of a kind rule must match.
+MISSION_KIND_RULES = [
+    ('remove_sitegpt_badge', [['sitegpt'], ['remova', 'remove']]),
+    ('header_brand_icon', [['header', 'mission control'], ['icone', 'ícone', 'icon']]),
+    ('live_tracking_center_plan', [['sessão live', 'sessao live', 'live panel', 'trackeamento', 'tracking'], ['dashboard', 'task', 'tarefa']]),
+    ('header_real_numbers', [['header'], ['numero', 'número']]),
+    ('agent_chat_toggle', [['chat'], ['agente']]),
+    ('infinite_reading', [['tela infinita', 'scroll infinito'], ['doc', 'bloco']]),
+    ('dashboard_infinite_scroll', [['tela infinita', 'scroll infinito']]),
+    ('infinite_reading', [['infinita'], ['leitura']]),
+]
+OWNER_RULES = [
+    ('Thanos', ['api', 'backend', 'deploy', 'infra', 'server', 'banco', 'db', 'código', 'code', 'integra']),
+    ('Wanda', ['ui', 'ux', 'frontend', 'front', 'layout', 'página', 'design', 'landing', 'tela', 'header', 'visual', 'icone', 'ícone']),
+    ('Alfred', ['auditoria', 'auditar', 'gargalo', 'dependên', 'distribui', 'fluxo', 'handoff']),
+]
+# (axis, goal counts too, tiers): the first matching tier of each rule adds its points.
+INGEST_SCORE_RULES = [
+    ('revenue', True, [(2, ['venda', 'convers', 'oferta', 'ticket', 'ltv', 'mrr', 'receita', 'monet'])]),
+    ('revenue', False, [(1, ['funnel', 'landing', 'copy', 'pricing', 'upsell'])]),
+    ('autonomy', True, [(2, ['autom', 'workflow', 'agent', 'deleg', 'orquestr', 'autonom'])]),
+    ('autonomy', False, [(1, ['integra', 'api', 'pipeline', 'cron'])]),
+    ('urgency', False, [(2, ['hoje', 'agora', 'urgente', 'bloqueio', 'erro', 'queda']), (1, ['esta semana', 'sprint', 'prioridade'])]),
+]
+
+
+def _trie_regex(words):
+    """Alternation of `words` nested as a trie (shared prefixes are tried once)."""
+    trie = {}
+    for w in words:
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def walk(node):
+        alts = [re.escape(ch) + walk(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ''
+        body = alts[0] if len(alts) == 1 else '(?:' + '|'.join(alts) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    return walk(trie)
+
+
+def _compile_classifier():
+    """One regex for the single-word keywords, plus the rules as bit masks over keyword groups."""
+    groups = []  # keyword lists; group i is bit 1 << i
+
+    def bit(kws):
+        groups.append(kws)
+        return 1 << (len(groups) - 1)
+
+    compiled = {
+        'area': [(label, bit(kws)) for label, kws in CONTEXT_AREA_RULES],
+        'owner': [(label, bit(kws)) for label, kws in OWNER_RULES],
+        'kind': [(label, sum(bit(g) for g in gs)) for label, gs in MISSION_KIND_RULES],
+        'score': [(axis, with_goal, [(p, bit(kws)) for p, kws in tiers]) for axis, with_goal, tiers in INGEST_SCORE_RULES],
+    }
+    words = {w for kws in groups for w in kws}
+    masks = {w: sum(1 << i for i, kws in enumerate(groups) if w in kws) for w in words}
+    # The lookahead reports the longest keyword starting at each position; the keywords that
+    # are prefixes of it start there too, so its mask includes theirs.
+    compiled['masks'] = {w: functools.reduce(operator.or_, (masks[k] for k in words if w.startswith(k))) for w in words}
+    compiled['spaced'] = sorted(w for w in words if len(w.split()) > 1)
+    compiled['regex'] = re.compile(f'(?=({_trie_regex(words - set(compiled["spaced"]))}))')
+    return compiled
 
 
-def compute_ingest_score(text: str, goal: str = ''):
-    t = (text or '').lower()
-    g = (goal or '').lower()
+_CLASSIFIER = _compile_classifier()
+
+
+@functools.lru_cache(maxsize=4096)
+def _word_mask(word):
+    masks = _CLASSIFIER['masks']
+    return functools.reduce(operator.or_, (masks[kw] for kw in _CLASSIFIER['regex'].findall(word)), 0)
 
-    revenue = 2
-    autonomy = 2
-    urgency = 2
 
-    if any(k in t or k in g for k in ['venda', 'convers', 'oferta', 'ticket', 'ltv', 'mrr', 'receita', 'monet']):
-        revenue += 2
-    if any(k in t for k in ['funnel', 'landing', 'copy', 'pricing', 'upsell']):
-        revenue += 1
+@functools.lru_cache(maxsize=512)
+def keyword_mask(text):
+    """Bit mask of the keyword groups occurring in `text`.
 
-    if any(k in t or k in g for k in ['autom', 'workflow', 'agent', 'deleg', 'orquestr', 'autonom']):
-        autonomy += 2
-    if any(k in t for k in ['integra', 'api', 'pipeline', 'cron']):
-        autonomy += 1
+    A keyword without whitespace always lies inside one word, so the text is matched word by
+    word through the _word_mask() cache (triage texts share most of their vocabulary); the few
+    keywords with a space are looked up in the whole text. Cached: mission creation asks for
+    kind, owner and area of the same title + desc."""
+    text = (text or '').lower()
+    mask = 0
+    for word in text.split():
+        mask |= _word_mask(word)
+    for kw in _CLASSIFIER['spaced']:
+        if kw in text:
+            mask |= _CLASSIFIER['masks'][kw]
+    return mask
 
-    if any(k in t for k in ['hoje', 'agora', 'urgente', 'bloqueio', 'erro', 'queda']):
-        urgency += 2
-    elif any(k in t for k in ['esta semana', 'sprint', 'prioridade']):
-        urgency += 1
 
-    revenue = max(1, min(5, revenue))
-    autonomy = max(1, min(5, autonomy))
-    urgency = max(1, min(5, urgency))
-    total = revenue + autonomy + urgency
-    return revenue, autonomy, urgency, total
+def _first_rule(table, mask, default):
+    return next((label for label, need in _CLASSIFIER[table] if mask & need), default)
+
+
+def _mission_kind(mask):
+    return next((kind for kind, need in _CLASSIFIER['kind'] if mask & need == need), 'manual_required')
+
+
+def _ingest_scores(mask, goal_mask=0):
+    points = {'revenue': 2, 'autonomy': 2, 'urgency': 2}
+    for axis, with_goal, tiers in _CLASSIFIER['score']:
+        hits = mask | goal_mask if with_goal else mask
+        for add, need in tiers:
+            if hits & need:
+                points[axis] += add
+                break
+    revenue, autonomy, urgency = (max(1, min(5, points[axis])) for axis in ('revenue', 'autonomy', 'urgency'))
+    return revenue, autonomy, urgency, revenue + autonomy + urgency
+
+
+def classify_text(text, goal=''):
+    """All routing signals for `text` from a single match pass: area, kind, owner and ingest scores."""
+    mask = keyword_mask(text)
+    revenue, autonomy, urgency, total = _ingest_scores(mask, keyword_mask(goal) if goal else 0)
+    return {
+        'area': _first_rule('area', mask, 'general'),
+        'kind': _mission_kind(mask),
+        'owner': _first_rule('owner', mask, 'Alfred'),
+        'impactRevenue': revenue,
+        'impactAutonomy': autonomy,
+        'urgency': urgency,
+        'priorityScore': total,
+    }
+
+
+def infer_context_area(text: str):
+    return _first_rule('area', keyword_mask(text), 'general')
+
+
+def compute_ingest_score(text: str, goal: str = ''):
+    return _ingest_scores(keyword_mask(text), keyword_mask(goal) if goal else 0)
 
 
 def _tree(root: Path, max_entries: int = 80):
@@ -260,7 +413,7 @@ def mission_openclaw_text(mission):
 
     # Build a context pack to help inference on short requests.
     try:
-        data = load_data()
+        data = read_data(segments=())
     except Exception:
         data = {}
     # If user specified a project tag, prefer it.
@@ -602,7 +755,669 @@ def migrate_monarca_columns(data):
     legacy['items'] = []
 
 
-def load_data():
+_USE_ORJSON = orjson is not None and SERIALIZER in ('auto', 'orjson', 'msgpack')
+# Decoding the string-heavy boards with orjson measured no faster than the stdlib
+# (scripts/bench_serializer.py), so "auto" only uses it to encode.
+_ORJSON_DECODE = orjson is not None and SERIALIZER == 'orjson'
+_STATE_MSGPACK = msgpack is not None and SERIALIZER == 'msgpack'
+
+
+def dumps_json(obj):
+    """Compact UTF-8 JSON bytes."""
+    if _USE_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits: stdlib handles them
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def loads_json(raw):
+    if _ORJSON_DECODE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def encode_state(obj):
+    """On-disk encoding of state files (board snapshot, history segments)."""
+    if _STATE_MSGPACK:
+        return msgpack.packb(obj, use_bin_type=True)
+    return dumps_json(obj)
+
+
+def decode_state(raw):
+    """Decode a state file in any supported format (JSON, pretty or compact, or MessagePack)."""
+    head = raw.lstrip()[:1]
+    if head in (b'{', b'[') or not head:
+        return loads_json(raw)
+    if msgpack is None:
+        raise ValueError('state file is MessagePack but msgpack is not installed')
+    return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+
+
+# Row model shared by the storage engines: the dashboard state is split into keyed rows
+# (one per mission, audit event, run, approval...) so a mutation only rewrites what changed.
+STATE_TABLES = (
+    'meta',
+    'columns',
+    'missions',
+    'audit_trail',
+    'mission_runs',
+    'run_order',
+    'approvals',
+    'radar',
+    'radar_signals',
+    'transition_keys',
+)
+# The board itself: small, needed by almost every request.
+HOT_TABLES = ('meta', 'columns', 'missions')
+# Cold history (state key -> row tables). Stored apart from the board and only loaded
+# when an endpoint asks for it (see read_data(segments=...)).
+HISTORY_SEGMENTS = {
+    'auditTrail': ('audit_trail',),
+    'missionRuns': ('mission_runs', 'run_order'),
+    'approvals': ('approvals',),
+    'transitionKeys': ('transition_keys',),
+    'externalRadar': ('radar', 'radar_signals'),
+}
+ALL_SEGMENTS = tuple(HISTORY_SEGMENTS)
+# Rows that are never edited after being written (only appended/trimmed).
+IMMUTABLE_TABLES = ('audit_trail', 'approvals', 'transition_keys')
+ROW_COLLECTION_KEYS = ('columns',) + ALL_SEGMENTS
+# Rebuilt on load, never persisted.
+DERIVED_STATE_KEYS = ('missionIndex', 'titleIndex', 'columnIndex', 'auditIndex', 'runIndex', 'dirtyMissions')
+# Derived index that travels with its history segment.
+SEGMENT_INDEX_KEYS = {'auditTrail': 'auditIndex', 'missionRuns': 'runIndex'}
+# Segments a handler loads for record_transition() / upsert_mission_run().
+TRANSITION_SEGMENTS = ('auditTrail', 'transitionKeys')
+RUN_SEGMENTS = ('missionRuns',)
+# Segments made only of IMMUTABLE_TABLES rows: private copies share the rows.
+SHARED_ROW_SEGMENTS = tuple(name for name, tables in HISTORY_SEGMENTS.items() if set(tables) <= set(IMMUTABLE_TABLES))
+
+
+def empty_segment(name):
+    if name == 'externalRadar':
+        return {'signals': [], 'updatedAt': 0}
+    if name in ('missionRuns', 'transitionKeys'):
+        return {}
+    return []
+
+
+def stored_segment(name, value):
+    """A history segment as it is written/exported: run rings become newest-first lists."""
+    if name == 'missionRuns' and isinstance(value, dict):
+        return {mid: list(iter_runs(ring)) for mid, ring in value.items()}
+    return value
+
+
+def _row_key(obj, fallback):
+    key = str((obj or {}).get('id') or '').strip() if isinstance(obj, dict) else ''
+    if key:
+        return key
+    raw = json.dumps(obj, ensure_ascii=False, sort_keys=True, default=str)
+    return f"{fallback}_{hashlib.sha1(raw.encode('utf-8')).hexdigest()[:12]}"
+
+
+def _row_text(value):
+    return dumps_json(value).decode('utf-8')
+
+
+def state_tables(data):
+    """Row tables covered by `data`: the board plus the history segments it holds."""
+    tables = list(HOT_TABLES)
+    for name, seg_tables in HISTORY_SEGMENTS.items():
+        if name in data:
+            tables.extend(seg_tables)
+    return tables
+
+
+def state_to_rows(data):
+    """Split the dashboard state into {table: {key: value}} rows (dict order = row order).
+
+    Only the history segments present in `data` get their tables."""
+    rows = {t: {} for t in state_tables(data)}
+
+    for k, v in data.items():
+        if k not in ROW_COLLECTION_KEYS and k not in DERIVED_STATE_KEYS:
+            rows['meta'][k] = v
+
+    for pos, col in enumerate(data.get('columns') or []):
+        mission_ids = []
+        for m in (col.get('items') or []):
+            mid = ensure_mission_id(m)
+            rows['missions'].setdefault(mid, m)
+            mission_ids.append(mid)
+        rows['columns'][str(pos)] = {'name': col.get('name', ''), 'missionIds': mission_ids}
+
+    if 'audit_trail' in rows:
+        for e in (data.get('auditTrail') or []):
+            rows['audit_trail'][_row_key(e, 'tr')] = e
+
+    runs_by_mission = data.get('missionRuns')
+    if 'mission_runs' in rows and isinstance(runs_by_mission, dict):
+        for mid, runs in runs_by_mission.items():
+            if not isinstance(runs, (list, dict)):
+                continue
+            run_ids = []
+            for r in iter_runs(runs):
+                if not isinstance(r, dict):
+                    continue
+                rid = _row_key(r, 'run')
+                rows['mission_runs'][f"{mid}/{rid}"] = r
+                run_ids.append(rid)
+            rows['run_order'][str(mid)] = run_ids
+
+    if 'approvals' in rows:
+        for a in (data.get('approvals') or []):
+            rows['approvals'][_row_key(a, 'apr')] = a
+
+    keys = data.get('transitionKeys')
+    if 'transition_keys' in rows and isinstance(keys, dict):
+        rows['transition_keys'].update(keys)
+
+    radar = data.get('externalRadar')
+    if 'radar' in rows and isinstance(radar, dict):
+        header = {k: v for k, v in radar.items() if k != 'signals'}
+        signal_ids = []
+        for s in (radar.get('signals') or []):
+            sid = _row_key(s, 'sig')
+            rows['radar_signals'][sid] = s
+            signal_ids.append(sid)
+        header['signalIds'] = signal_ids
+        rows['radar']['externalRadar'] = header
+
+    return rows
+
+
+def rows_to_state(rows):
+    """Inverse of state_to_rows(): rebuild the dashboard JSON shape for the tables in `rows`."""
+    data = dict(rows.get('meta') or {})
+    # Before the history split the radar header was kept among the meta rows.
+    legacy_radar = data.pop('externalRadar', None)
+
+    if 'columns' in rows:
+        missions = rows.get('missions') or {}
+        columns = []
+        for key in sorted(rows['columns'], key=lambda x: int(x)):
+            col = rows['columns'][key]
+            columns.append({
+                'name': col.get('name', ''),
+                'items': [missions[mid] for mid in (col.get('missionIds') or []) if mid in missions],
+            })
+        data['columns'] = columns
+
+    if 'audit_trail' in rows:
+        data['auditTrail'] = list(rows['audit_trail'].values())
+
+    if 'mission_runs' in rows:
+        runs = rows['mission_runs']
+        data['missionRuns'] = {
+            mid: [runs[f"{mid}/{rid}"] for rid in run_ids if f"{mid}/{rid}" in runs]
+            for mid, run_ids in (rows.get('run_order') or {}).items()
+        }
+
+    if 'approvals' in rows:
+        data['approvals'] = list(rows['approvals'].values())
+
+    if 'transition_keys' in rows:
+        data['transitionKeys'] = dict(rows['transition_keys'])
+
+    if 'radar' in rows:
+        radar = dict(rows['radar'].get('externalRadar') or legacy_radar or {'updatedAt': 0})
+        signals = rows.get('radar_signals') or {}
+        signal_ids = radar.pop('signalIds', None)
+        if signal_ids is None:
+            signal_ids = list(signals)
+        radar['signals'] = [signals[sid] for sid in signal_ids if sid in signals]
+        data['externalRadar'] = radar
+    return data
+
+
+def fingerprint_rows(rows):
+    """Fingerprints of freshly read rows (immutable rows only need their key)."""
+    out = {}
+    for t, table_rows in rows.items():
+        if t in IMMUTABLE_TABLES:
+            out[t] = dict.fromkeys(table_rows, True)
+        else:
+            out[t] = {key: _row_text(value) for key, value in table_rows.items()}
+    return out
+
+
+def diff_rows(prev, rows):
+    """Compare rows against the last persisted fingerprints, for the tables present in `rows`.
+
+    Returns (ops, fingerprints) where ops is a list of (table, key, text, value);
+    text/value are None for deletions."""
+    ops = []
+    fingerprints = {}
+    for t, table_rows in rows.items():
+        old = prev.get(t) or {}
+        immutable = t in IMMUTABLE_TABLES
+        cur = {}
+        for key, value in table_rows.items():
+            if immutable and key in old:
+                cur[key] = True
+                continue
+            text = _row_text(value)
+            cur[key] = True if immutable else text
+            if old.get(key) != cur[key]:
+                ops.append((t, key, text, value))
+        for key in old:
+            if key not in cur:
+                ops.append((t, key, None, None))
+        fingerprints[t] = cur
+    return ops, fingerprints
+
+
+# Fingerprints of the rows as last read from / written to storage, per table. A table is
+# absent until its segment has been loaded, so unloaded history is never diffed or rewritten.
+_FINGERPRINTS = {}
+
+
+def segments_of_tables(tables):
+    return [name for name, seg_tables in HISTORY_SEGMENTS.items() if any(t in tables for t in seg_tables)]
+
+
+# --- SQLite (WAL) engine --------------------------------------------------------------
+
+_DB = {'conn': None, 'seq': 0}
+_DB_LOCK = threading.RLock()
+
+
+def _sqlite_extra_columns(table, key, value):
+    if table == 'audit_trail':
+        v = value or {}
+        return {'mission_id': str(v.get('missionId') or '').strip(), 'ts': int(v.get('timestamp') or 0)}
+    if table == 'mission_runs':
+        return {'mission_id': key.split('/', 1)[0]}
+    return {}
+
+
+def sqlite_connect():
+    with _DB_LOCK:
+        if _DB['conn'] is not None:
+            return _DB['conn']
+        conn = sqlite3.connect(str(DATA_DB_FILE), timeout=10, check_same_thread=False, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        for t in STATE_TABLES:
+            extra = ''
+            if t == 'audit_trail':
+                extra = ', mission_id TEXT, ts INTEGER'
+            elif t == 'mission_runs':
+                extra = ', mission_id TEXT'
+            conn.execute(f'CREATE TABLE IF NOT EXISTS {t} (key TEXT PRIMARY KEY, seq INTEGER NOT NULL, body TEXT NOT NULL{extra})')
+        conn.execute('CREATE INDEX IF NOT EXISTS audit_trail_mission ON audit_trail (mission_id, ts)')
+        conn.execute('CREATE INDEX IF NOT EXISTS mission_runs_mission ON mission_runs (mission_id)')
+        seq = 0
+        for t in STATE_TABLES:
+            seq = max(seq, int(conn.execute(f'SELECT COALESCE(MAX(seq), 0) FROM {t}').fetchone()[0]))
+        _DB['conn'] = conn
+        _DB['seq'] = seq
+        return conn
+
+
+def sqlite_read_rows(tables=STATE_TABLES):
+    """Read the given tables and record their fingerprints."""
+    with _DB_LOCK:
+        conn = sqlite_connect()
+        rows = {}
+        for t in tables:
+            rows[t] = {}
+            fingerprints = {}
+            immutable = t in IMMUTABLE_TABLES
+            for key, body in conn.execute(f'SELECT key, body FROM {t} ORDER BY seq'):
+                rows[t][key] = loads_json(body)
+                fingerprints[key] = True if immutable else body
+            _FINGERPRINTS[t] = fingerprints
+        return rows
+
+
+def sqlite_apply_ops(ops):
+    """Write row-level changes in one transaction. Only changed rows are touched."""
+    if not ops:
+        return 0
+    with _DB_LOCK:
+        conn = sqlite_connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            for table, key, text, value in ops:
+                if text is None:
+                    conn.execute(f'DELETE FROM {table} WHERE key = ?', (key,))
+                    continue
+                _DB['seq'] += 1
+                cols = {'key': key, 'seq': _DB['seq'], 'body': text, **_sqlite_extra_columns(table, key, value)}
+                names = ', '.join(cols)
+                marks = ', '.join('?' for _ in cols)
+                updates = ', '.join(f'{c} = excluded.{c}' for c in cols if c not in ('key', 'seq'))
+                conn.execute(
+                    f'INSERT INTO {table} ({names}) VALUES ({marks}) ON CONFLICT(key) DO UPDATE SET {updates}',
+                    tuple(cols.values()),
+                )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+    return len(ops)
+
+
+def sqlite_save_state(data):
+    with _DB_LOCK:
+        rows = state_to_rows(data)
+        missing = [t for t in rows if t not in _FINGERPRINTS]
+        if missing:
+            sqlite_read_rows(missing)
+        ops, fingerprints = diff_rows(_FINGERPRINTS, rows)
+        sqlite_apply_ops(ops)
+        _FINGERPRINTS.update(fingerprints)
+        return len(ops)
+
+
+def read_import_state(path):
+    """A data.json file (and its segments) as a full state for the SQLite backend.
+
+    A split board file (no history embedded) without its data.segments/ directory is refused
+    rather than imported with an empty history."""
+    path = Path(path)
+    data = read_json_state(path)
+    missing = [name for name in ALL_SEGMENTS if name not in data]
+    segments_dir = segment_file(ALL_SEGMENTS[0], path).parent
+    if missing and len(missing) == len(ALL_SEGMENTS) and not segments_dir.is_dir():
+        raise ValueError(f'{path} has no history and {segments_dir} is missing; copy the segments next to it first')
+    for name in missing:
+        data[name] = empty_segment(name)
+    return data
+
+
+def sqlite_import_json(path=None):
+    """One-shot import of a data.json file into data.db (replaces the stored state)."""
+    written = sqlite_save_state(read_import_state(path or DATA_FILE))
+    invalidate_state_cache()
+    return written
+
+
+def sqlite_export_json(path=None):
+    """Export data.db back to the dashboard JSON shape (history included, single file)."""
+    path = Path(path or DATA_FILE)
+    with _DB_LOCK:
+        data = rows_to_state(sqlite_read_rows())
+    path.write_bytes(dumps_json(data))
+    return data
+
+
+def sqlite_load_state():
+    with _DB_LOCK:
+        rows = sqlite_read_rows(HOT_TABLES)
+        if not rows['meta'] and not rows['columns']:
+            # Fresh database: seed from the JSON state (or the sample) once.
+            source = DATA_FILE if DATA_FILE.exists() else DATA_SEED_FILE
+            if source.exists():
+                try:
+                    sqlite_save_state(read_import_state(source))
+                    rows = sqlite_read_rows(HOT_TABLES)
+                except Exception as e:
+                    print(f'[sqlite] not seeded from {source}: {e}')
+        if not rows['meta'] and not rows['columns']:
+            return None
+        return rows_to_state(rows)
+
+
+def sqlite_load_segment(name):
+    with _DB_LOCK:
+        rows = sqlite_read_rows(HISTORY_SEGMENTS[name])
+        if name == 'externalRadar' and not rows['radar']:
+            legacy = sqlite_connect().execute("SELECT body FROM meta WHERE key = 'externalRadar'").fetchone()
+            if legacy:
+                rows['radar']['externalRadar'] = loads_json(legacy[0])
+        return rows_to_state(rows)[name]
+
+
+# --- JSON engine (hot board file + one file per history segment) ------------------------
+
+DATA_SEGMENTS_DIR = BASE / 'data.segments'
+# Segments still embedded in the hot file (layout from before the split); the next write
+# moves them to their own files.
+_JSON = {'embedded': set()}
+
+
+def segment_file(name, base=None):
+    base = Path(base or DATA_FILE)
+    return base.with_name(f'{base.stem}.segments') / f'{name}.json'
+
+
+def read_segment_file(name):
+    path = segment_file(name)
+    if not path.exists():
+        return empty_segment(name)
+    try:
+        return decode_state(path.read_bytes())
+    except Exception:
+        return empty_segment(name)
+
+
+def read_json_state(path):
+    """Read a JSON state file plus the segment files next to it."""
+    path = Path(path)
+    data = decode_state(path.read_bytes())
+    data.pop('journalSeq', None)
+    for name in ALL_SEGMENTS:
+        seg = segment_file(name, path)
+        if name not in data and seg.exists():
+            data[name] = decode_state(seg.read_bytes())
+    return data
+
+
+def json_load_state():
+    data = read_state_file()
+    if not isinstance(data, dict):
+        return data
+    data.pop('journalSeq', None)
+    _JSON['embedded'] = {name for name in ALL_SEGMENTS if name in data}
+    fingerprints = fingerprint_rows(state_to_rows(data))
+    for t in HISTORY_SEGMENTS.values():
+        for table in t:
+            fingerprints.pop(table, None)
+    _FINGERPRINTS.clear()
+    _FINGERPRINTS.update(fingerprints)
+    return data
+
+
+def json_load_segment(name):
+    value = read_segment_file(name)
+    _FINGERPRINTS.update(fingerprint_rows({t: r for t, r in state_to_rows({name: value}).items() if t in HISTORY_SEGMENTS[name]}))
+    return value
+
+
+def write_json_files(data, segments, snapshot_extra=None):
+    """Write the given segment files, then the hot board file (without the history)."""
+    for name in segments:
+        path = segment_file(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(path, encode_state(stored_segment(name, data[name])))
+    hot = {k: v for k, v in data.items() if k not in HISTORY_SEGMENTS and k not in DERIVED_STATE_KEYS}
+    if snapshot_extra:
+        hot.update(snapshot_extra)
+    atomic_write_bytes(DATA_FILE, encode_state(hot))
+    _JSON['embedded'] = set()
+
+
+def json_save_state(data):
+    ops, fingerprints = diff_rows(_FINGERPRINTS, state_to_rows(data))
+    touched = {op[0] for op in ops}
+    segments = [name for name in segments_of_tables(touched) if name in data]
+    segments += [name for name in _JSON['embedded'] if name in data and name not in segments]
+    if segments or _JSON['embedded'] or any(t in touched for t in HOT_TABLES):
+        write_json_files(data, segments)
+    _FINGERPRINTS.update(fingerprints)
+    return len(ops)
+
+
+# --- Journal engine (snapshot + append-only mutation log) --------------------------------
+
+_JOURNAL = {
+    'state': None,
+    'seq': 0,
+    'snapshotSeq': 0,
+    'dirtySegments': set(),
+    'entries': 0,
+    'bytes': 0,
+    'compactions': 0,
+    'lastCompactionAt': 0,
+}
+_JOURNAL_COMPACT = threading.Event()
+_JOURNAL_COMPACTOR = {'thread': None}
+
+
+def _journal_entries(truncate_torn=False):
+    """Yield the complete journal entries; a torn last line (crash mid-append) ends the scan."""
+    if not DATA_JOURNAL_FILE.exists():
+        return
+    good_offset = 0
+    with open(DATA_JOURNAL_FILE, 'rb') as f:
+        for raw in f:
+            if not raw.endswith(b'\n'):
+                break
+            try:
+                entry = loads_json(raw)
+            except Exception:
+                break
+            good_offset += len(raw)
+            yield entry, len(raw)
+    if truncate_torn and good_offset < DATA_JOURNAL_FILE.stat().st_size:
+        with open(DATA_JOURNAL_FILE, 'r+b') as f:
+            f.truncate(good_offset)
+
+
+def _journal_apply(rows, entry):
+    for table, key, value in entry.get('ops') or []:
+        if table == 'meta' and key == 'externalRadar':
+            table = 'radar'  # entries written before the history split
+        if table not in rows:
+            continue
+        if value is None:
+            rows[table].pop(key, None)
+        else:
+            rows[table][key] = value
+
+
+def journal_replay(snapshot):
+    """Rebuild the board (and any history embedded in the snapshot) from the snapshot plus
+    the journal tail. History kept in segment files is replayed by journal_load_segment()."""
+    snapshot_seq = int(snapshot.pop('journalSeq', 0) or 0) if isinstance(snapshot, dict) else 0
+    _JSON['embedded'] = {name for name in ALL_SEGMENTS if name in (snapshot or {})}
+    rows = state_to_rows(snapshot) if snapshot is not None else {t: {} for t in HOT_TABLES}
+    seq = snapshot_seq
+    entries = 0
+    size = 0
+    for entry, length in _journal_entries(truncate_torn=True):
+        entries += 1
+        size += length
+        if int(entry.get('seq') or 0) <= snapshot_seq:
+            continue
+        _journal_apply(rows, entry)
+        seq = max(seq, int(entry.get('seq') or 0))
+
+    _FINGERPRINTS.clear()
+    _FINGERPRINTS.update(fingerprint_rows(rows))
+    _JOURNAL['seq'] = seq
+    _JOURNAL['snapshotSeq'] = snapshot_seq
+    _JOURNAL['dirtySegments'] = set()
+    _JOURNAL['entries'] = entries
+    _JOURNAL['bytes'] = size
+    if snapshot is None and not entries:
+        _JOURNAL['state'] = None
+        return None
+    data = rows_to_state(rows)
+    _JOURNAL['state'] = data
+    return data
+
+
+def journal_load_segment(name):
+    rows = {t: r for t, r in state_to_rows({name: read_segment_file(name)}).items() if t in HISTORY_SEGMENTS[name]}
+    for entry, _ in _journal_entries():
+        if int(entry.get('seq') or 0) > _JOURNAL['snapshotSeq']:
+            _journal_apply(rows, entry)
+    _FINGERPRINTS.update(fingerprint_rows(rows))
+    return rows_to_state(rows)[name]
+
+
+def journal_append(data, sources=()):
+    """Append only the rows that changed since the last entry (O(change) bytes on disk)."""
+    ops, fingerprints = diff_rows(_FINGERPRINTS, state_to_rows(data))
+    _JOURNAL['state'] = data
+    if not ops:
+        return 0
+    seq = _JOURNAL['seq'] + 1
+    parts = []
+    for table, key, text, _ in ops:
+        parts.append('[' + _row_text(table) + ',' + _row_text(key) + ',' + (text if text is not None else 'null') + ']')
+    line = (
+        '{"seq":' + str(seq)
+        + ',"at":' + str(now_ms())
+        + ',"sources":' + _row_text(list(sources))
+        + ',"ops":[' + ','.join(parts) + ']}\n'
+    ).encode('utf-8')
+    with open(DATA_JOURNAL_FILE, 'ab') as f:
+        f.write(line)
+        f.flush()
+        os.fsync(f.fileno())
+    _FINGERPRINTS.update(fingerprints)
+    _JOURNAL['dirtySegments'].update(segments_of_tables({op[0] for op in ops}))
+    _JOURNAL['seq'] = seq
+    _JOURNAL['entries'] += 1
+    _JOURNAL['bytes'] += len(line)
+    if _JOURNAL['entries'] >= JOURNAL_MAX_ENTRIES or _JOURNAL['bytes'] >= JOURNAL_MAX_BYTES:
+        start_journal_compactor()
+        _JOURNAL_COMPACT.set()
+    return len(ops)
+
+
+def journal_compact():
+    """Write a fresh snapshot (board + changed segments) of the last journaled state and truncate the journal."""
+    with _WRITE_LOCK:
+        data = _JOURNAL['state']
+        if data is None or not _JOURNAL['entries']:
+            return False
+        segments = _JOURNAL['dirtySegments'] | _JSON['embedded']
+        missing = {name: journal_load_segment(name) for name in segments if name not in data}
+        if missing:
+            data = {**data, **missing}
+        write_json_files(data, sorted(segments), {'journalSeq': _JOURNAL['seq']})
+        with open(DATA_JOURNAL_FILE, 'wb') as f:
+            f.flush()
+            os.fsync(f.fileno())
+        _JOURNAL['snapshotSeq'] = _JOURNAL['seq']
+        _JOURNAL['dirtySegments'] = set()
+        _JOURNAL['entries'] = 0
+        _JOURNAL['bytes'] = 0
+        _JOURNAL['compactions'] += 1
+        _JOURNAL['lastCompactionAt'] = now_ms()
+        with _STATE_LOCK:
+            if not _WRITER['dirty']:
+                _STATE['signature'] = _storage_signature()
+        return True
+
+
+def _journal_compactor():
+    while True:
+        _JOURNAL_COMPACT.wait()
+        _JOURNAL_COMPACT.clear()
+        try:
+            journal_compact()
+        except Exception as e:
+            print(f'[journal] compaction failed: {e}')
+
+
+def start_journal_compactor():
+    if _JOURNAL_COMPACTOR['thread'] is None:
+        t = threading.Thread(target=_journal_compactor, name='journal-compactor', daemon=True)
+        _JOURNAL_COMPACTOR['thread'] = t
+        t.start()
+    return _JOURNAL_COMPACTOR['thread']
+
+
+def read_state_file():
     # If no local state exists yet, optionally seed from a sample file (kept in repo).
     if not DATA_FILE.exists() and DATA_SEED_FILE.exists():
         try:
@@ -611,21 +1426,16 @@ def load_data():
             pass
 
     if not DATA_FILE.exists():
-        data = json.loads(json.dumps(DEFAULT_DATA))
-        remove_needs_clarification_column(data)
-        migrate_monarca_columns(data)
-        if not isinstance(data.get('missionRuns'), dict):
-            data['missionRuns'] = {}
-        return data
+        return None
 
     try:
-        data = json.loads(DATA_FILE.read_text(encoding='utf-8'))
+        return decode_state(DATA_FILE.read_bytes())
     except Exception:
-        data = json.loads(json.dumps(DEFAULT_DATA))
+        return default_state()
+
 
-    remove_needs_clarification_column(data)
-    migrate_monarca_columns(data)
-    # ensure new keys exist
+def backfill_state_keys(data):
+    """Ensure keys added after the first releases exist."""
     if not isinstance(data.get('missionRuns'), dict):
         data['missionRuns'] = {}
     if not isinstance(data.get('boardRules'), dict):
@@ -640,20 +1450,566 @@ def load_data():
         data['externalRadar'] = {'signals': [], 'updatedAt': 0}
     if not isinstance((data.get('externalRadar') or {}).get('signals'), list):
         data['externalRadar']['signals'] = []
-    return data
 
 
-def save_data(data):
-    DATA_FILE.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
+def drop_telemetry_cache(data):
+    """The telemetry sample no longer lives in the state (see _TELEMETRY)."""
+    data.pop('telemetryCache', None)
+
 
+def default_state():
+    data = json.loads(json.dumps(DEFAULT_DATA))
+    data['schemaVersion'] = SCHEMA_VERSION
+    return data
 
-def load_chat():
-    if not CHAT_FILE.exists():
-        return {'messages': []}
+
+def stored_schema_version(data):
     try:
-        return json.loads(CHAT_FILE.read_text(encoding='utf-8'))
+        return int(data.get('schemaVersion') or 0)
     except Exception:
-        return {'messages': []}
+        return 0
+
+
+def run_migrations(data):
+    """Apply pending migrations in order. Returns [{version, name, ms}] for the ones that ran."""
+    current = stored_schema_version(data)
+    applied = []
+    for version, name, fn in MIGRATIONS:
+        if version <= current:
+            continue
+        started = time.perf_counter()
+        fn(data)
+        data['schemaVersion'] = version
+        applied.append({'version': version, 'name': name, 'ms': round((time.perf_counter() - started) * 1000, 3)})
+    return applied
+
+
+def read_stored_state():
+    """Read the raw (unmigrated) board from the storage engine, or None if there is none.
+
+    History segments are not included unless the stored layout still embeds them."""
+    if STORAGE_BACKEND == 'sqlite':
+        return sqlite_load_state()
+    if STORAGE_BACKEND == 'journal':
+        return journal_replay(read_state_file())
+    return json_load_state()
+
+
+def read_stored_segment(name):
+    """Read one history segment (see HISTORY_SEGMENTS) from the storage engine."""
+    if STORAGE_BACKEND == 'sqlite':
+        return sqlite_load_segment(name)
+    if STORAGE_BACKEND == 'journal':
+        return journal_load_segment(name)
+    return json_load_segment(name)
+
+
+def read_stored_state_full():
+    data = read_stored_state()
+    if data is not None and stored_schema_version(data) < SCHEMA_VERSION:
+        # Migrations may touch any collection: bring the history in first.
+        for name in ALL_SEGMENTS:
+            if name not in data:
+                data[name] = read_stored_segment(name)
+    return data
+
+
+def load_state_uncached():
+    """Read the state from the storage engine (no caching), migrating it if it is behind."""
+    data = read_stored_state_full()
+    if data is None:
+        data = default_state()
+    else:
+        applied = run_migrations(data)
+        if applied:
+            write_state(data, ['migrate'])
+            for m in applied:
+                print(f"[migrate] v{m['version']} {m['name']}: {m['ms']} ms")
+    build_mission_index(data)
+    index_segments(data, [name for name in ALL_SEGMENTS if name in data])
+    return data
+
+
+def index_segments(data, names):
+    """Build the derived indexes of freshly loaded history segments."""
+    if 'auditTrail' in names:
+        build_audit_index(data)
+    if 'missionRuns' in names:
+        ring_mission_runs(data)
+        build_run_index(data)
+    if 'transitionKeys' in names:
+        order_transition_keys(data)
+
+
+def migrate_storage():
+    """CLI entry point (--migrate): bring the stored state to SCHEMA_VERSION."""
+    data = read_stored_state_full()
+    if data is None:
+        print('No stored state found; nothing to migrate.')
+        return []
+    before = stored_schema_version(data)
+    started = time.perf_counter()
+    applied = run_migrations(data)
+    for m in applied:
+        print(f"v{m['version']} {m['name']}: {m['ms']} ms")
+    if applied:
+        write_state(data, ['migrate'])
+        invalidate_state_cache()
+        print(f"Schema v{before} -> v{SCHEMA_VERSION} in {round((time.perf_counter() - started) * 1000, 3)} ms")
+    else:
+        print(f'Already at schema v{SCHEMA_VERSION}.')
+    return applied
+
+
+# Process-wide cache of the parsed + migrated state. It is reloaded only when the
+# storage signature (file mtime/size, or SQLite data_version) or the version changes.
+# History segments are added to it the first time a reader asks for them.
+# Every version also lands in a bounded log with the missions it changed (see
+# touch_missions()): (version, ids), ids None when unknown (a reload from storage, or a save
+# that did not say), so per-card views refresh only what moved.
+DIRTY_LOG_MAX = 1024
+_STATE = {'data': None, 'signature': None, 'version': 0, 'hits': 0, 'reloads': 0, 'segmentLoads': 0,
+          'dirty': collections.deque(maxlen=DIRTY_LOG_MAX)}
+_STATE_LOCK = threading.RLock()
+
+
+def _bump_version(ids=None):
+    _STATE['version'] += 1
+    _STATE['dirty'].append((_STATE['version'], ids))
+
+
+def touch_missions(data, *mission_ids):
+    """Note on a private copy (load_data()) which missions the next save_data() changes.
+
+    Called with no ids it records that no mission changed (settings, telemetry...)."""
+    dirty = data.setdefault('dirtyMissions', set())
+    dirty.update(mid for mid in (str(m or '').strip() for m in mission_ids) if mid)
+
+
+def dirty_missions_since(version):
+    """Ids of the missions changed after state `version`, or None when that is not known."""
+    with _STATE_LOCK:
+        if version == _STATE['version']:
+            return set()
+        log = _STATE['dirty']
+        if version is None or not log or log[0][0] > version + 1:
+            return None
+        changed = set()
+        for v, ids in log:
+            if v <= version:
+                continue
+            if ids is None:
+                return None
+            changed |= ids
+        return changed
+
+
+def _storage_signature():
+    if STORAGE_BACKEND == 'sqlite':
+        with _DB_LOCK:
+            return ('sqlite', sqlite_connect().execute('PRAGMA data_version').fetchone()[0])
+    sig = [STORAGE_BACKEND]
+    files = [DATA_FILE] + [segment_file(name) for name in ALL_SEGMENTS]
+    if STORAGE_BACKEND == 'journal':
+        files.append(DATA_JOURNAL_FILE)
+    for p in files:
+        try:
+            st = p.stat()
+            sig.extend([st.st_mtime_ns, st.st_size])
+        except FileNotFoundError:
+            sig.extend([None, None])
+    return tuple(sig)
+
+
+def _clone(obj):
+    if isinstance(obj, dict):
+        return {k: _clone(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_clone(v) for v in obj]
+    return obj
+
+
+def state_version():
+    return _STATE['version']
+
+
+# Strong validator of the state: the version counter is bumped by every save and reload, and
+# the boot id keeps versions of different server runs apart.
+_BOOT_ID = uuid.uuid4().hex[:8]
+
+
+def version_etag(version):
+    return f'"{_BOOT_ID}-{version}"'
+
+
+def state_etag():
+    """ETag of the current state without loading it, or None when storage changed under the cache."""
+    with _STATE_LOCK:
+        if _STATE['data'] is None:
+            return None
+        if not (_WRITER['dirty'] or _WRITER['inflight'] or _storage_signature() == _STATE['signature']):
+            return None
+        return version_etag(_STATE['version'])
+
+
+def read_data_tagged(segments=ALL_SEGMENTS):
+    """read_data() plus the ETag of exactly that state."""
+    with _STATE_LOCK:
+        data = read_data(segments)
+        return data, version_etag(_STATE['version'])
+
+
+def invalidate_state_cache():
+    with _STATE_LOCK:
+        _STATE['data'] = None
+        _bump_version()
+    if _WATCHDOG['thread'] is not None:
+        watchdog_notify()
+
+
+def read_data(segments=ALL_SEGMENTS):
+    """Return the cached canonical state with the given history segments loaded.
+
+    Shared object: callers must NOT mutate it."""
+    with _STATE_LOCK:
+        data = _STATE['data']
+        # Pending/in-flight writes make the cache newer than the storage: trust it.
+        if data is not None and (_WRITER['dirty'] or _WRITER['inflight'] or _storage_signature() == _STATE['signature']):
+            _STATE['hits'] += 1
+        else:
+            data = load_state_uncached()
+            _STATE['signature'] = _storage_signature()
+            _bump_version()
+            _STATE['reloads'] += 1
+
+        missing = [name for name in segments if name not in data]
+        if missing:
+            # New dict rather than in-place: a pending write may still hold the old one.
+            data = dict(data)
+            for name in missing:
+                data[name] = read_stored_segment(name)
+                _STATE['segmentLoads'] += 1
+            index_segments(data, missing)
+        _STATE['data'] = data
+        return data
+
+
+def _private_copy(key, value):
+    """Copy of one state entry that the caller may mutate.
+
+    Rows that are never edited (SHARED_ROW_SEGMENTS) are shared: only their container is
+    copied, and the audit index only down to its position lists."""
+    if key in SHARED_ROW_SEGMENTS and isinstance(value, (list, dict)):
+        return value.copy()
+    if key == 'auditIndex' and isinstance(value, dict):
+        return {**value, 'byMission': {mid: list(positions) for mid, positions in value['byMission'].items()}}
+    return _clone(value)
+
+
+def load_data(segments=ALL_SEGMENTS):
+    """Return a private (mutable) copy of the canonical state with the given history segments.
+
+    A handler loads only the segments it touches (segments=() for board-only changes); the
+    ones it skipped are carried over by save_data()."""
+    with _STATE_LOCK:
+        data = read_data(segments)
+        skipped = [name for name in ALL_SEGMENTS if name not in segments]
+        skipped += [SEGMENT_INDEX_KEYS[name] for name in skipped if name in SEGMENT_INDEX_KEYS]
+        return {k: _private_copy(k, v) for k, v in data.items() if k not in skipped}
+
+
+# Write-behind: save_data() updates the cache right away and the physical write is
+# coalesced with every other save landing within MC_WRITE_WINDOW_MS (0 = write through).
+WRITE_WINDOW_MS = max(0, int(os.getenv('MC_WRITE_WINDOW_MS') or 250))
+_WRITER = {
+    'dirty': False,
+    'inflight': False,
+    'timer': None,
+    'pendingSaves': 0,
+    'sources': [],
+    'saves': 0,
+    'writes': 0,
+    'coalesced': 0,
+    'lastWriteAt': 0,
+    'lastWriteMs': 0,
+}
+_WRITE_LOCK = threading.Lock()
+# Per-thread label of the mutation being handled (e.g. "POST /api/missions"), kept in the journal.
+_REQUEST_CONTEXT = threading.local()
+
+
+def atomic_write_bytes(path: Path, payload: bytes):
+    """temp file + fsync + rename, so readers never see a half-written file."""
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    try:
+        fd = os.open(str(path.parent), os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def write_state(data, sources=()):
+    """Physical write of the state to the configured storage engine."""
+    if STORAGE_BACKEND == 'sqlite':
+        sqlite_save_state(data)
+    elif STORAGE_BACKEND == 'journal':
+        journal_append(data, sources)
+    else:
+        json_save_state(data)
+
+
+def flush_data():
+    """Write any pending state now. Called on shutdown and by endpoints that must be durable."""
+    with _WRITE_LOCK:
+        with _STATE_LOCK:
+            timer = _WRITER['timer']
+            _WRITER['timer'] = None
+            if timer is not None:
+                timer.cancel()
+            if not _WRITER['dirty']:
+                return False
+            data = _STATE['data']
+            saves = _WRITER['pendingSaves']
+            sources = _WRITER['sources']
+            _WRITER['dirty'] = False
+            _WRITER['inflight'] = True
+            _WRITER['pendingSaves'] = 0
+            _WRITER['sources'] = []
+
+        started = time.perf_counter()
+        try:
+            write_state(data, sources)
+        except Exception:
+            with _STATE_LOCK:
+                _WRITER['inflight'] = False
+                _WRITER['dirty'] = True
+                _WRITER['pendingSaves'] += saves
+                _WRITER['sources'] = sources + _WRITER['sources']
+            raise
+
+        # Same critical section as clearing inflight: a reader in between would otherwise see
+        # our own write as an external change and reload.
+        with _STATE_LOCK:
+            _WRITER['inflight'] = False
+            _STATE['signature'] = _storage_signature()
+            _WRITER['writes'] += 1
+            _WRITER['coalesced'] += max(0, saves - 1)
+            _WRITER['lastWriteAt'] = now_ms()
+            _WRITER['lastWriteMs'] = round((time.perf_counter() - started) * 1000, 2)
+        return True
+
+
+def save_data(data, durable=False):
+    """Make `data` the canonical state (do not mutate it afterwards) and schedule its write.
+
+    History segments missing from `data` are carried over from the cache unchanged.
+    durable=True flushes before returning."""
+    dirty = data.pop('dirtyMissions', None)
+    with _STATE_LOCK:
+        previous = _STATE['data'] or {}
+        carried = {}
+        for name in ALL_SEGMENTS:
+            if name not in data and name in previous:
+                carried[name] = previous[name]
+                index_key = SEGMENT_INDEX_KEYS.get(name)
+                if index_key in previous:
+                    carried[index_key] = previous[index_key]
+        _STATE['data'] = {**data, **carried} if carried else data
+        _bump_version(frozenset(dirty) if dirty is not None else None)
+        _PUMP_WAKE.set()
+        _WRITER['saves'] += 1
+        _WRITER['pendingSaves'] += 1
+        _WRITER['dirty'] = True
+        source = getattr(_REQUEST_CONTEXT, 'source', None) or 'internal'
+        if source not in _WRITER['sources']:
+            _WRITER['sources'].append(source)
+        deferred = not durable and WRITE_WINDOW_MS > 0
+        if deferred and _WRITER['timer'] is None:
+            timer = threading.Timer(WRITE_WINDOW_MS / 1000.0, flush_data)
+            timer.daemon = True
+            _WRITER['timer'] = timer
+            timer.start()
+    if _SEARCH['version'] is not None:
+        # Outside _STATE_LOCK: the search index takes its own lock first.
+        search_sync()
+    if _WATCHDOG['thread'] is not None:
+        watchdog_notify()
+    if not deferred:
+        flush_data()
+
+
+def storage_stats():
+    with _STATE_LOCK:
+        return {
+            'backend': STORAGE_BACKEND,
+            'version': _STATE['version'],
+            'cache': {'hits': _STATE['hits'], 'reloads': _STATE['reloads']},
+            'segments': {
+                'loaded': [name for name in ALL_SEGMENTS if name in (_STATE['data'] or {})],
+                'loads': _STATE['segmentLoads'],
+            },
+            'writer': {
+                'windowMs': WRITE_WINDOW_MS,
+                'saves': _WRITER['saves'],
+                'physicalWrites': _WRITER['writes'],
+                'coalescedWrites': _WRITER['coalesced'],
+                'pending': _WRITER['dirty'],
+                'lastWriteAt': _WRITER['lastWriteAt'],
+                'lastWriteMs': _WRITER['lastWriteMs'],
+            },
+            'journal': {
+                'seq': _JOURNAL['seq'],
+                'entries': _JOURNAL['entries'],
+                'bytes': _JOURNAL['bytes'],
+                'compactions': _JOURNAL['compactions'],
+                'lastCompactionAt': _JOURNAL['lastCompactionAt'],
+            } if STORAGE_BACKEND == 'journal' else None,
+            'dashboard': {
+                'version': _DASHBOARD['version'],
+                'builds': _DASHBOARD['builds'],
+                'cardBuilds': _DASHBOARD['cardBuilds'],
+                'cardReuses': _DASHBOARD['cardReuses'],
+                'changeLog': len(_DASHBOARD['changes']),
+                'deltas': _DASHBOARD['deltas'],
+                'snapshots': _DASHBOARD['snapshots'],
+            },
+            'compression': compression_stats(),
+            'http': _HTTP['server'].http_stats() if _HTTP['server'] else None,
+            'events': {
+                'seq': _EVENTS['seq'],
+                'subscribers': _EVENTS['subscribers'],
+                'published': _EVENTS['published'],
+                'resyncs': _EVENTS['resyncs'],
+            },
+            'transitionKeys': {
+                'size': len((_STATE['data'] or {}).get('transitionKeys') or {}),
+                'loaded': 'transitionKeys' in (_STATE['data'] or {}),
+                'windowS': TRANSITION_DEDUPE_WINDOW_S,
+                'max': TRANSITION_DEDUPE_MAX,
+                **_DEDUPE,
+            },
+            'search': {
+                'docs': len(_SEARCH['docs']),
+                'tokens': len(_SEARCH['postings']),
+                'syncs': _SEARCH['syncs'],
+                'reindexed': _SEARCH['reindexed'],
+            },
+            'watchdog': {'pending': len(_WATCHDOG['heap']), 'wakeups': _WATCHDOG['wakeups'], 'failed': _WATCHDOG['failed']},
+        }
+
+
+# Chat is an append-only log (one JSON message per line, with a monotonically increasing
+# "seq"). The retained messages are also kept in memory so GET /api/chat?since=<seq> is a
+# bisect; a background compactor trims the log to CHAT_RETENTION messages.
+CHAT_RETENTION = max(1, int(os.getenv('MC_CHAT_RETENTION') or 5000))
+_CHAT = {'loaded': False, 'seq': 0, 'messages': [], 'seqs': [], 'lines': 0, 'compactions': 0}
+_CHAT_LOCK = threading.Lock()
+_CHAT_COMPACT = threading.Event()
+_CHAT_COMPACTOR = {'thread': None}
+
+
+def _load_chat_log():
+    if _CHAT['loaded']:
+        return
+    messages = []
+    if CHAT_LOG_FILE.exists():
+        with open(CHAT_LOG_FILE, 'rb') as f:
+            for raw in f:
+                try:
+                    msg = loads_json(raw)
+                except Exception:
+                    continue
+                if isinstance(msg, dict) and int(msg.get('seq') or 0) > 0:
+                    messages.append(msg)
+    elif CHAT_FILE.exists():
+        # One-time import of the old agent-chat.json (whole-file) format.
+        try:
+            legacy = decode_state(CHAT_FILE.read_bytes()).get('messages') or []
+        except Exception:
+            legacy = []
+        for i, msg in enumerate(m for m in legacy if isinstance(m, dict)):
+            messages.append({**msg, 'seq': i + 1})
+        atomic_write_bytes(CHAT_LOG_FILE, b''.join(dumps_json(m) + b'\n' for m in messages))
+        CHAT_FILE.unlink()
+    messages.sort(key=lambda m: int(m['seq']))
+    _CHAT['lines'] = len(messages)
+    _CHAT['messages'] = messages[-CHAT_RETENTION:]
+    _CHAT['seqs'] = [int(m['seq']) for m in _CHAT['messages']]
+    _CHAT['seq'] = _CHAT['seqs'][-1] if _CHAT['seqs'] else 0
+    _CHAT['loaded'] = True
+
+
+def load_chat(since=None, limit=300):
+    """Messages with seq > since (oldest first, at most `limit`); the latest `limit` when since is None."""
+    with _CHAT_LOCK:
+        _load_chat_log()
+        if since is None:
+            messages = _CHAT['messages'][-limit:]
+        else:
+            i = bisect.bisect_right(_CHAT['seqs'], since)
+            messages = _CHAT['messages'][i:i + limit]
+        return {'messages': list(messages), 'seq': _CHAT['seq']}
+
+
+def append_chat_message(msg):
+    """Assign the next seq and append the message to the log (no rewrite)."""
+    with _CHAT_LOCK:
+        _load_chat_log()
+        msg = {**msg, 'seq': _CHAT['seq'] + 1}
+        with open(CHAT_LOG_FILE, 'ab') as f:
+            f.write(dumps_json(msg) + b'\n')
+            f.flush()
+            os.fsync(f.fileno())
+        _CHAT['seq'] = msg['seq']
+        _CHAT['messages'].append(msg)
+        _CHAT['seqs'].append(msg['seq'])
+        _CHAT['lines'] += 1
+        if len(_CHAT['messages']) > CHAT_RETENTION:
+            del _CHAT['messages'][:-CHAT_RETENTION]
+            del _CHAT['seqs'][:-CHAT_RETENTION]
+        if _CHAT['lines'] > CHAT_RETENTION + max(100, CHAT_RETENTION // 4):
+            start_chat_compactor()
+            _CHAT_COMPACT.set()
+    publish_event('chat', msg)
+    return msg
+
+
+def chat_compact():
+    """Rewrite the log with only the retained messages."""
+    with _CHAT_LOCK:
+        if _CHAT['lines'] <= len(_CHAT['messages']):
+            return False
+        atomic_write_bytes(CHAT_LOG_FILE, b''.join(dumps_json(m) + b'\n' for m in _CHAT['messages']))
+        _CHAT['lines'] = len(_CHAT['messages'])
+        _CHAT['compactions'] += 1
+        return True
+
+
+def _chat_compactor():
+    while True:
+        _CHAT_COMPACT.wait()
+        _CHAT_COMPACT.clear()
+        try:
+            chat_compact()
+        except Exception as e:
+            print(f'[chat] compaction failed: {e}')
+
+
+def start_chat_compactor():
+    if _CHAT_COMPACTOR['thread'] is None:
+        t = threading.Thread(target=_chat_compactor, name='chat-compactor', daemon=True)
+        _CHAT_COMPACTOR['thread'] = t
+        t.start()
+    return _CHAT_COMPACTOR['thread']
 
 
 def load_project_registry():
@@ -678,65 +2034,302 @@ def load_project_registry():
     return default
 
 
-def save_chat(data):
-    CHAT_FILE.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
+TRAIL_HEADER = (
+    "# Missões — Trajeto Completo\n\n"
+    "Este arquivo guarda o histórico completo de cada missão (um card por missão).\n\n"
+)
+
+
+# The trail is append-only and split in monthly shards (trail/YYYY-MM.md). Each entry is
+# appended under a "## CARD" marker, repeated whenever the card changes; the per-shard index
+# (trail/YYYY-MM.idx, one "offset<TAB>missionId" line per block) maps a card to its byte
+# ranges. Past months are gzipped as independent ~64 KiB members (trail/YYYY-MM.md.gz, with
+# trail/YYYY-MM.gzmap), so one card's blocks are still read without inflating the whole shard.
+# The parsed blocks of each shard are kept per file version (mtime/size) for the full views.
+_TRAIL = {'loaded': False, 'last': None, 'shards': [], 'blocks': {}, 'offsets': {}, 'gz': {}, 'parsed': {}, 'rendered': None}
+_TRAIL_LOCK = threading.RLock()
+TRAIL_MARKER = '## CARD '
+TRAIL_GZIP_CHUNK = 64 * 1024
+
+
+def trail_shard_name(ts=None):
+    return time.strftime('%Y-%m', time.gmtime(ts))
+
+
+def _trail_path(shard, ext):
+    return TRAIL_DIR / f'{shard}{ext}'
+
+
+def _parse_trail_marker(line):
+    mission_id, _, title = line[len(TRAIL_MARKER):].rstrip('\n').partition(' — ')
+    return mission_id, title
+
+
+def _read_shard_range(shard, start=0, end=None):
+    """Bytes [start, end) of a shard's (uncompressed) text."""
+    gzmap = _TRAIL['gz'].get(shard)
+    if gzmap is None:
+        with open(_trail_path(shard, '.md'), 'rb') as f:
+            f.seek(start)
+            return f.read(end - start) if end is not None else f.read()
+    starts = [u for u, _ in gzmap]
+    i = max(0, bisect.bisect_right(starts, start) - 1)
+    j = bisect.bisect_left(starts, end) if end is not None else len(gzmap)
+    with open(_trail_path(shard, '.md.gz'), 'rb') as f:
+        f.seek(gzmap[i][1])
+        blob = f.read(gzmap[j][1] - gzmap[i][1]) if j < len(gzmap) else f.read()
+    raw = gzip.decompress(blob)
+    base = gzmap[i][0]
+    return raw[start - base:(end - base) if end is not None else None]
+
+
+def _rebuild_shard_index(shard):
+    entries = []
+    offset = 0
+    for raw in _read_shard_range(shard).splitlines(keepends=True):
+        if raw.startswith(TRAIL_MARKER.encode('utf-8')):
+            mission_id, _ = _parse_trail_marker(raw.decode('utf-8', errors='ignore'))
+            entries.append((offset, mission_id))
+        offset += len(raw)
+    atomic_write_bytes(_trail_path(shard, '.idx'), ''.join(f"{off}\t{mid}\n" for off, mid in entries).encode('utf-8'))
+    return entries
+
+
+def _shard_index_covers(shard, entries):
+    """Whether the index ends on the shard's last block: its last offset is a block start and
+    no block follows it (a crash between the .md and the .idx append leaves one unindexed)."""
+    marker = TRAIL_MARKER.encode('utf-8')
+    tail = _read_shard_range(shard, entries[-1][0] if entries else 0)
+    if entries:
+        if not tail.startswith(marker):
+            return False
+        tail = tail[len(marker):]
+    elif tail.startswith(marker):
+        return False
+    return b'\n' + marker not in tail
+
+
+def _read_shard_index(shard):
+    """Index entries of a shard; rebuilt from the shard when missing or stale."""
+    path = _trail_path(shard, '.idx')
+    if not path.exists():
+        return _rebuild_shard_index(shard)
+    text = path.read_text(encoding='utf-8')
+    if text and not text.endswith('\n'):
+        return _rebuild_shard_index(shard)
+    entries = []
+    for raw in text.splitlines():
+        off, _, mission_id = raw.partition('\t')
+        try:
+            entries.append((int(off), mission_id))
+        except ValueError:
+            return _rebuild_shard_index(shard)
+    if not _shard_index_covers(shard, entries):
+        return _rebuild_shard_index(shard)
+    return entries
 
 
-def ensure_trail_file():
-    if TRAIL_FILE.exists():
+def _migrate_legacy_trail():
+    """Move a pre-shard MISSOES_TRAJETO.md into the shard of its last modification."""
+    if not TRAIL_FILE.exists():
         return
-    TRAIL_FILE.write_text(
-        "# Missões — Trajeto Completo\n\n"
-        "Este arquivo guarda o histórico completo de cada missão (um card por missão).\n\n",
-        encoding='utf-8',
-    )
+    TRAIL_DIR.mkdir(parents=True, exist_ok=True)
+    shard = trail_shard_name(TRAIL_FILE.stat().st_mtime)
+    target = _trail_path(shard, '.md')
+    if target.exists():
+        with open(target, 'ab') as f:
+            f.write(TRAIL_FILE.read_bytes())
+        TRAIL_FILE.unlink()
+    else:
+        os.replace(TRAIL_FILE, target)
+    _trail_path(shard, '.idx').unlink(missing_ok=True)
+    (BASE / 'MISSOES_TRAJETO.idx').unlink(missing_ok=True)
+
+
+def _load_trail_index():
+    if _TRAIL['loaded']:
+        return
+    _migrate_legacy_trail()
+    names = set()
+    if TRAIL_DIR.exists():
+        for p in TRAIL_DIR.iterdir():
+            if p.name.endswith('.md') or p.name.endswith('.md.gz'):
+                names.add(p.name.split('.', 1)[0])
+    blocks, offsets, last = {}, {}, None
+    gz = _TRAIL['gz'] = {}
+    for shard in sorted(names):
+        gzmap = _trail_path(shard, '.gzmap')
+        if not _trail_path(shard, '.md').exists() and gzmap.exists():
+            gz[shard] = [tuple(int(x) for x in raw.split('\t')) for raw in gzmap.read_text(encoding='utf-8').splitlines() if raw]
+        entries = _read_shard_index(shard)
+        offsets[shard] = [off for off, _ in entries]
+        for off, mission_id in entries:
+            blocks.setdefault(mission_id, []).append((shard, off))
+            last = (shard, mission_id)
+    _TRAIL.update({'shards': sorted(names), 'blocks': blocks, 'offsets': offsets, 'last': last, 'loaded': True})
 
 
 def append_trail_entry(mission_id, title, line):
-    ensure_trail_file()
-    text = TRAIL_FILE.read_text(encoding='utf-8')
-    marker = f"## CARD {mission_id} — {title}"
-    if marker not in text:
-        text += (
-            f"\n{marker}\n"
-            f"- Status: criado\n"
-            f"- Trajeto:\n"
-        )
+    """Append one trail line in O(1): no read-back, no rewrite of the file."""
     ts = time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime())
-    text += f"  - [{ts}] {line}\n"
-    TRAIL_FILE.write_text(text, encoding='utf-8')
+    mission_id = str(mission_id)
+    shard = trail_shard_name()
+    with _TRAIL_LOCK:
+        _load_trail_index()
+        rollover = shard not in _TRAIL['offsets']
+        if rollover:
+            TRAIL_DIR.mkdir(parents=True, exist_ok=True)
+            path = _trail_path(shard, '.md')
+            if not path.exists():
+                path.write_text(TRAIL_HEADER, encoding='utf-8')
+            _TRAIL['shards'].append(shard)
+            _TRAIL['offsets'][shard] = []
+
+        new_block = _TRAIL['last'] != (shard, mission_id)
+        chunk = ''
+        if new_block:
+            chunk += f"\n{TRAIL_MARKER}{mission_id} — {title}\n"
+            if mission_id not in _TRAIL['blocks']:
+                chunk += "- Status: criado\n- Trajeto:\n"
+        chunk += f"  - [{ts}] {line}\n"
+        with open(_trail_path(shard, '.md'), 'ab') as f:
+            offset = f.tell() + 1  # block starts after the blank line
+            f.write(chunk.encode('utf-8'))
+        if new_block:
+            with open(_trail_path(shard, '.idx'), 'a', encoding='utf-8') as f:
+                f.write(f"{offset}\t{mission_id}\n")
+            _TRAIL['blocks'].setdefault(mission_id, []).append((shard, offset))
+            _TRAIL['offsets'][shard].append(offset)
+            _TRAIL['last'] = (shard, mission_id)
+        search_index_trail_line(mission_id, title, line)
+
+    if rollover and len(_TRAIL['shards']) > 1:
+        threading.Thread(target=compress_trail_shards, name='trail-gzip', daemon=True).start()
+
+
+def compress_trail_shard(shard):
+    """Gzip a closed shard as independent members cut at block starts (~TRAIL_GZIP_CHUNK each)."""
+    with _TRAIL_LOCK:
+        _load_trail_index()
+        path = _trail_path(shard, '.md')
+        if shard in _TRAIL['gz'] or not path.exists():
+            return False
+        raw = path.read_bytes()
+        cuts = [0]
+        for off in _TRAIL['offsets'].get(shard) or []:
+            if off - cuts[-1] >= TRAIL_GZIP_CHUNK:
+                cuts.append(off)
+        members, gzmap, coff = [], [], 0
+        for i, start in enumerate(cuts):
+            end = cuts[i + 1] if i + 1 < len(cuts) else len(raw)
+            member = gzip.compress(raw[start:end], mtime=0)
+            gzmap.append((start, coff))
+            members.append(member)
+            coff += len(member)
+        atomic_write_bytes(_trail_path(shard, '.md.gz'), b''.join(members))
+        atomic_write_bytes(_trail_path(shard, '.gzmap'), ''.join(f"{u}\t{c}\n" for u, c in gzmap).encode('utf-8'))
+        _TRAIL['gz'][shard] = gzmap
+        path.unlink()
+        return True
+
+
+def compress_trail_shards():
+    """Gzip every shard older than the current month. Returns the shards compressed."""
+    current = trail_shard_name()
+    with _TRAIL_LOCK:
+        _load_trail_index()
+        shards = [s for s in _TRAIL['shards'] if s < current and s not in _TRAIL['gz']]
+    done = []
+    for shard in shards:
+        try:
+            if compress_trail_shard(shard):
+                done.append(shard)
+        except Exception as e:
+            print(f'[trail] gzip of {shard} failed: {e}')
+    return done
+
+
+def read_trail_blocks(mission_id):
+    """Return [(shard, text)] for one card, reading only its byte ranges."""
+    out = []
+    with _TRAIL_LOCK:
+        _load_trail_index()
+        for shard, start in _TRAIL['blocks'].get(str(mission_id)) or []:
+            offsets = _TRAIL['offsets'][shard]
+            i = bisect.bisect_right(offsets, start)
+            end = offsets[i] if i < len(offsets) else None
+            out.append((shard, _read_shard_range(shard, start, end).decode('utf-8', errors='ignore').rstrip('\n')))
+    return out
+
+
+def get_mission_trail(mission_id):
+    """Trail entries of one card: [{shard, at, text}] in append order."""
+    entries = []
+    for shard, block in read_trail_blocks(mission_id):
+        for line in block.splitlines():
+            line = line.strip()
+            if line.startswith('- [') and '] ' in line:
+                at, _, text = line[3:].partition('] ')
+                entries.append({'shard': shard, 'at': at, 'text': text})
+    return entries
+
+
+def _shard_stamp(shard):
+    path = _trail_path(shard, '.md.gz' if shard in _TRAIL['gz'] else '.md')
+    st = path.stat()
+    return shard, path.suffix, st.st_mtime_ns, st.st_size
+
+
+def trail_shard_blocks(shard):
+    """[(missionId, marker line, [non-empty lines])] of one shard, in file order. Parsed once per
+    shard version: closed months never change, so only the current one is read again."""
+    with _TRAIL_LOCK:
+        stamp = _shard_stamp(shard)
+        cached = _TRAIL['parsed'].get(shard)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        blocks, current = [], None
+        for line in _read_shard_range(shard).decode('utf-8', errors='ignore').splitlines():
+            if line.startswith(TRAIL_MARKER):
+                current = (_parse_trail_marker(line)[0], line, [])
+                blocks.append(current)
+            elif line.startswith('#'):
+                current = None
+            elif current is not None and line.strip():
+                current[2].append(line)
+        _TRAIL['parsed'][shard] = (stamp, blocks)
+        return blocks
+
+
+def render_trail_markdown():
+    """Grouped view of the trail (one section per card, entries in order), rebuilt only when a
+    shard changed."""
+    with _TRAIL_LOCK:
+        _load_trail_index()
+        stamps = tuple(_shard_stamp(shard) for shard in _TRAIL['shards'])
+        if _TRAIL['rendered'] and _TRAIL['rendered'][0] == stamps:
+            return _TRAIL['rendered'][1]
+        cards = {}
+        for shard in _TRAIL['shards']:
+            for mission_id, marker, lines in trail_shard_blocks(shard):
+                cards.setdefault(mission_id, {'marker': marker, 'lines': []})['lines'].extend(lines)
+
+        out = [TRAIL_HEADER.rstrip('\n'), '']
+        for card in cards.values():
+            out.append(card['marker'])
+            out.extend(card['lines'])
+            out.append('')
+        text = '\n'.join(out)
+        _TRAIL['rendered'] = (stamps, text)
+        return text
 
 
 def infer_mission_kind(title, desc):
-    t = f"{title} {desc}".lower()
-    if 'sitegpt' in t and ('remova' in t or 'remove' in t):
-        return 'remove_sitegpt_badge'
-    if ('header' in t or 'mission control' in t) and any(k in t for k in ['icone', 'ícone', 'icon']):
-        return 'header_brand_icon'
-    if ('sessão live' in t or 'sessao live' in t or 'live panel' in t or 'trackeamento' in t or 'tracking' in t) and ('dashboard' in t or 'task' in t or 'tarefa' in t):
-        return 'live_tracking_center_plan'
-    if 'header' in t and ('numero' in t or 'número' in t):
-        return 'header_real_numbers'
-    if 'chat' in t and 'agente' in t:
-        return 'agent_chat_toggle'
-    if 'tela infinita' in t or 'scroll infinito' in t:
-        if 'doc' in t or 'bloco' in t:
-            return 'infinite_reading'
-        return 'dashboard_infinite_scroll'
-    if 'infinita' in t and 'leitura' in t:
-        return 'infinite_reading'
-    return 'manual_required'
+    return _mission_kind(keyword_mask(f"{title} {desc}"))
 
 
 def infer_owner_simple(title, desc):
-    t = f"{title} {desc}".lower()
-    if any(k in t for k in ['api', 'backend', 'deploy', 'infra', 'server', 'banco', 'db', 'código', 'code', 'integra']):
-        return 'Thanos'
-    if any(k in t for k in ['ui', 'ux', 'frontend', 'front', 'layout', 'página', 'design', 'landing', 'tela', 'header', 'visual', 'icone', 'ícone']):
-        return 'Wanda'
-    if any(k in t for k in ['auditoria', 'auditar', 'gargalo', 'dependên', 'distribui', 'fluxo', 'handoff']):
-        return 'Alfred'
-    return 'Alfred'
+    return _first_rule('owner', keyword_mask(f"{title} {desc}"), 'Alfred')
 
 
 def triage_with_oraculo(title, desc, priority='p2'):
@@ -950,6 +2543,60 @@ def ensure_execution_defaults(mission):
     return mission_id
 
 
+# Transition dedupe store: data['transitionKeys'] (its own history segment) maps digest -> first
+# seen ms, oldest first. A key dedupes for TRANSITION_DEDUPE_WINDOW_S; expired keys and the oldest
+# ones beyond TRANSITION_DEDUPE_MAX are evicted from the front as new keys come in.
+TRANSITION_DEDUPE_WINDOW_S = max(1, int(os.getenv('MC_TRANSITION_DEDUPE_WINDOW_S') or 7 * 24 * 3600))
+TRANSITION_DEDUPE_MAX = max(1, int(os.getenv('MC_TRANSITION_DEDUPE_MAX') or 5000))
+_DEDUPE = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+
+def _dedupe_ts(value):
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else 0
+
+
+def order_transition_keys(data):
+    """Storage does not keep insertion order: restore oldest-first after a load."""
+    keys = data.get('transitionKeys')
+    data['transitionKeys'] = dict(sorted(keys.items(), key=lambda kv: _dedupe_ts(kv[1]))) if isinstance(keys, dict) else {}
+
+
+def prune_transition_keys(data, now=None):
+    """Evict expired and over-cap dedupe keys (oldest first); returns how many were dropped."""
+    keys = data.setdefault('transitionKeys', {})
+    cutoff = (now or now_ms()) - TRANSITION_DEDUPE_WINDOW_S * 1000
+    dropped = 0
+    while keys:
+        oldest = next(iter(keys))
+        if len(keys) <= TRANSITION_DEDUPE_MAX and _dedupe_ts(keys[oldest]) >= cutoff:
+            break
+        del keys[oldest]
+        dropped += 1
+    _DEDUPE['evictions'] += dropped
+    return dropped
+
+
+def remember_transition_key(data, digest, ts):
+    """False if `digest` was already seen within the window (a duplicate); otherwise record it."""
+    if not isinstance(data.get('transitionKeys'), dict):
+        data['transitionKeys'] = {}
+    prune_transition_keys(data, ts)
+    keys = data['transitionKeys']
+    if digest in keys:
+        _DEDUPE['hits'] += 1
+        return False
+    _DEDUPE['misses'] += 1
+    keys[digest] = ts
+    if len(keys) > TRANSITION_DEDUPE_MAX:
+        prune_transition_keys(data, ts)
+    return True
+
+
+def prune_transition_keys_migration(data):
+    order_transition_keys(data)
+    prune_transition_keys(data)
+
+
 def record_transition(data, mission_id, from_col, to_col, actor='system', reason='update', title='Missão sem título', transition_id=None):
     if not mission_id:
         return None
@@ -957,10 +2604,8 @@ def record_transition(data, mission_id, from_col, to_col, actor='system', reason
     ts = now_ms()
     base_key = transition_id or f"{mission_id}:{from_col}->{to_col}:{actor}:{reason}".lower()
     digest = hashlib.sha1(base_key.encode('utf-8')).hexdigest()[:16]
-    key_slot = data.setdefault('transitionKeys', {})
-    if key_slot.get(digest):
+    if not remember_transition_key(data, digest, ts):
         return None
-    key_slot[digest] = ts
 
     event = {
         'id': f"tr_{uuid.uuid4().hex[:12]}",
@@ -973,41 +2618,185 @@ def record_transition(data, mission_id, from_col, to_col, actor='system', reason
         'title': title,
     }
     trail = data.setdefault('auditTrail', [])
+    idx = audit_index(data)
     trail.append(event)
-    if len(trail) > 5000:
-        data['auditTrail'] = trail[-5000:]
+    if idx is not None:
+        _audit_index_add(idx, trail, len(trail) - 1)
+    touch_missions(data, mission_id)
+    if len(trail) > AUDIT_TRAIL_MAX:
+        dropped = trail[:-AUDIT_TRAIL_MAX]
+        data['auditTrail'] = trail[-AUDIT_TRAIL_MAX:]
+        if idx is not None:
+            _audit_index_trim(idx, dropped)
+        # Their timeline count just went down.
+        touch_missions(data, *{_audit_mission_key(e) for e in dropped})
     return event
 
 
+# Per-mission secondary index over auditTrail (derived, not persisted):
+# data['auditIndex'] = {'base': n, 'count': len(trail), 'byMission': {missionId: [pos, ...]}}
+# where positions are absolute (trail[pos - base]) and each list is in timestamp order.
+# Trimming the oldest events only advances `base`.
+AUDIT_TRAIL_MAX = 5000
+
+
+def _audit_mission_key(event):
+    return str((event or {}).get('missionId') or '').strip()
+
+
+def build_audit_index(data):
+    trail = data.get('auditTrail')
+    if not isinstance(trail, list):
+        data.pop('auditIndex', None)
+        return None
+    by_mission = {}
+    for pos, e in enumerate(trail):
+        by_mission.setdefault(_audit_mission_key(e), []).append(pos)
+    for positions in by_mission.values():
+        positions.sort(key=lambda p: int(trail[p].get('timestamp') or 0))
+    idx = {'base': 0, 'count': len(trail), 'byMission': by_mission}
+    data['auditIndex'] = idx
+    return idx
+
+
+def audit_index(data):
+    """The audit index if it matches the trail, else None (callers then scan)."""
+    idx = data.get('auditIndex')
+    trail = data.get('auditTrail')
+    if isinstance(idx, dict) and isinstance(trail, list) and idx.get('count') == len(trail):
+        return idx
+    return None
+
+
+def _audit_index_add(idx, trail, i):
+    event = trail[i]
+    positions = idx['byMission'].setdefault(_audit_mission_key(event), [])
+    pos = idx['base'] + i
+    ts = int(event.get('timestamp') or 0)
+    if positions and int(trail[positions[-1] - idx['base']].get('timestamp') or 0) > ts:
+        bisect.insort(positions, pos, key=lambda p: int(trail[p - idx['base']].get('timestamp') or 0))
+    else:
+        positions.append(pos)
+    idx['count'] += 1
+
+
+def _audit_index_trim(idx, dropped):
+    idx['base'] += len(dropped)
+    idx['count'] -= len(dropped)
+    for key in {_audit_mission_key(e) for e in dropped}:
+        kept = [p for p in idx['byMission'].get(key, []) if p >= idx['base']]
+        if kept:
+            idx['byMission'][key] = kept
+        else:
+            idx['byMission'].pop(key, None)
+
+
 def get_mission_timeline(data, mission_id):
     needle = str(mission_id or '').strip()
     if not needle:
         return []
     trail = data.get('auditTrail', []) or []
+    idx = audit_index(data)
+    if idx is not None:
+        return [trail[p - idx['base']] for p in idx['byMission'].get(needle, [])]
     out = [e for e in trail if str(e.get('missionId') or '').strip() == needle]
     out.sort(key=lambda x: int(x.get('timestamp') or 0))
     return out
 
 
-def upsert_mission_run(data, mission_id: str, run_id: str, patch: dict, prepend_if_missing: bool = True):
-    """Persist per-execution activity entries.
+def mission_timeline_summary(data, mission_id):
+    """(event count, latest event) for a mission; O(1) with the audit index."""
+    needle = str(mission_id or '').strip()
+    idx = audit_index(data)
+    if idx is None:
+        tl = get_mission_timeline(data, needle)
+        return len(tl), (tl[-1] if tl else None)
+    positions = idx['byMission'].get(needle) if needle else None
+    if not positions:
+        return 0, None
+    return len(positions), data['auditTrail'][positions[-1] - idx['base']]
 
-    data['missionRuns'] is a dict: { missionId: [run, run, ...] }
-    Runs are stored most-recent-first.
-    """
+
+# Per-mission run history is a fixed-capacity ring: {'cap': n, 'next': runs ever added,
+# 'slots': [...]}, the k-th run added living in slots[k % cap]. Adding a run overwrites the
+# oldest one once the ring is full. data['runIndex'] = {missionId: {runId: k}} (derived, not
+# persisted) finds a run's slot without scanning. The ring only lives in memory: storage,
+# --export-json and the API keep the newest-first list layout (see stored_segment()).
+RUN_HISTORY_MAX = 80
+
+
+def new_run_ring(runs=()):
+    """A ring holding `runs` (given most-recent-first, the stored list layout)."""
+    runs = [r for r in runs if isinstance(r, dict)][:RUN_HISTORY_MAX]
+    return {'cap': RUN_HISTORY_MAX, 'next': len(runs), 'slots': runs[::-1]}
+
+
+def iter_runs(ring):
+    """Runs of a ring, most recent first, without copying (a legacy list is taken as is)."""
+    if isinstance(ring, list):
+        yield from ring
+        return
+    if not isinstance(ring, dict):
+        return
+    slots, cap, nxt = ring.get('slots') or [], ring.get('cap') or 1, ring.get('next') or 0
+    for k in range(nxt - 1, nxt - 1 - len(slots), -1):
+        yield slots[k % cap]
+
+
+def _ring_ids(ring):
+    slots, cap, nxt = ring['slots'], ring['cap'], ring['next']
+    return {str(slots[k % cap].get('id') or ''): k for k in range(nxt - len(slots), nxt)}
+
+
+def build_run_index(data):
+    runs_by_mission = data.get('missionRuns')
+    data['runIndex'] = {
+        mid: _ring_ids(ring)
+        for mid, ring in (runs_by_mission.items() if isinstance(runs_by_mission, dict) else ())
+        if isinstance(ring, dict)
+    }
+    return data['runIndex']
+
+
+def ring_mission_runs(data):
+    """Per-mission run lists (the stored layout) become rings; also migration v6."""
+    runs_by_mission = data.get('missionRuns')
+    if isinstance(runs_by_mission, dict):
+        for mid, runs in list(runs_by_mission.items()):
+            if isinstance(runs, list):
+                runs_by_mission[mid] = new_run_ring(runs)
+
+
+def upsert_mission_run(data, mission_id: str, run_id: str, patch: dict):
+    """Persist per-execution activity entries in O(1).
+
+    data['missionRuns'] is a dict: { missionId: run ring } (see new_run_ring()); a new run
+    becomes the most recent one."""
     mission_id = str(mission_id or '').strip()
     run_id = str(run_id or '').strip()
     if not mission_id or not run_id:
         return None
 
+    touch_missions(data, mission_id)
     runs_by_mission = data.setdefault('missionRuns', {})
-    runs = runs_by_mission.get(mission_id)
-    if not isinstance(runs, list):
-        runs = []
-
-    idx = next((i for i, r in enumerate(runs) if str(r.get('id') or '') == run_id), None)
-    if idx is None:
-        base = {
+    ring = runs_by_mission.get(mission_id)
+    if not isinstance(ring, dict):
+        ring = runs_by_mission[mission_id] = new_run_ring(ring if isinstance(ring, list) else ())
+    index = data.get('runIndex')
+    if not isinstance(index, dict):
+        index = build_run_index(data)
+    ids = index.get(mission_id)
+    slots, cap = ring['slots'], ring['cap']
+
+    k = ids.get(run_id) if ids is not None else None
+    if k is None or not (ring['next'] - len(slots) <= k < ring['next']) or str(slots[k % cap].get('id') or '') != run_id:
+        # Missing or stale entry (e.g. the ring was replaced wholesale): re-derive this mission.
+        ids = index[mission_id] = _ring_ids(ring)
+        k = ids.get(run_id)
+
+    if k is None:
+        evidence = patch.get('evidence') if isinstance(patch.get('evidence'), list) else []
+        run = {
             'id': run_id,
             'missionId': mission_id,
             'tool': patch.get('tool') or 'unknown',
@@ -1019,48 +2808,457 @@ def upsert_mission_run(data, mission_id: str, run_id: str, patch: dict, prepend_
             'startedAt': int(patch.get('startedAt') or now_ms()),
             'endedAt': patch.get('endedAt'),
             'durationMs': patch.get('durationMs'),
-            'evidence': patch.get('evidence') if isinstance(patch.get('evidence'), list) else [],
+            'evidence': list(dict.fromkeys([str(x) for x in evidence if str(x).strip()])),
             'createdAt': now_ms(),
             'updatedAt': now_ms(),
         }
-        if prepend_if_missing:
-            runs.insert(0, base)
-            idx = 0
+        k = ring['next']
+        if len(slots) < cap:
+            slots.append(run)
         else:
-            runs.append(base)
-            idx = len(runs) - 1
-    else:
-        current = runs[idx]
-        merged = {**current, **patch}
-        merged['id'] = run_id
-        merged['missionId'] = mission_id
-        merged['updatedAt'] = now_ms()
-        # Keep evidence unique & stable
-        if isinstance(merged.get('evidence'), list):
-            merged['evidence'] = list(dict.fromkeys([str(x) for x in merged['evidence'] if str(x).strip()]))
-        runs[idx] = merged
-
-    # Cap per-mission run history
-    if len(runs) > 80:
-        runs = runs[:80]
-
-    runs_by_mission[mission_id] = runs
-    data['missionRuns'] = runs_by_mission
-    return runs[idx]
+            ids.pop(str(slots[k % cap].get('id') or ''), None)
+            slots[k % cap] = run
+        ring['next'] = k + 1
+        ids[run_id] = k
+        return run
+
+    merged = {**slots[k % cap], **patch}
+    merged['id'] = run_id
+    merged['missionId'] = mission_id
+    merged['updatedAt'] = now_ms()
+    # Stored evidence is already unique: only a patch that brings evidence needs the pass.
+    if isinstance(patch.get('evidence'), list):
+        merged['evidence'] = list(dict.fromkeys([str(x) for x in merged['evidence'] if str(x).strip()]))
+    slots[k % cap] = merged
+    return merged
 
 
 def get_mission_runs(data, mission_id: str, limit: int = 20):
     mission_id = str(mission_id or '').strip()
     if not mission_id:
         return []
-    runs = (data.get('missionRuns') or {}).get(mission_id) or []
-    if not isinstance(runs, list):
-        return []
     try:
         limit = max(1, min(int(limit), 100))
     except Exception:
         limit = 20
-    return runs[:limit]
+    return list(itertools.islice(iter_runs((data.get('missionRuns') or {}).get(mission_id)), limit))
+
+
+# Materialized dashboard view: the board with each card enriched (normalized execution,
+# timelineCount, latestTransition, lastRun), already encoded. It is rebuilt only when the
+# state version moves, and then only the cards of the missions touched since the previous
+# build (dirty_missions_since()) are recomputed. GET /api/dashboard serves the cached bytes
+# and never writes. The history itself is not part of the payload: the segments are loaded
+# for the per-card summaries only.
+DASHBOARD_SEGMENTS = ('auditTrail', 'missionRuns')
+# Each rebuild also appends (previousVersion, version, changedIds, deletedIds, layoutChanged) to a
+# bounded change log, so GET /api/dashboard/changes?since= can answer with just the cards that
+# changed; cursors older than the log get a full snapshot instead.
+DASHBOARD_CHANGELOG_MAX = int(os.environ.get('MC_DASHBOARD_CHANGELOG_MAX', '256'))
+_DASHBOARD = {'version': None, 'body': None, 'cards': {}, 'byId': {}, 'layout': [], 'builds': 0, 'cardBuilds': 0, 'cardReuses': 0,
+              'changes': collections.deque(maxlen=DASHBOARD_CHANGELOG_MAX), 'deltas': 0, 'snapshots': 0}
+_DASHBOARD_LOCK = threading.Lock()
+
+
+def _dashboard_card(data, mission, cards, dirty):
+    mid = str(mission.get('id') or '').strip()
+    card = _DASHBOARD['cards'].get(mid) if mid and dirty is not None and mid not in dirty else None
+    if card is not None:
+        _DASHBOARD['cardReuses'] += 1
+    else:
+        _DASHBOARD['cardBuilds'] += 1
+        count, latest = mission_timeline_summary(data, mid)
+        runs = get_mission_runs(data, mid, 1)
+        card = _clone(mission)
+        ensure_execution_defaults(card)
+        card['timelineCount'] = count
+        if latest:
+            card['latestTransition'] = latest
+        if runs:
+            card['lastRun'] = runs[0]
+    if mid:
+        cards[mid] = card
+    return card
+
+
+def dashboard_view():
+    """(ETag, encoded GET /api/dashboard payload) for the current state version."""
+    with _DASHBOARD_LOCK:
+        with _STATE_LOCK:
+            data = read_data(segments=DASHBOARD_SEGMENTS)
+            version = _STATE['version']
+            if _DASHBOARD['version'] == version:
+                return version_etag(version), _DASHBOARD['body']
+            dirty = dirty_missions_since(_DASHBOARD['version'])
+
+        cards = {}
+        payload = {k: v for k, v in data.items() if k not in DERIVED_STATE_KEYS and k not in HISTORY_SEGMENTS}
+        payload['columns'] = [
+            {**col, 'items': [_dashboard_card(data, m, cards, dirty) for m in col.get('items', []) or []]}
+            for col in data.get('columns', []) or []
+        ]
+        by_id = {card['id']: card for col in payload['columns'] for card in col['items']}
+        layout = [(col.get('name'), [card['id'] for card in col['items']]) for col in payload['columns']]
+        if _DASHBOARD['version'] is not None:
+            before = _DASHBOARD['byId']
+            changed = {mid for mid, card in by_id.items() if before.get(mid) is not card}
+            _DASHBOARD['changes'].append((_DASHBOARD['version'], version, changed, set(before) - set(by_id),
+                                          layout != _DASHBOARD['layout']))
+        _DASHBOARD['cards'] = cards
+        _DASHBOARD['byId'] = by_id
+        _DASHBOARD['layout'] = layout
+        _DASHBOARD['body'] = dumps_json(payload)
+        _DASHBOARD['version'] = version
+        _DASHBOARD['builds'] += 1
+        return version_etag(version), _DASHBOARD['body']
+
+
+def dashboard_changes(since, boot=None):
+    """Cards created/updated/moved/deleted since a dashboard version, or a full snapshot of the
+    columns when that version is not covered by the change log (too old, other boot, unknown)."""
+    dashboard_view()
+    with _DASHBOARD_LOCK:
+        version = _DASHBOARD['version']
+        cards = _DASHBOARD['byId']
+        result = {'ok': True, 'version': version, 'boot': _BOOT_ID}
+        chain = list(_DASHBOARD['changes'])
+        start = next((i for i, entry in enumerate(chain) if entry[0] == since), None)
+        if (since != version and start is None) or boot not in (None, _BOOT_ID):
+            _DASHBOARD['snapshots'] += 1
+            result['full'] = True
+            result['columns'] = [{'name': name, 'items': [cards[mid] for mid in ids]} for name, ids in _DASHBOARD['layout']]
+            return result
+
+        changed, deleted, moved = set(), set(), False
+        for _, _, upserts, removals, layout_changed in chain[start:] if since != version else ():
+            changed = (changed - removals) | upserts
+            deleted = (deleted - upserts) | removals
+            moved = moved or layout_changed
+        _DASHBOARD['deltas'] += 1
+        result['full'] = False
+        result['changed'] = [cards[mid] for mid in sorted(changed) if mid in cards]
+        result['deleted'] = sorted(deleted)
+        if moved:
+            result['layout'] = [{'name': name, 'ids': ids} for name, ids in _DASHBOARD['layout']]
+        return result
+
+
+# Watchdog: missions stuck forever in "running" (server restarted mid-run) are marked failed
+# by a background thread, not by the dashboard read. It keeps a min-heap of
+# (deadline, missionId) for running missions and sleeps until the earliest deadline; entries
+# are checked against the current state when they expire (a re-run or a finished mission
+# simply drops its stale entry). Every save wakes it to schedule the running missions it
+# touched; it also re-reads the state every WATCHDOG_RESYNC_S, so runs that arrive through a
+# reload (data.json/journal edited outside, a sqlite import) are scheduled too.
+STUCK_RUN_MS = 12 * 60 * 1000
+WATCHDOG_RESYNC_S = 60
+_WATCHDOG = {'thread': None, 'heap': [], 'scheduled': set(), 'version': None, 'wakeups': 0, 'failed': 0}
+_WATCHDOG_WAKE = threading.Condition()
+
+
+def _run_started_at(mission):
+    ex = mission.get('execution') if isinstance(mission.get('execution'), dict) else {}
+    return int(ex.get('startedAt') or mission.get('createdAt') or 0)
+
+
+def _stuck_running(mission, now):
+    ex = mission.get('execution') if isinstance(mission.get('execution'), dict) else {}
+    if str(ex.get('status') or mission.get('executionStatus') or '').lower() != 'running':
+        return False
+    started = _run_started_at(mission)
+    return bool(started) and (now - started) > STUCK_RUN_MS
+
+
+def watch_running(mission_id, started_at):
+    """Schedule the stuck check of a mission that just entered "running"."""
+    entry = (int(started_at) + STUCK_RUN_MS, str(mission_id))
+    with _WATCHDOG_WAKE:
+        if entry in _WATCHDOG['scheduled']:
+            return
+        _WATCHDOG['scheduled'].add(entry)
+        heapq.heappush(_WATCHDOG['heap'], entry)
+        _WATCHDOG_WAKE.notify()
+
+
+def _watch_if_running(mission):
+    ex = mission.get('execution') if isinstance(mission.get('execution'), dict) else {}
+    if str(ex.get('status') or mission.get('executionStatus') or '').lower() == 'running' and _run_started_at(mission):
+        watch_running(mission.get('id'), _run_started_at(mission))
+
+
+def watchdog_sync():
+    """Schedule the running missions of the state versions not seen yet: the ones touched
+    since the last sync, or all of them at startup and after a reload."""
+    with _STATE_LOCK:
+        data = read_data(segments=())
+        version = _STATE['version']
+        if _WATCHDOG['version'] == version:
+            return
+        dirty = dirty_missions_since(_WATCHDOG['version'])
+    if dirty is None:
+        for c in data.get('columns', []) or []:
+            for m in c.get('items', []) or []:
+                _watch_if_running(m)
+    else:
+        for mid in dirty:
+            m = find_mission_ref(data, mid)[2]
+            if m is not None:
+                _watch_if_running(m)
+    _WATCHDOG['version'] = version
+
+
+def watchdog_notify():
+    with _WATCHDOG_WAKE:
+        _WATCHDOG_WAKE.notify()
+
+
+def watchdog_expire(now=None):
+    """Fail the missions whose deadline has passed and that are still running; returns how many."""
+    now = now or now_ms()
+    due = []
+    with _WATCHDOG_WAKE:
+        heap = _WATCHDOG['heap']
+        while heap and heap[0][0] < now:
+            entry = heapq.heappop(heap)
+            _WATCHDOG['scheduled'].discard(entry)
+            due.append(entry[1])
+    if not due:
+        return 0
+    _WATCHDOG['wakeups'] += 1
+    if not any(_stuck_running(find_mission_ref(read_data(segments=()), mid)[2] or {}, now) for mid in due):
+        return 0
+
+    data = load_data(segments=())
+    touch_missions(data)
+    failed = 0
+    for mid in dict.fromkeys(due):
+        m = find_mission_ref(data, mid)[2]
+        if m is None or not _stuck_running(m, now):
+            continue
+        ensure_execution_defaults(m)
+        ex = normalize_execution(m)
+        ex['status'] = 'failed'
+        ex['endedAt'] = ex.get('endedAt') or now
+        ex['updatedAt'] = now
+        evid = list(ex.get('evidence') or [])
+        evid.append('watchdog: marked failed after server restart / timeout')
+        ex['evidence'] = list(dict.fromkeys([str(x) for x in evid if str(x).strip()]))
+
+        m['execution'] = ex
+        m['executionStatus'] = ex['status']
+        m['effectEvidence'] = ex.get('evidence', [])
+        m['effective'] = has_execution_proof(m)
+        m['needsEffectiveness'] = not m['effective']
+        m['needsUserAction'] = 'Execução ficou presa em running (provável restart). Reexecute para gerar PROOF.'
+        touch_missions(data, m.get('id'))
+        failed += 1
+    _REQUEST_CONTEXT.source = 'watchdog'
+    save_data(data)
+    _WATCHDOG['failed'] += failed
+    return failed
+
+
+def _watchdog():
+    while True:
+        try:
+            watchdog_sync()
+        except Exception as e:
+            print(f'[watchdog] sync failed: {e}')
+        with _WATCHDOG_WAKE:
+            heap = _WATCHDOG['heap']
+            wait_s = (heap[0][0] - now_ms() + 1) / 1000.0 if heap else WATCHDOG_RESYNC_S
+            if wait_s > 0:
+                if _WATCHDOG['version'] == _STATE['version']:
+                    _WATCHDOG_WAKE.wait(min(wait_s, WATCHDOG_RESYNC_S))
+                continue
+        try:
+            watchdog_expire()
+        except Exception as e:
+            print(f'[watchdog] expiry failed: {e}')
+            time.sleep(1)
+
+
+def start_watchdog():
+    if _WATCHDOG['thread'] is None:
+        t = threading.Thread(target=_watchdog, name='watchdog', daemon=True)
+        _WATCHDOG['thread'] = t
+        t.start()
+    return _WATCHDOG['thread']
+
+
+# Full-text search: an inverted index token -> {missionId: weight}, accent-insensitive.
+# Each mission is one document made of weighted sources (its own text, its runs, its trail
+# lines); a source is re-tokenized only when it changes. Trail lines are indexed as they are
+# appended; once the index is built, every save_data() re-indexes the mission and run sources
+# of the missions it touched (dirty_missions_since()). A reload from storage, or a save that
+# did not report its missions, falls back to a full resync.
+SEARCH_WEIGHTS = {'title': 5, 'desc': 2, 'comments': 2, 'subtasks': 2, 'runs': 1, 'trail': 1}
+SEARCH_STOPWORDS = frozenset('de da do das dos em no na nos nas um uma uns umas para pra por com sem que se os as ao aos the and for to of in on is'.split())
+_SEARCH_TOKEN_RE = re.compile(r'[a-z0-9]+')
+_SEARCH = {'version': None, 'trailLoaded': False, 'postings': {}, 'docs': {}, 'syncs': 0, 'reindexed': 0}
+_SEARCH_LOCK = threading.RLock()
+
+
+def search_tokens(text):
+    """Lowercase, accent-free word tokens (Portuguese-friendly: "Ação" -> "acao")."""
+    folded = unicodedata.normalize('NFKD', str(text or '')).encode('ascii', 'ignore').decode('ascii').lower()
+    return [t for t in _SEARCH_TOKEN_RE.findall(folded) if len(t) > 1 and t not in SEARCH_STOPWORDS]
+
+
+def _search_weigh(counts, text, weight):
+    for token in search_tokens(text):
+        counts[token] = counts.get(token, 0) + weight
+
+
+def _search_set(mission_id, source, key, counts):
+    """Replace what `source` contributes to a mission's document."""
+    doc = _SEARCH['docs'].setdefault(mission_id, {'title': '', 'sources': {}})
+    old = doc['sources'].pop(source, (None, {}))[1]
+    postings = _SEARCH['postings']
+    for token, w in old.items():
+        hits = postings.get(token)
+        if hits is not None:
+            hits[mission_id] = hits.get(mission_id, 0) - w
+            if hits[mission_id] <= 0:
+                del hits[mission_id]
+                if not hits:
+                    del postings[token]
+    for token, w in counts.items():
+        hits = postings.setdefault(token, {})
+        hits[mission_id] = hits.get(mission_id, 0) + w
+    if counts:
+        doc['sources'][source] = (key, counts)
+    elif not doc['sources']:
+        del _SEARCH['docs'][mission_id]
+    _SEARCH['reindexed'] += 1
+
+
+def _mission_search_counts(mission):
+    counts = {}
+    _search_weigh(counts, f"{mission.get('title') or ''} {mission.get('requestedTitle') or ''}", SEARCH_WEIGHTS['title'])
+    _search_weigh(counts, mission.get('desc'), SEARCH_WEIGHTS['desc'])
+    for c in mission.get('comments') or []:
+        _search_weigh(counts, c.get('text') if isinstance(c, dict) else c, SEARCH_WEIGHTS['comments'])
+    for t in mission.get('subtasks') or []:
+        _search_weigh(counts, t.get('text') if isinstance(t, dict) else t, SEARCH_WEIGHTS['subtasks'])
+    return counts
+
+
+def _runs_search_counts(runs):
+    counts = {}
+    for r in iter_runs(runs):
+        if isinstance(r, dict):
+            _search_weigh(counts, r.get('output'), SEARCH_WEIGHTS['runs'])
+            for ev in r.get('evidence') or []:
+                _search_weigh(counts, ev, SEARCH_WEIGHTS['runs'])
+    return counts
+
+
+def search_index_trail_line(mission_id, title, line):
+    """Called by append_trail_entry(): add one trail line to the card's document."""
+    with _SEARCH_LOCK:
+        if not _SEARCH['trailLoaded']:
+            return
+        doc = _SEARCH['docs'].get(mission_id)
+        counts = dict(doc['sources'].get('trail', (None, {}))[1]) if doc else {}
+        _search_weigh(counts, line, SEARCH_WEIGHTS['trail'])
+        _search_set(mission_id, 'trail', None, counts)
+        _SEARCH['docs'][mission_id]['title'] = _SEARCH['docs'][mission_id]['title'] or title
+
+
+def _search_load_trail():
+    # Caller holds _TRAIL_LOCK then _SEARCH_LOCK (the order append_trail_entry uses), so no
+    # append slips between reading the shards and setting the flag.
+    _load_trail_index()
+    cards = {}
+    for shard in _TRAIL['shards']:
+        for mission_id, marker, lines in trail_shard_blocks(shard):
+            card = cards.setdefault(mission_id, {'title': _parse_trail_marker(marker)[1], 'counts': {}})
+            for line in lines:
+                if line.strip().startswith('- ['):
+                    _search_weigh(card['counts'], line.strip()[3:].partition('] ')[2], SEARCH_WEIGHTS['trail'])
+    for mission_id, card in cards.items():
+        _search_set(mission_id, 'trail', None, card['counts'])
+        if mission_id in _SEARCH['docs']:
+            _SEARCH['docs'][mission_id]['title'] = card['title']
+    _SEARCH['trailLoaded'] = True
+
+
+def _search_index_mission(data, mid):
+    """Re-index the mission and run sources of one mission from the current state."""
+    mission = find_mission_ref(data, mid)[2]
+    if mission is not None and str(mission.get('id') or '').strip() != mid:
+        mission = None
+    doc = _SEARCH['docs'].get(mid)
+    if mission is not None:
+        _search_set(mid, 'mission', None, _mission_search_counts(mission))
+        if mid in _SEARCH['docs']:
+            _SEARCH['docs'][mid]['title'] = mission.get('title') or _SEARCH['docs'][mid]['title']
+    elif doc and 'mission' in doc['sources']:
+        _search_set(mid, 'mission', None, {})
+    runs = (data.get('missionRuns') or {}).get(mid)
+    doc = _SEARCH['docs'].get(mid)
+    if runs:
+        _search_set(mid, 'runs', None, _runs_search_counts(runs))
+    elif doc and 'runs' in doc['sources']:
+        _search_set(mid, 'runs', None, {})
+
+
+def search_sync():
+    """Bring the index up to date with the current state (only the missions touched since)."""
+    if not _SEARCH['trailLoaded']:
+        with _TRAIL_LOCK, _SEARCH_LOCK:
+            if not _SEARCH['trailLoaded']:
+                _search_load_trail()
+    with _SEARCH_LOCK:
+        with _STATE_LOCK:
+            data = read_data(segments=('missionRuns',))
+            version = _STATE['version']
+            if _SEARCH['version'] == version:
+                return
+            dirty = dirty_missions_since(_SEARCH['version'])
+        if dirty is None:
+            dirty = {str(m.get('id') or '').strip() for col in data.get('columns', []) or [] for m in col.get('items', []) or []}
+            dirty |= set(data.get('missionRuns') or {})
+            dirty |= {mid for mid, doc in _SEARCH['docs'].items() if 'mission' in doc['sources'] or 'runs' in doc['sources']}
+            dirty.discard('')
+        for mid in dirty:
+            _search_index_mission(data, mid)
+        _SEARCH['version'] = version
+        _SEARCH['syncs'] += 1
+
+
+def search_missions(query, limit=20, offset=0):
+    """Missions matching every query term, best first (weight x idf): {total, results}."""
+    terms = list(dict.fromkeys(search_tokens(query)))
+    if not terms:
+        return {'total': 0, 'results': []}
+    search_sync()
+    data = read_data(segments=())
+    with _SEARCH_LOCK:
+        postings = _SEARCH['postings']
+        lists = sorted((postings.get(t) or {} for t in terms), key=len)
+        if not lists[0]:
+            return {'total': 0, 'results': []}
+        n_docs = max(1, len(_SEARCH['docs']))
+        scored = []
+        for mid in lists[0]:
+            if all(mid in hits for hits in lists[1:]):
+                score = sum(hits[mid] * math.log(1 + n_docs / len(hits)) for hits in lists)
+                scored.append((-score, mid))
+        scored.sort()
+        results = []
+        for neg, mid in scored[offset:offset + limit]:
+            doc = _SEARCH['docs'][mid]
+            col = find_mission_ref(data, mid)[0]
+            results.append({
+                'missionId': mid,
+                'title': doc['title'],
+                'column': col.get('name') if col else None,
+                'score': round(-neg, 3),
+                'matched': [src for src, (_, counts) in doc['sources'].items() if any(t in counts for t in terms)],
+            })
+        return {'total': len(scored), 'results': results}
 
 
 def dedupe_board_items(data):
@@ -1083,6 +3281,7 @@ def merge_board_with_canonical(data, incoming_board):
             mid = str(m.get('id') or m.get('cardId') or '').strip()
             if mid:
                 existing_by_id[mid] = m
+    kept = set()
 
     merged_columns = []
     for col in incoming_board or []:
@@ -1110,19 +3309,36 @@ def merge_board_with_canonical(data, incoming_board):
                 if 'needsUserAction' in ex and ex.get('needsUserAction'):
                     merged['needsUserAction'] = ex.get('needsUserAction')
 
+                kept.add(mid)
+                if merged != ex:
+                    touch_missions(data, mid)
+                    if _title_key(merged.get('title', '')) != _title_key(ex.get('title', '')):
+                        _title_index_remove(data, ex)
+                        _title_index_add(data, merged)
                 merged_items.append(merged)
             else:
+                touch_missions(data, mid)
+                _title_index_add(data, m)
                 merged_items.append(m)
         merged_columns.append({'name': col.get('name', ''), 'items': merged_items})
 
     data['columns'] = merged_columns
+    removed = set(existing_by_id) - kept
+    for mid in removed:
+        _title_index_remove(data, existing_by_id[mid])
+    touch_missions(data, *removed)
+
+
+# Telemetry is sampled from `openclaw sessions` at most every 10 s. The sample is kept here,
+# not in the board state: refreshing it must not move the state version (and every ETag
+# and change cursor derived from it).
+_TELEMETRY = {'updatedAt': 0, 'payload': {}}
 
 
-def build_openclaw_telemetry(data):
+def build_openclaw_telemetry():
     now = now_ms()
-    cache = data.setdefault('telemetryCache', {'updatedAt': 0, 'payload': {}})
-    if (now - int(cache.get('updatedAt') or 0)) < 10000 and cache.get('payload'):
-        return cache['payload']
+    if (now - _TELEMETRY['updatedAt']) < 10000 and _TELEMETRY['payload']:
+        return _TELEMETRY['payload']
 
     sessions = []
     source_path = ''
@@ -1187,29 +3403,152 @@ def build_openclaw_telemetry(data):
         },
         'agents': sorted(list(agents.values()), key=lambda x: x['agentId']),
     }
-    data['telemetryCache'] = {'updatedAt': now, 'payload': payload}
+    _TELEMETRY.update({'updatedAt': now, 'payload': payload})
     return payload
 
 
-def build_mission_index(data):
-    dedupe_board_items(data)
+def _locator_key(mission_id):
+    return str(mission_id or '').strip().lower()
+
+
+def _scan_mission_index(data):
     idx = {}
+    for col in data.get('columns', []) or []:
+        name = col.get('name', '')
+        items = col.get('items', []) or []
+        for pos, mission in enumerate(items):
+            idx.setdefault(_locator_key(mission.get('id')), [name, len(items) - 1 - pos])
+    return idx
+
+
+def build_mission_index(data, titles=True):
+    """Rebuild the mission locator: data['missionIndex'] = {id (lowercase): [column name, slot]}.
+
+    Derived state (not persisted). The slot counts from the bottom of the column, so cards
+    placed on top do not shift it. Kept current by place_mission()/take_mission(); the slot
+    is a hint that find_mission_ref() re-checks and repairs. titles=False keeps a title index
+    the caller already maintained."""
+    dedupe_board_items(data)
     for col in data.get('columns', []) or []:
         for mission in col.get('items', []) or []:
-            mid = ensure_mission_id(mission)
-            idx[mid] = mid
+            ensure_mission_id(mission)
+    idx = _scan_mission_index(data)
     data['missionIndex'] = idx
+    if titles:
+        data['titleIndex'] = _scan_title_index(data)
+    build_column_index(data)
     return idx
 
 
+# Column registry (derived, not persisted): data['columnIndex'] = {normalized name: position
+# in data['columns']}, re-checked on every lookup and rebuilt when stale.
+def _column_key(name):
+    return str(name or '').lower().strip()
+
+
+def build_column_index(data):
+    idx = {}
+    for pos, col in enumerate(data.get('columns', []) or []):
+        idx.setdefault(_column_key(col.get('name', '')), pos)
+    data['columnIndex'] = idx
+    return idx
+
+
+def find_column(data, name):
+    """The column named `name` (case-insensitive), or None."""
+    key = _column_key(name)
+    cols = data.get('columns', []) or []
+    idx = data.get('columnIndex')
+    pos = idx.get(key) if isinstance(idx, dict) else None
+    if pos is None or pos >= len(cols) or _column_key(cols[pos].get('name', '')) != key:
+        pos = build_column_index(data).get(key)
+    return cols[pos] if pos is not None else None
+
+
+def _card_count(data):
+    return sum(len(c.get('items') or []) for c in data.get('columns', []) or [])
+
+
+# Title index (derived, not persisted): data['titleIndex'] = {'count': cards indexed,
+# 'byTitle': {normalized title: [mission ids]}}. Built with the locator and kept current by
+# place_mission()/take_mission() and by merge_board_with_canonical(), the one path that
+# replaces cards (and may retitle a card that had no canonical title).
+def _title_key(title):
+    return str(title or '').strip().lower()
+
+
+def _scan_title_index(data):
+    by_title, count = {}, 0
+    for col in data.get('columns', []) or []:
+        for mission in col.get('items', []) or []:
+            count += 1
+            mid = str(mission.get('id') or mission.get('cardId') or '').strip()
+            ids = by_title.setdefault(_title_key(mission.get('title', '')), [])
+            if mid and mid not in ids:
+                ids.append(mid)
+    return {'count': count, 'byTitle': by_title}
+
+
+def _title_index_add(data, mission):
+    idx = data.get('titleIndex')
+    if isinstance(idx, dict):
+        ids = idx['byTitle'].setdefault(_title_key(mission.get('title', '')), [])
+        mid = str(mission.get('id') or '').strip()
+        if mid not in ids:
+            ids.append(mid)
+            idx['count'] += 1
+
+
+def _title_index_remove(data, mission):
+    idx = data.get('titleIndex')
+    key = _title_key(mission.get('title', ''))
+    ids = idx['byTitle'].get(key) if isinstance(idx, dict) else None
+    mid = str(mission.get('id') or '').strip()
+    if ids and mid in ids:
+        ids.remove(mid)
+        idx['count'] -= 1
+        if not ids:
+            del idx['byTitle'][key]
+
+
+def index_mission(data, column, mission, position=0):
+    idx = data.get('missionIndex')
+    if isinstance(idx, dict):
+        idx[_locator_key(mission.get('id'))] = [column.get('name', ''), len(column.get('items') or []) - 1 - position]
+    _title_index_add(data, mission)
+
+
+def place_mission(data, column, mission):
+    """Put `mission` at the top of `column` (in place, no column copy) and record it in the locator."""
+    items = column.get('items')
+    if not isinstance(items, list):
+        items = column['items'] = []
+    items.insert(0, mission)
+    index_mission(data, column, mission, 0)
+    touch_missions(data, mission.get('id'))
+
+
+def take_mission(data, column, position):
+    """Remove the card at `position` of `column` (as returned by find_mission_ref)."""
+    mission = column['items'].pop(position)
+    idx = data.get('missionIndex')
+    if isinstance(idx, dict):
+        idx.pop(_locator_key(mission.get('id')), None)
+    _title_index_remove(data, mission)
+    touch_missions(data, mission.get('id'))
+    return mission
+
+
 def get_column(data, key_name, fallback_label=None):
-    cols = data.get('columns', [])
-    lower = key_name.lower().strip()
-    col = next((c for c in cols if str(c.get('name', '')).lower().strip() == lower), None)
+    col = find_column(data, key_name)
     if col is None and fallback_label:
         col = {'name': fallback_label, 'items': []}
+        cols = data.get('columns', [])
         cols.append(col)
         data['columns'] = cols
+        idx = data.get('columnIndex')
+        if isinstance(idx, dict):
+            idx.setdefault(_column_key(fallback_label), len(cols) - 1)
     return col
 
 
@@ -1244,32 +3583,65 @@ def remove_needs_clarification_column(data):
         failed['items'] = normalized + (failed.get('items', []) or [])
 
 
+# Ordered schema migrations. Each one runs once per state: the reached version is stamped
+# in data['schemaVersion'] and persisted, so steady-state loads skip all of this. Version
+# numbers are never reused: v4 is gone (every write already stores history in its segments).
+MIGRATIONS = [
+    (1, 'remove_needs_clarification_column', remove_needs_clarification_column),
+    (2, 'migrate_monarca_columns', migrate_monarca_columns),
+    (3, 'backfill_state_keys', backfill_state_keys),
+    (5, 'prune_transition_keys', prune_transition_keys_migration),
+    (6, 'ring_mission_runs', ring_mission_runs),
+    (7, 'drop_telemetry_cache', drop_telemetry_cache),
+]
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def _locate(data, idx, needle):
+    ref = idx.get(needle)
+    if not isinstance(ref, list) or len(ref) != 2:
+        return None, None, None
+    col = find_column(data, ref[0])
+    if col is not None and col.get('name', '') != ref[0]:
+        col = next((c for c in data.get('columns', []) or [] if c.get('name', '') == ref[0]), None)
+    items = (col or {}).get('items') or []
+    pos = len(items) - 1 - ref[1] if isinstance(ref[1], int) else -1
+    if not (0 <= pos < len(items) and _locator_key(items[pos].get('id')) == needle):
+        # A card below it was removed (or the column rewritten): look it up in its column only.
+        pos = next((i for i, m in enumerate(items) if _locator_key(m.get('id')) == needle), None)
+        if pos is None:
+            return None, None, None
+        ref[1] = len(items) - 1 - pos
+    return col, pos, items[pos]
+
+
 def find_mission_ref(data, mission_id):
+    """(column, position, mission) for a mission id via the locator, or (None, None, None)."""
     if not mission_id:
         return None, None, None
-    needle = str(mission_id).strip().lower()
-    for c in data.get('columns', []) or []:
-        for i, m in enumerate(c.get('items', []) or []):
-            mid = str(m.get('id', '')).strip().lower()
-            if mid == needle:
-                return c, i, m
-    return None, None, None
+    needle = _locator_key(mission_id)
+    idx = data.get('missionIndex')
+    # Every card has exactly one entry, so a size mismatch means a mutation bypassed the locator.
+    if not isinstance(idx, dict) or len(idx) != _card_count(data):
+        idx = data['missionIndex'] = _scan_mission_index(data)
+    ref = _locate(data, idx, needle)
+    if ref[0] is None and needle in idx:
+        idx = data['missionIndex'] = _scan_mission_index(data)
+        ref = _locate(data, idx, needle)
+    return ref
 
 
 def find_mission_id_by_title_unique(data, title):
-    needle = str(title or '').strip().lower()
+    """Id of the only card with this title (case-insensitive); None if there is none or several."""
+    needle = _title_key(title)
     if not needle:
         return None
-    matches = []
-    for c in data.get('columns', []) or []:
-        for m in c.get('items', []) or []:
-            mt = str(m.get('title', '')).strip().lower()
-            if mt == needle:
-                mid = str(m.get('id') or m.get('cardId') or '').strip()
-                if mid:
-                    matches.append(mid)
-    uniq = list(dict.fromkeys(matches))
-    return uniq[0] if len(uniq) == 1 else None
+    idx = data.get('titleIndex')
+    # Like the locator, a size mismatch means a mutation bypassed the index.
+    if not isinstance(idx, dict) or idx.get('count') != _card_count(data):
+        idx = data['titleIndex'] = _scan_title_index(data)
+    ids = idx['byTitle'].get(needle) or []
+    return ids[0] if len(ids) == 1 else None
 
 
 def route_without_proof(data, mission, reason):
@@ -1287,7 +3659,7 @@ def route_without_proof(data, mission, reason):
     mission['needsEffectiveness'] = True
     mission['needsUserAction'] = 'Falta prova de execução (evidence[] + status effective). Reexecutar e anexar evidências reais.'
 
-    target['items'] = [mission] + (target.get('items', []) or [])
+    place_mission(data, target, mission)
     record_transition(data, mission.get('id', 'unknown'), 'done', 'failed', actor='alfred', reason='missing_execution_proof', title=mission.get('title', 'Missão sem título'))
     append_trail_entry(mission.get('id', 'unknown'), mission.get('title', 'Missão sem título'), f"Bloqueado Done sem proof: {reason}")
 
@@ -1326,10 +3698,10 @@ def enforce_locked_done(data):
     if not locked:
         return
 
-    done_items = done.get('items') or []
-    seen = {str((x or {}).get('id') or '') for x in done_items}
+    seen = {str((x or {}).get('id') or '') for x in done.get('items') or []}
     for m in locked:
         mid = str(m.get('id') or '')
+        touch_missions(data, mid)
         ex = normalize_execution(m)
         ex['status'] = 'effective'
         ex['updatedAt'] = now_ms()
@@ -1338,85 +3710,532 @@ def enforce_locked_done(data):
         m['effective'] = True
         m['needsEffectiveness'] = False
         if mid and mid not in seen:
-            done_items.insert(0, m)
+            place_mission(data, done, m)
             seen.add(mid)
-    done['items'] = done_items
+
+
+# /api/metrics/ops also depends on the clock (runs ended in the last minute): the payload is
+# kept per state version until the first of those runs leaves the window, and its ETag
+# carries the throughput so a change of window is a change of validator.
+_OPS = {'stateEtag': None, 'stableUntil': 0, 'etag': None, 'payload': None}
+
+
+def ops_metrics():
+    """(ETag, payload) of /api/metrics/ops."""
+    now = now_ms()
+    current = state_etag()
+    if current and current == _OPS['stateEtag'] and now < _OPS['stableUntil']:
+        return _OPS['etag'], _OPS['payload']
+
+    data, state_tag = read_data_tagged(segments=('missionRuns',))
+    runs = []
+    mission_runs = data.get('missionRuns') or {}
+    if isinstance(mission_runs, dict):
+        for v in mission_runs.values():
+            runs.extend([x for x in iter_runs(v) if isinstance(x, dict)])
+
+    last_minute = [int(r.get('endedAt') or 0) for r in runs if int(r.get('endedAt') or 0) >= (now - 60_000)]
+    throughput = len(last_minute)
+
+    closed = [r for r in runs if str(r.get('status') or '') in ('effective', 'failed', 'proof_pending')]
+    effective = [r for r in closed if str(r.get('status') or '') == 'effective']
+    sla = round((len(effective) / len(closed)) * 100, 1) if closed else 0.0
+
+    payload = {
+        'ok': True,
+        'throughputPerMin': throughput,
+        'slaEffectivePct': sla,
+        'runsClosed': len(closed),
+        'runsEffective': len(effective),
+    }
+    etag = f'{state_tag[:-1]}-t{throughput}"'
+    _OPS.update({
+        'stateEtag': state_tag,
+        'stableUntil': min(last_minute) + 60_000 if last_minute else float('inf'),
+        'etag': etag,
+        'payload': payload,
+    })
+    return etag, payload
+
+
+# Push channel (GET /api/events, Server-Sent Events). Events live in a bounded log with a
+# per-boot sequence; event ids are "<boot>-<seq>" so a reconnecting browser resumes from
+# Last-Event-ID, and an id that is no longer in the log (or from another boot) gets a single
+# "resync" event instead. Board events are derived from committed state by a pump thread woken
+# by save_data() while someone is listening: it folds the dashboard change log into
+# card-changed, transition and run-started/run-finished events, and samples telemetry, agents
+# and ops metrics, publishing them when they change. Chat messages are published as they are
+# appended.
+EVENT_LOG_MAX = int(os.environ.get('MC_EVENT_LOG_MAX', '1000'))
+EVENT_HEARTBEAT_S = 15.0
+EVENT_SAMPLE_S = float(os.environ.get('MC_EVENT_SAMPLE_S', '15'))
+EVENT_COALESCE_S = 0.1
+# Streams run on their own threads (not pool workers); beyond this many, /api/events answers 503
+# and the UI keeps polling.
+EVENT_MAX_SUBSCRIBERS = int(os.environ.get('MC_EVENT_MAX_SUBSCRIBERS', '64'))
+RUN_FINISHED_STATUSES = ('effective', 'failed', 'proof_pending')
+_EVENTS = {'seq': 0, 'log': collections.deque(maxlen=EVENT_LOG_MAX), 'subscribers': 0, 'published': 0, 'resyncs': 0}
+_EVENTS_WAKE = threading.Condition()
+_PUMP = {'thread': None, 'version': None, 'lastTransition': None, 'runs': {}, 'sampledAt': 0,
+         'telemetry': None, 'agents': None, 'ops': None}
+_PUMP_WAKE = threading.Event()
+
+
+def publish_event(kind, payload):
+    with _EVENTS_WAKE:
+        _EVENTS['seq'] += 1
+        _EVENTS['log'].append((_EVENTS['seq'], kind, dumps_json(payload)))
+        _EVENTS['published'] += 1
+        _EVENTS_WAKE.notify_all()
+
+
+def events_after(last_event_id):
+    """Events after a Last-Event-ID, or None when that id cannot be resumed. Caller holds _EVENTS_WAKE."""
+    log = _EVENTS['log']
+    boot, _, seq = str(last_event_id or '').rpartition('-')
+    try:
+        seq = int(seq)
+    except ValueError:
+        return None
+    first = log[0][0] if log else _EVENTS['seq'] + 1
+    if boot != _BOOT_ID or seq > _EVENTS['seq'] or seq < first - 1:
+        return None
+    return list(itertools.islice(log, seq - first + 1, None))
+
+
+def _sse_frame(seq, kind, body):
+    return b'id: %s-%d\nevent: %s\ndata: %s\n\n' % (_BOOT_ID.encode(), seq, kind.encode(), body)
+
+
+def _resync_event(seq):
+    _EVENTS['resyncs'] += 1
+    return (seq, 'resync', dumps_json({'version': state_version(), 'boot': _BOOT_ID}))
+
+
+def stream_events(sock, cursor, pending):
+    """Write events to an SSE connection until the client goes away, then close it."""
+    try:
+        sock.settimeout(EVENT_HEARTBEAT_S * 2)
+        sock.sendall(b'retry: 3000\n\n')
+        while True:
+            if pending:
+                sock.sendall(b''.join(_sse_frame(*event) for event in pending))
+                cursor = max(cursor, pending[-1][0])
+            else:
+                sock.sendall(b': ping\n\n')
+            with _EVENTS_WAKE:
+                if _EVENTS['seq'] == cursor:
+                    _EVENTS_WAKE.wait(EVENT_HEARTBEAT_S)
+                pending = events_after(f'{_BOOT_ID}-{cursor}')
+                if pending is None:
+                    # Fell behind the bounded log: tell the client to refetch.
+                    cursor = _EVENTS['seq']
+                    pending = [_resync_event(cursor)]
+    except OSError:
+        pass
+    finally:
+        with _EVENTS_WAKE:
+            _EVENTS['subscribers'] -= 1
+        try:
+            sock.close()
+        except OSError:
+            pass
+
+
+def _pump_transitions():
+    trail = read_data(segments=('auditTrail',)).get('auditTrail') or []
+    last = _PUMP['lastTransition']
+    fresh = []
+    for event in reversed(trail):
+        if event.get('id') == last or len(fresh) >= 50:
+            break
+        fresh.append(event)
+    if trail:
+        _PUMP['lastTransition'] = trail[-1].get('id')
+    return fresh[::-1] if last is not None else []
+
+
+def _pump_runs(cards):
+    events = []
+    for card in cards:
+        run = card.get('lastRun') or {}
+        key = (run.get('id'), run.get('status'))
+        if not run or _PUMP['runs'].get(card['id']) == key:
+            continue
+        _PUMP['runs'][card['id']] = key
+        kind = 'run-finished' if key[1] in RUN_FINISHED_STATUSES else 'run-started' if key[1] == 'running' else None
+        if kind:
+            events.append((kind, {'missionId': card['id'], 'title': card.get('title'), 'run': run}))
+    return events
+
+
+def pump_board():
+    """Publish what changed on the board since the last pump."""
+    since = _PUMP['version']
+    changes = dashboard_changes(since, _BOOT_ID)
+    _PUMP['version'] = changes['version']
+    if changes['full']:
+        # First pump (or the change log moved past us): take the baseline silently.
+        cards = [card for col in changes['columns'] for card in col['items']]
+        _PUMP['runs'] = {card['id']: ((card.get('lastRun') or {}).get('id'), (card.get('lastRun') or {}).get('status'))
+                         for card in cards if card.get('lastRun')}
+        _pump_transitions()
+        if since is not None or _EVENTS['seq']:
+            publish_event('resync', {'version': changes['version'], 'boot': _BOOT_ID})
+        return
+    if not (changes['changed'] or changes['deleted'] or 'layout' in changes):
+        return
+    publish_event('card-changed', {**changes, 'since': since})
+    for event in _pump_transitions():
+        publish_event('transition', event)
+    for kind, payload in _pump_runs(changes['changed']):
+        publish_event(kind, payload)
+
+
+def pump_samples():
+    """Publish telemetry, agents and ops metrics when they changed."""
+    telemetry = build_openclaw_telemetry()
+    if telemetry != _PUMP['telemetry']:
+        _PUMP['telemetry'] = telemetry
+        publish_event('telemetry', telemetry)
+
+    details = BASE / 'openclaw-agents-details.json'
+    try:
+        stamp = details.stat().st_mtime_ns
+    except OSError:
+        stamp = None
+    if stamp is not None and stamp != _PUMP['agents']:
+        try:
+            publish_event('agents', json.loads(details.read_text(encoding='utf-8')))
+            _PUMP['agents'] = stamp
+        except Exception:
+            pass
+
+    etag, payload = ops_metrics()
+    if etag != _PUMP['ops']:
+        _PUMP['ops'] = etag
+        publish_event('ops', payload)
+
+
+def _event_pump():
+    while True:
+        woken = _PUMP_WAKE.wait(EVENT_SAMPLE_S)
+        if woken:
+            time.sleep(EVENT_COALESCE_S)
+        _PUMP_WAKE.clear()
+        if not _EVENTS['subscribers']:
+            # Nobody listening: drop the baseline rather than keep the history segments loaded.
+            _PUMP['version'] = None
+            continue
+        try:
+            pump_board()
+            if time.monotonic() - _PUMP['sampledAt'] >= EVENT_SAMPLE_S:
+                _PUMP['sampledAt'] = time.monotonic()
+                pump_samples()
+        except Exception as e:
+            print(f'[events] pump failed: {e}')
+
+
+def start_event_pump():
+    if _PUMP['thread'] is None:
+        t = threading.Thread(target=_event_pump, name='event-pump', daemon=True)
+        _PUMP['thread'] = t
+        t.start()
+        _PUMP_WAKE.set()
+    return _PUMP['thread']
+
+
+# Response compression. Bodies tagged with an ETag (the dashboard view, summaries) are compressed
+# once per (path, ETag, encoding); static UI files are compressed once per (path, mtime, size).
+# Each cache keeps one variant per (key, encoding), so it stays as small as the set of
+# endpoints and files being served.
+COMPRESSIBLE_SUFFIXES = ('.html', '.js', '.css', '.json', '.md', '.svg', '.txt')
+_COMPRESSED = {'tagged': {}, 'static': {}, 'responses': 0, 'bytesIn': 0, 'bytesOut': 0, 'hits': 0}
+_COMPRESSED_LOCK = threading.Lock()
+
+
+def negotiate_encoding(accept_encoding):
+    """Best encoding offered by the client: 'br', 'gzip' or None."""
+    offered = {}
+    for part in (accept_encoding or '').split(','):
+        name, _, params = part.strip().partition(';')
+        q = 1.0
+        if params.strip().startswith('q='):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            offered[name.strip().lower()] = q
+    for name in (('br', 'gzip') if brotli is not None else ('gzip',)):
+        if offered.get(name, offered.get('*', 0.0)) > 0:
+            return name
+    return None
+
+
+def encoded_etag(etag, encoding):
+    """Strong validators differ per representation: '"tag"' -> '"tag-gzip"' for a gzip body."""
+    return f'{etag[:-1]}-{encoding}"' if encoding else etag
+
+
+def compress_body(body, encoding):
+    if encoding == 'br':
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+def compressed_variant(cache, key, version, load, encoding):
+    """(raw size, compressed bytes) of load(), reused while `version` of `key` is unchanged."""
+    with _COMPRESSED_LOCK:
+        cached = _COMPRESSED[cache].get((key, encoding))
+        if cached and cached[0] == version:
+            _COMPRESSED['hits'] += 1
+            return cached[1], cached[2]
+    body = load()
+    packed = compress_body(body, encoding)
+    with _COMPRESSED_LOCK:
+        _COMPRESSED[cache][(key, encoding)] = (version, len(body), packed)
+    return len(body), packed
+
+
+def compression_stats():
+    with _COMPRESSED_LOCK:
+        return {
+            'minBytes': COMPRESS_MIN_BYTES,
+            'brotli': brotli is not None,
+            'responses': _COMPRESSED['responses'],
+            'bytesIn': _COMPRESSED['bytesIn'],
+            'bytesOut': _COMPRESSED['bytesOut'],
+            'cacheHits': _COMPRESSED['hits'],
+            'cached': len(_COMPRESSED['tagged']) + len(_COMPRESSED['static']),
+        }
+
+
+class PooledHTTPServer(HTTPServer):
+    """HTTP server that hands accepted connections to a fixed pool of worker threads.
+
+    Connections wait in a bounded queue; when it is full the connection is answered with a
+    503 right away and closed instead of spawning another thread. A handler may detach() its
+    connection (SSE) so the worker returns to the pool without closing it."""
+
+    allow_reuse_address = True
+
+    def __init__(self, address, handler, workers=HTTP_WORKERS, queue_size=HTTP_QUEUE):
+        self.request_queue_size = max(5, queue_size)
+        super().__init__(address, handler)
+        self._pending = queue.Queue(max(1, queue_size))
+        self._detached = set()
+        self._lock = threading.Lock()
+        self.stats = {'workers': workers, 'queueMax': max(1, queue_size), 'accepted': 0, 'shed': 0, 'busy': 0}
+        for i in range(workers):
+            threading.Thread(target=self._work, name=f'http-{i}', daemon=True).start()
+
+    def process_request(self, request, client_address):
+        try:
+            self._pending.put_nowait((request, client_address))
+            self.stats['accepted'] += 1
+        except queue.Full:
+            self.stats['shed'] += 1
+            body = dumps_json({'ok': False, 'error': 'overloaded'})
+            try:
+                request.sendall(b'HTTP/1.1 503 Service Unavailable\r\nContent-Type: application/json; charset=utf-8\r\n'
+                                b'Retry-After: 1\r\nConnection: close\r\nContent-Length: %d\r\n\r\n%s' % (len(body), body))
+            except OSError:
+                pass
+            self.shutdown_request(request)
+
+    def _work(self):
+        while True:
+            request, client_address = self._pending.get()
+            with self._lock:
+                self.stats['busy'] += 1
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                with self._lock:
+                    self.stats['busy'] -= 1
+                    detached = request in self._detached
+                    self._detached.discard(request)
+                if not detached:
+                    self.shutdown_request(request)
+
+    def detach(self, request):
+        with self._lock:
+            self._detached.add(request)
+
+    def http_stats(self):
+        with self._lock:
+            return {**self.stats, 'queued': self._pending.qsize()}
+
+
+_HTTP = {'server': None}
 
 
 class Handler(SimpleHTTPRequestHandler):
+    # Keep-alive: every response carries Content-Length (or closes the connection), and an idle
+    # connection gives its worker back after HTTP_IDLE_TIMEOUT_S.
+    protocol_version = 'HTTP/1.1'
+    timeout = HTTP_IDLE_TIMEOUT_S
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=str(BASE), **kwargs)
 
-    def _json(self, code, payload):
-        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    def _json(self, code, payload, etag=None):
+        return self._json_body(code, dumps_json(payload), etag)
+
+    def _json_body(self, code, body, etag=None):
+        self._send_body(code, 'application/json; charset=utf-8', body, etag)
+
+    def _send_body(self, code, content_type, body, etag=None, encoding=None, last_modified=None):
+        """Send `body`, compressed when it is big enough and the client accepts it.
+
+        Responses with an ETag reuse the compressed bytes per (path, ETag). `encoding` marks a
+        body that is already compressed."""
+        compressible = bool(COMPRESS_MIN_BYTES) and len(body) >= COMPRESS_MIN_BYTES
+        if encoding is None and compressible:
+            encoding = negotiate_encoding(self.headers.get('Accept-Encoding'))
+            if encoding:
+                if etag:
+                    size, body = compressed_variant('tagged', urlparse(self.path).path, etag, lambda: body, encoding)
+                else:
+                    size, body = len(body), compress_body(body, encoding)
+                with _COMPRESSED_LOCK:
+                    _COMPRESSED['responses'] += 1
+                    _COMPRESSED['bytesIn'] += size
+                    _COMPRESSED['bytesOut'] += len(body)
         self.send_response(code)
-        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Type', content_type)
         self.send_header('Content-Length', str(len(body)))
+        if compressible or encoding:
+            self.send_header('Vary', 'Accept-Encoding')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        if etag:
+            self.send_header('ETag', encoded_etag(etag, encoding))
+            self.send_header('Cache-Control', 'no-cache')
+        if last_modified:
+            self.send_header('Last-Modified', last_modified)
         self.end_headers()
         self.wfile.write(body)
 
+    def _send_static(self, path):
+        """Serve a compressible UI file from the compressed cache; False to fall back to the default handler."""
+        if not COMPRESS_MIN_BYTES or not path.endswith(COMPRESSIBLE_SUFFIXES) and not path.endswith('/'):
+            return False
+        encoding = negotiate_encoding(self.headers.get('Accept-Encoding'))
+        if not encoding:
+            return False
+        local = Path(self.translate_path(path))
+        if local.is_dir():
+            local = local / 'index.html'
+        try:
+            st = local.stat()
+        except OSError:
+            return False
+        if not local.is_file() or st.st_size < COMPRESS_MIN_BYTES:
+            return False
+        etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+        if self._not_modified(etag):
+            return True
+        try:
+            size, body = compressed_variant('static', str(local), etag, local.read_bytes, encoding)
+        except OSError:
+            return False
+        with _COMPRESSED_LOCK:
+            _COMPRESSED['responses'] += 1
+            _COMPRESSED['bytesIn'] += size
+            _COMPRESSED['bytesOut'] += len(body)
+        self._send_body(200, self.guess_type(str(local)), body, etag, encoding,
+                        last_modified=self.date_time_string(st.st_mtime))
+        return True
+
+    def _not_modified(self, etag):
+        """Answer 304 if the client already holds `etag`, in any encoding (If-None-Match)."""
+        if not etag:
+            return False
+        tags = [t.strip().removeprefix('W/') for t in (self.headers.get('If-None-Match') or '').split(',')]
+        variants = {encoded_etag(etag, encoding) for encoding in (None, 'gzip', 'br')}
+        held = next((t for t in tags if t in variants), etag if '*' in tags else None)
+        if held is None:
+            return False
+        self.send_response(304)
+        self.send_header('ETag', held)
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        return True
+
+    def _serve_events(self, last_event_id):
+        """Open an SSE stream; the connection is handed to its own thread so it does not hold a worker."""
+        with _EVENTS_WAKE:
+            if _EVENTS['subscribers'] >= EVENT_MAX_SUBSCRIBERS:
+                return self._json(503, {'ok': False, 'error': 'too_many_streams'})
+            _EVENTS['subscribers'] += 1
+            cursor = _EVENTS['seq']
+            pending = events_after(last_event_id) if last_event_id else []
+            if pending is None:
+                pending = [_resync_event(cursor)]
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('X-Accel-Buffering', 'no')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.flush()
+        self.close_connection = True
+        _PUMP_WAKE.set()
+        detach = getattr(self.server, 'detach', None)
+        if detach is None:
+            return stream_events(self.connection, cursor, pending)
+        detach(self.connection)
+        threading.Thread(target=stream_events, args=(self.connection, cursor, pending), name='sse', daemon=True).start()
+
     def do_GET(self):
         parsed = urlparse(self.path)
         path = parsed.path
+        _REQUEST_CONTEXT.source = f"GET {path}"
 
         if path == '/api/health':
-            data = load_data()
+            data = read_data(segments=())
             return self._json(200, {'ok': True, 'autonomous': bool(data.get('autonomous'))})
         if path == '/api/dashboard':
-            data = load_data()
-            build_mission_index(data)
-
-            # Watchdog: avoid missions stuck forever in "running" if the server was restarted mid-run.
-            now = now_ms()
-            stuck_ms = 12 * 60 * 1000
-
-            mutated = False
-            for c in data.get('columns', []) or []:
-                for m in c.get('items', []) or []:
-                    ensure_execution_defaults(m)
-
-                    ex = normalize_execution(m)
-                    if str(ex.get('status') or '').lower() == 'running':
-                        started = int(ex.get('startedAt') or 0)
-                        if started and (now - started) > stuck_ms:
-                            ex['status'] = 'failed'
-                            ex['endedAt'] = ex.get('endedAt') or now
-                            ex['updatedAt'] = now
-                            evid = list(ex.get('evidence') or [])
-                            evid.append('watchdog: marked failed after server restart / timeout')
-                            ex['evidence'] = list(dict.fromkeys([str(x) for x in evid if str(x).strip()]))
-
-                            m['execution'] = ex
-                            m['executionStatus'] = ex['status']
-                            m['effectEvidence'] = ex.get('evidence', [])
-                            m['effective'] = has_execution_proof(m)
-                            m['needsEffectiveness'] = not m['effective']
-                            m['needsUserAction'] = 'Execução ficou presa em running (provável restart). Reexecute para gerar PROOF.'
-
-                            mutated = True
-
-                    mid = m.get('id')
-                    tl = get_mission_timeline(data, mid)
-                    m['timelineCount'] = len(tl)
-                    if tl:
-                        m['latestTransition'] = tl[-1]
-
-                    # Attach last execution run summary for UI cards ("Última execução")
-                    runs = get_mission_runs(data, mid, 1)
-                    if runs:
-                        m['lastRun'] = runs[0]
-
-            if mutated:
-                save_data(data)
-
-            return self._json(200, data)
+            if self._not_modified(state_etag()):
+                return
+            etag, body = dashboard_view()
+            return self._json_body(200, body, etag)
+        if path == '/api/events':
+            qs = parse_qs(parsed.query)
+            return self._serve_events(self.headers.get('Last-Event-ID') or (qs.get('lastEventId') or [None])[0])
+        if path == '/api/dashboard/changes':
+            qs = parse_qs(parsed.query)
+            try:
+                since = int(qs['since'][0]) if qs.get('since') else None
+            except ValueError:
+                return self._json(400, {'ok': False, 'error': 'bad_cursor'})
+            return self._json(200, dashboard_changes(since, (qs.get('boot') or [None])[0]))
         if path == '/api/chat':
-            return self._json(200, load_chat())
+            qs = parse_qs(parsed.query)
+            try:
+                since = int(qs['since'][0]) if qs.get('since') else None
+                limit = max(1, min(int((qs.get('limit') or [300])[0]), 1000))
+            except ValueError:
+                return self._json(400, {'ok': False, 'error': 'bad_cursor'})
+            return self._json(200, load_chat(since, limit))
+        if path == '/api/search':
+            qs = parse_qs(parsed.query)
+            q = (qs.get('q') or [''])[0]
+            try:
+                limit = max(1, min(int((qs.get('limit') or [20])[0]), 100))
+                offset = max(0, int((qs.get('offset') or [0])[0]))
+            except ValueError:
+                return self._json(400, {'ok': False, 'error': 'bad_page'})
+            return self._json(200, {'ok': True, 'q': q, 'offset': offset, 'limit': limit, **search_missions(q, limit, offset)})
+        if path == '/api/storage/stats':
+            return self._json(200, {'ok': True, **storage_stats()})
         if path == '/api/openclaw/telemetry':
-            data = load_data()
-            payload = build_openclaw_telemetry(data)
-            save_data(data)
-            return self._json(200, payload)
+            return self._json(200, build_openclaw_telemetry())
 
         if path.startswith('/api/docs/'):
             name = unquote(path[len('/api/docs/'):]).strip('/')
@@ -1435,10 +4254,17 @@ class Handler(SimpleHTTPRequestHandler):
             mission_id = unquote(path[len('/api/missions/'): -len('/runs')]).strip('/')
             if not mission_id:
                 return self._json(400, {'ok': False, 'error': 'missing_mission_id'})
-            data = load_data()
+            data = read_data(segments=('missionRuns',))
             runs = get_mission_runs(data, mission_id, 30)
             return self._json(200, {'ok': True, 'missionId': mission_id, 'runs': runs, 'count': len(runs)})
 
+        if path.startswith('/api/missions/') and path.endswith('/trail'):
+            mission_id = unquote(path[len('/api/missions/'): -len('/trail')]).strip('/')
+            if not mission_id:
+                return self._json(400, {'ok': False, 'error': 'missing_mission_id'})
+            entries = get_mission_trail(mission_id)
+            return self._json(200, {'ok': True, 'missionId': mission_id, 'entries': entries, 'count': len(entries)})
+
         if path == '/api/projects':
             reg = load_project_registry()
             # Return only safe/public fields
@@ -1455,9 +4281,11 @@ class Handler(SimpleHTTPRequestHandler):
             mission_id = unquote(path[len('/api/missions/'): -len('/timeline')]).strip('/')
             if not mission_id:
                 return self._json(400, {'ok': False, 'error': 'missing_mission_id'})
-            data = load_data()
+            data = read_data(segments=('auditTrail', 'missionRuns'))
             timeline = get_mission_timeline(data, mission_id)
             _, _, mission = find_mission_ref(data, mission_id)
+            # normalize_execution() writes into the card: work on a copy of the cached one.
+            mission = dict(mission) if mission else None
             ex = normalize_execution(mission) if mission else {}
             runs = get_mission_runs(data, mission_id, 10)
             last_run = runs[0] if runs else None
@@ -1480,32 +4308,15 @@ class Handler(SimpleHTTPRequestHandler):
                 'lastRun': last_run,
             })
         if path == '/api/metrics/ops':
-            data = load_data()
-            runs = []
-            mission_runs = data.get('missionRuns') or {}
-            if isinstance(mission_runs, dict):
-                for v in mission_runs.values():
-                    if isinstance(v, list):
-                        runs.extend([x for x in v if isinstance(x, dict)])
-
-            now = now_ms()
-            last_minute = [r for r in runs if int(r.get('endedAt') or 0) >= (now - 60_000)]
-            throughput = len(last_minute)
-
-            closed = [r for r in runs if str(r.get('status') or '') in ('effective', 'failed', 'proof_pending')]
-            effective = [r for r in closed if str(r.get('status') or '') == 'effective']
-            sla = round((len(effective) / len(closed)) * 100, 1) if closed else 0.0
-
-            return self._json(200, {
-                'ok': True,
-                'throughputPerMin': throughput,
-                'slaEffectivePct': sla,
-                'runsClosed': len(closed),
-                'runsEffective': len(effective),
-            })
+            etag, payload = ops_metrics()
+            if self._not_modified(etag):
+                return
+            return self._json(200, payload, etag)
 
         if path == '/api/intelligence/radar':
-            data = load_data()
+            if self._not_modified(state_etag()):
+                return
+            data, etag = read_data_tagged(segments=('externalRadar',))
             radar = data.get('externalRadar') or {'signals': [], 'updatedAt': 0}
             signals = sorted((radar.get('signals') or []), key=lambda x: int(x.get('createdAt') or 0), reverse=True)[:50]
             return self._json(200, {
@@ -1513,10 +4324,12 @@ class Handler(SimpleHTTPRequestHandler):
                 'updatedAt': radar.get('updatedAt') or 0,
                 'signals': signals,
                 'count': len(signals),
-            })
+            }, etag)
 
         if path == '/api/governance/summary':
-            data = load_data()
+            if self._not_modified(state_etag()):
+                return
+            data, etag = read_data_tagged(segments=('approvals',))
             rules = data.get('boardRules') or {}
 
             cards = []
@@ -1561,7 +4374,11 @@ class Handler(SimpleHTTPRequestHandler):
                 'approvals': data.get('approvals') or [],
                 'pendingApprovals': pending,
                 'epics': epics,
-            })
+            }, etag)
+
+        if path == '/MISSOES_TRAJETO.md':
+            # The trail is stored append-only in monthly shards; serve the grouped per-card view.
+            return self._send_body(200, 'text/markdown; charset=utf-8', render_trail_markdown().encode('utf-8'))
 
         if path == '/api/openclaw/agents/details':
             details = BASE / 'openclaw-agents-details.json'
@@ -1577,21 +4394,26 @@ class Handler(SimpleHTTPRequestHandler):
                 except Exception:
                     return self._json(500, {'ok': False, 'error': 'invalid_agents_details'})
             return self._json(404, {'ok': False, 'error': 'agents_details_not_found'})
+        if self._send_static(path):
+            return
         return super().do_GET()
 
     def _read_json(self):
-        length = int(self.headers.get('Content-Length', '0'))
-        raw = self.rfile.read(length) if length else b'{}'
         try:
-            return json.loads(raw.decode('utf-8'))
+            return loads_json(self._body or b'{}')
         except Exception:
             return {}
 
     def do_POST(self):
+        _REQUEST_CONTEXT.source = f"POST {self.path}"
+        # Always consume the body, even on routes that ignore it, so a kept-alive connection
+        # stays aligned on the next request.
+        length = int(self.headers.get('Content-Length') or 0)
+        self._body = self.rfile.read(length) if length > 0 else b''
         if self.path == '/api/missions':
             payload = self._read_json()
 
-            data = load_data()
+            data = load_data(segments=TRANSITION_SEGMENTS)
             inbox = get_column(data, 'Inbox', 'Inbox')
 
             mission_id = str(payload.get('id') or payload.get('missionId') or f"m_{uuid.uuid4().hex[:10]}")
@@ -1659,12 +4481,10 @@ class Handler(SimpleHTTPRequestHandler):
                 'subtasks': payload.get('subtasks') if isinstance(payload.get('subtasks'), list) else [],
             }
 
-            inbox['items'] = [mission] + (inbox.get('items', []) or [])
+            place_mission(data, inbox, mission)
             record_transition(data, mission['id'], 'broadcast', 'inbox', actor='stark', reason='mission_created', title=mission.get('title', 'Missão sem título'))
             append_trail_entry(mission['id'], mission.get('title', 'Missão sem título'), 'Missão criada via Broadcast e enviada para Inbox.')
 
-            build_mission_index(data)
-
             dispatched = False
             if data.get('autonomous'):
                 dispatched = dispatch_mission_to_openclaw(mission)
@@ -1676,7 +4496,7 @@ class Handler(SimpleHTTPRequestHandler):
                     (f"Despacho autônomo para OpenClaw executado (agent: {dispatch_target})." if dispatched else 'Falha no despacho autônomo para OpenClaw.')
                 )
 
-            save_data(data)
+            save_data(data, durable=True)
             return self._json(200, {
                 'ok': True,
                 'missionId': mission['id'],
@@ -1695,7 +4515,7 @@ class Handler(SimpleHTTPRequestHandler):
             if not mission_id or not text:
                 return self._json(400, {'ok': False, 'error': 'invalid_payload'})
 
-            data = load_data()
+            data = load_data(segments=())
             col, idx, mission = find_mission_ref(data, mission_id)
             if mission is None:
                 return self._json(404, {'ok': False, 'error': 'mission_not_found'})
@@ -1704,6 +4524,7 @@ class Handler(SimpleHTTPRequestHandler):
             comments.append({'id': f"c_{uuid.uuid4().hex[:8]}", 'text': text, 'author': author, 'at': now_ms()})
             mission['comments'] = comments[-100:]
             col['items'][idx] = mission
+            touch_missions(data, mission.get('id'))
             append_trail_entry(mission_id, mission.get('title', 'Missão'), f"Comentário adicionado por {author}.")
             save_data(data)
             return self._json(200, {'ok': True, 'missionId': mission_id, 'count': len(mission['comments'])})
@@ -1716,7 +4537,7 @@ class Handler(SimpleHTTPRequestHandler):
             if not mission_id or not text:
                 return self._json(400, {'ok': False, 'error': 'invalid_payload'})
 
-            data = load_data()
+            data = load_data(segments=())
             col, idx, mission = find_mission_ref(data, mission_id)
             if mission is None:
                 return self._json(404, {'ok': False, 'error': 'mission_not_found'})
@@ -1725,6 +4546,7 @@ class Handler(SimpleHTTPRequestHandler):
             subtasks.append({'id': f"s_{uuid.uuid4().hex[:8]}", 'text': text, 'done': done, 'at': now_ms()})
             mission['subtasks'] = subtasks[-100:]
             col['items'][idx] = mission
+            touch_missions(data, mission.get('id'))
             append_trail_entry(mission_id, mission.get('title', 'Missão'), 'Subtask adicionada.')
             save_data(data)
             return self._json(200, {'ok': True, 'missionId': mission_id, 'count': len(mission['subtasks'])})
@@ -1735,7 +4557,7 @@ class Handler(SimpleHTTPRequestHandler):
             if not mission_id:
                 return self._json(400, {'ok': False, 'error': 'missing_mission_id'})
 
-            data = load_data()
+            data = load_data(segments=RUN_SEGMENTS)
             col, idx, mission = find_mission_ref(data, mission_id)
             if mission is None:
                 return self._json(404, {'ok': False, 'error': 'mission_not_found'})
@@ -1768,6 +4590,7 @@ class Handler(SimpleHTTPRequestHandler):
                 mission['needsUserAction'] = ''
 
             col['items'][idx] = mission
+            touch_missions(data, mission.get('id'))
 
             # Activity Feed (per-execution)
             run_id = f"proof_{uuid.uuid4().hex[:12]}"
@@ -1785,7 +4608,7 @@ class Handler(SimpleHTTPRequestHandler):
             })
 
             append_trail_entry(mission_id, mission.get('title', 'Missão sem título'), f"Proof registrada ({ex['status']}) com {len(ex.get('evidence', []))} evidência(s).")
-            save_data(data)
+            save_data(data, durable=True)
             return self._json(200, {'ok': True, 'missionId': mission_id, 'execution': ex, 'effective': mission['effective']})
 
         if self.path == '/api/missions/run':
@@ -1794,7 +4617,7 @@ class Handler(SimpleHTTPRequestHandler):
             if not mission_id:
                 return self._json(400, {'ok': False, 'error': 'missing_mission_id'})
 
-            data = load_data()
+            data = load_data(segments=())
             col, idx, mission = find_mission_ref(data, mission_id)
             if mission is None:
                 return self._json(404, {'ok': False, 'error': 'mission_not_found'})
@@ -1822,6 +4645,7 @@ class Handler(SimpleHTTPRequestHandler):
 
             if col is not None and idx is not None:
                 col['items'][idx] = mission
+            touch_missions(data, mission.get('id'))
 
             append_trail_entry(
                 mission_id,
@@ -1829,13 +4653,14 @@ class Handler(SimpleHTTPRequestHandler):
                 ('Execução (LLM) re-enfileirada (override de running anterior).' if was_running else 'Execução (LLM) enfileirada (async).')
             )
             save_data(data)
+            watch_running(mission_id, ex['startedAt'])
 
             owner = mission.get('owner', 'Stark')
             agent_id = owner_to_agent_id(owner)
             msg = mission_openclaw_text(mission)
 
             # Activity Feed: register run start (async)
-            data_start = load_data()
+            data_start = load_data(segments=RUN_SEGMENTS)
             upsert_mission_run(data_start, mission_id, run_id, {
                 'tool': ex.get('tool') or 'openclaw_agent',
                 'agent': agent_id,
@@ -1849,6 +4674,7 @@ class Handler(SimpleHTTPRequestHandler):
             save_data(data_start)
 
             def worker():
+                _REQUEST_CONTEXT.source = 'POST /api/missions/run (worker)'
                 # Criterion C must verify the workspace where the responsible agent operates.
                 exec_repo = agent_workspace_dir(agent_id)
                 before_git = git_snapshot(exec_repo)
@@ -1881,7 +4707,7 @@ class Handler(SimpleHTTPRequestHandler):
                 else:
                     git_evidence.append('git: repo not detected (skipping diff-based proof)')
 
-                data2 = load_data()
+                data2 = load_data(segments=TRANSITION_SEGMENTS + RUN_SEGMENTS)
                 col2, idx2, mission2 = find_mission_ref(data2, mission_id)
                 if mission2 is None:
                     return
@@ -1927,17 +4753,18 @@ class Handler(SimpleHTTPRequestHandler):
                     # Remove from current column
                     if col2 is not None and idx2 is not None:
                         try:
-                            col2['items'].pop(idx2)
+                            take_mission(data2, col2, idx2)
                         except Exception:
                             pass
                     target = get_column(data2, 'Proof Pending', 'Proof Pending')
                     if target is not None:
-                        target['items'] = [mission2] + (target.get('items', []) or [])
+                        place_mission(data2, target, mission2)
                         record_transition(data2, mission_id, 'in_progress', 'proof_pending', actor='alfred', reason='criterion_c_missing', title=mission2.get('title','Missão'))
                         append_trail_entry(mission_id, mission2.get('title', 'Missão'), 'Movida para Proof Pending (Critério de proof não atendido).')
                 else:
                     if col2 is not None and idx2 is not None:
                         col2['items'][idx2] = mission2
+                touch_missions(data2, mission2.get('id'))
 
                 # Activity Feed: finalize run
                 try:
@@ -1957,7 +4784,7 @@ class Handler(SimpleHTTPRequestHandler):
                     'durationMs': duration_ms,
                     'output': (result.get('reply') or '')[:2400],
                     'evidence': evidence,
-                }, prepend_if_missing=True)
+                })
 
                 append_trail_entry(mission_id, mission2.get('title', 'Missão sem título'), f"Execução (LLM) finalizada: {ex2['status']} | evidências: {len(evidence)}")
                 save_data(data2)
@@ -1979,7 +4806,7 @@ class Handler(SimpleHTTPRequestHandler):
             if not mission_id:
                 return self._json(400, {'ok': False, 'error': 'missing_mission_id'})
 
-            data = load_data()
+            data = load_data(segments=RUN_SEGMENTS)
             col, idx, mission = find_mission_ref(data, mission_id)
             if mission is None:
                 return self._json(404, {'ok': False, 'error': 'mission_not_found'})
@@ -2020,6 +4847,7 @@ class Handler(SimpleHTTPRequestHandler):
 
             if col is not None and idx is not None:
                 col['items'][idx] = mission
+            touch_missions(data, mission.get('id'))
 
             # Activity Feed
             duration_ms = max(0, int(ex.get('endedAt') or now_ms()) - int(ex.get('startedAt') or now_ms()))
@@ -2058,18 +4886,15 @@ class Handler(SimpleHTTPRequestHandler):
             if not isinstance(board, list):
                 return self._json(400, {'ok': False, 'error': 'invalid_board'})
 
-            data = load_data()
+            data = load_data(segments=TRANSITION_SEGMENTS)
             merge_board_with_canonical(data, board)
-            build_mission_index(data)
+            build_mission_index(data, titles=False)
 
             action = payload.get('action', 'update')
             mission_id = str(payload.get('missionId') or payload.get('cardId') or '').strip()
             title = payload.get('title') or 'Missão sem título'
             if not mission_id:
                 mission_id = find_mission_id_by_title_unique(data, title) or ''
-            if mission_id:
-                idx = data.get('missionIndex', {})
-                idx[mission_id] = mission_id
 
             actor = str(payload.get('actor') or 'ui')
             transition_id = str(payload.get('transitionId') or '').strip() or None
@@ -2161,11 +4986,11 @@ class Handler(SimpleHTTPRequestHandler):
                     # Move mission to Assigned for re-execution
                     if col_ref is not None and idx_ref is not None:
                         try:
-                            col_ref['items'].pop(idx_ref)
+                            take_mission(data, col_ref, idx_ref)
                         except Exception:
                             pass
                     assigned = get_column(data, 'Assigned', 'Assigned')
-                    assigned['items'] = [mission_ref] + (assigned.get('items') or [])
+                    place_mission(data, assigned, mission_ref)
 
                 record_transition(data, mission_id or 'unknown', payload.get('fromColumn', '?'), 'assigned', actor='marcos', reason='monarca_reply', title=title, transition_id=transition_id)
                 append_trail_entry(mission_id or 'unknown', title, 'Monarca respondeu via dashboard; missão voltou para Assigned.')
@@ -2198,6 +5023,8 @@ class Handler(SimpleHTTPRequestHandler):
                 record_transition(data, mission_id or 'unknown', from_c, 'deleted', actor=actor, reason='delete_card', title=title, transition_id=transition_id)
                 append_trail_entry(mission_id or 'unknown', title, f"Card removido manualmente da coluna {from_c}.")
 
+            if mission_ref is not None:
+                touch_missions(data, mission_ref.get('id'))
             enforce_done_proof(data)
             enforce_locked_done(data)
             save_data(data)
@@ -2212,33 +5039,23 @@ class Handler(SimpleHTTPRequestHandler):
             if not mission_id:
                 return self._json(400, {'ok': False, 'error': 'missing_mission_id'})
 
-            data = load_data()
-            removed = False
+            data = load_data(segments=TRANSITION_SEGMENTS)
             removed_from = []
 
-            for col in data.get('columns', []) or []:
-                items = col.get('items', []) or []
-                kept = []
-                for m in items:
-                    mid = str(m.get('id') or m.get('cardId') or '').strip()
-                    if mid == mission_id:
-                        removed = True
-                        removed_from.append(str(col.get('name') or '?'))
-                        continue
-                    kept.append(m)
-                col['items'] = kept
-
-            if not removed:
-                return self._json(404, {'ok': False, 'error': 'card_not_found'})
+            while True:
+                col, idx, _ = find_mission_ref(data, mission_id)
+                if col is None:
+                    break
+                take_mission(data, col, idx)
+                removed_from.append(str(col.get('name') or '?'))
 
-            idx = data.get('missionIndex', {})
-            if isinstance(idx, dict):
-                idx.pop(mission_id, None)
+            if not removed_from:
+                return self._json(404, {'ok': False, 'error': 'card_not_found'})
 
             for col_name in removed_from:
                 record_transition(data, mission_id, col_name, 'deleted', actor='ui', reason='delete_card', title=payload.get('title') or 'Missão sem título')
             append_trail_entry(mission_id, payload.get('title') or 'Missão sem título', f"Card removido manualmente (endpoint dedicado) das colunas: {', '.join(removed_from)}.")
-            save_data(data)
+            save_data(data, durable=True)
             return self._json(200, {'ok': True, 'removedFrom': removed_from})
 
         if self.path == '/api/chat/send':
@@ -2247,17 +5064,12 @@ class Handler(SimpleHTTPRequestHandler):
             if not text:
                 return self._json(400, {'ok': False, 'error': 'empty_text'})
             from_agent = str(payload.get('from', 'Stark')).strip() or 'Stark'
-            chat = load_chat()
-            msg = {
+            msg = append_chat_message({
                 'id': f"c_{uuid.uuid4().hex[:10]}",
                 'from': from_agent,
                 'text': text,
                 'at': now_ms(),
-            }
-            msgs = chat.get('messages', [])
-            msgs.append(msg)
-            chat['messages'] = msgs[-300:]
-            save_chat(chat)
+            })
             return self._json(200, {'ok': True, 'message': msg})
 
         if self.path == '/api/agents/command':
@@ -2269,7 +5081,7 @@ class Handler(SimpleHTTPRequestHandler):
             if not cmd:
                 return self._json(400, {'ok': False, 'error': 'empty_cmd', 'message': 'Comando vazio.'})
 
-            data = load_data()
+            data = load_data(segments=TRANSITION_SEGMENTS)
             assigned = get_column(data, 'Assigned', 'Assigned')
 
             mission_id = f"m_{uuid.uuid4().hex[:12]}"
@@ -2314,14 +5126,28 @@ class Handler(SimpleHTTPRequestHandler):
                 },
             }
 
-            assigned['items'] = [mission] + (assigned.get('items', []) or [])
+            place_mission(data, assigned, mission)
             record_transition(data, mission_id, 'marcos', 'assigned', actor='marcos', reason='command_created', title=mission.get('title', 'Missão'))
             append_trail_entry(mission_id, mission.get('title', 'Missão'), 'Comando criado pelo Marcos via dashboard (Comandos).')
-            build_mission_index(data)
-            save_data(data)
+            save_data(data, durable=True)
 
             return self._json(200, {'ok': True, 'missionId': mission_id, 'title': mission.get('title'), 'requestedTitle': requested_title})
 
+        if self.path == '/api/triage/batch':
+            payload = self._read_json()
+            items = payload.get('items')
+            if not isinstance(items, list) or len(items) > 1000:
+                return self._json(400, {'ok': False, 'error': 'invalid_items'})
+            goal = str(payload.get('goal') or '')
+            results = []
+            for item in items:
+                if isinstance(item, dict):
+                    text = item.get('text') or f"{item.get('title') or ''} {item.get('desc') or ''}"
+                else:
+                    text = item
+                results.append(classify_text(str(text or ''), goal))
+            return self._json(200, {'ok': True, 'count': len(results), 'results': results})
+
         if self.path == '/api/intelligence/ingest':
             payload = self._read_json()
             url = str(payload.get('url') or '').strip()
@@ -2333,7 +5159,7 @@ class Handler(SimpleHTTPRequestHandler):
             raw = '\n'.join([x for x in [url, text, goal] if x])
             revenue, autonomy, urgency, total = compute_ingest_score(raw, goal)
 
-            data = load_data()
+            data = load_data(segments=('externalRadar',))
             mission_id = f"m_{uuid.uuid4().hex[:10]}"
             title = payload.get('title') or (f"Radar: {urlparse(url).netloc}" if url else 'Radar: insight externo')
             mission = {
@@ -2360,7 +5186,7 @@ class Handler(SimpleHTTPRequestHandler):
             }
 
             inbox = get_column(data, 'Inbox', 'Inbox')
-            inbox['items'] = [mission] + (inbox.get('items') or [])
+            place_mission(data, inbox, mission)
 
             radar = data.get('externalRadar') or {'signals': [], 'updatedAt': 0}
             radar['signals'] = [{
@@ -2394,13 +5220,14 @@ class Handler(SimpleHTTPRequestHandler):
 
         if self.path == '/api/governance/rules':
             payload = self._read_json()
-            data = load_data()
+            data = load_data(segments=())
             rules = data.get('boardRules') or {}
             for k in ('requireApprovalForDone', 'requireReviewBeforeDone', 'blockMoveIfPendingApproval'):
                 if k in payload:
                     rules[k] = bool(payload.get(k))
             data['boardRules'] = rules
-            save_data(data)
+            touch_missions(data)
+            save_data(data, durable=True)
             return self._json(200, {'ok': True, 'rules': rules})
 
         if self.path == '/api/governance/approvals/decision':
@@ -2412,7 +5239,7 @@ class Handler(SimpleHTTPRequestHandler):
             if not mission_id or decision not in ('approved', 'rejected'):
                 return self._json(400, {'ok': False, 'error': 'invalid_payload'})
 
-            data = load_data()
+            data = load_data(segments=('approvals',))
             col, idx, mission = find_mission_ref(data, mission_id)
             if mission is None:
                 return self._json(404, {'ok': False, 'error': 'mission_not_found'})
@@ -2422,6 +5249,7 @@ class Handler(SimpleHTTPRequestHandler):
                 mission['approved'] = True
             if col is not None and idx is not None:
                 col['items'][idx] = mission
+            touch_missions(data, mission.get('id'))
 
             approvals = data.get('approvals') or []
             approvals.append({
@@ -2435,21 +5263,68 @@ class Handler(SimpleHTTPRequestHandler):
             })
             data['approvals'] = approvals
             append_trail_entry(mission_id, mission.get('title', 'Missão'), f"Approval {decision} por {actor}. {reason}".strip())
-            save_data(data)
+            save_data(data, durable=True)
             return self._json(200, {'ok': True, 'missionId': mission_id, 'approvalStatus': decision})
 
         if self.path == '/api/autonomous/mode':
             payload = self._read_json()
             enabled = bool(payload.get('enabled') or payload.get('auto_exec_enabled'))
-            data = load_data()
+            data = load_data(segments=())
             data['autonomous'] = enabled
-            save_data(data)
+            touch_missions(data)
+            save_data(data, durable=True)
             return self._json(200, {'ok': True, 'enabled': enabled})
 
         return self._json(404, {'ok': False, 'error': 'not found'})
 
 
 if __name__ == '__main__':
-    server = ThreadingHTTPServer(('0.0.0.0', 8080), Handler)
-    print('Mission Control server running on 0.0.0.0:8080')
-    server.serve_forever()
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Mission Control server')
+    parser.add_argument('--import-json', nargs='?', const=str(DATA_FILE), metavar='PATH', help='import a data.json file into data.db and exit')
+    parser.add_argument('--export-json', nargs='?', const=str(DATA_FILE), metavar='PATH', help='export data.db to a data.json file and exit')
+    parser.add_argument('--migrate', action='store_true', help='apply pending schema migrations to the stored state and exit')
+    parser.add_argument('--compress-trail', action='store_true', help='gzip the trail shards of past months and exit')
+    parser.add_argument('--host', default=HTTP_HOST, help=f'address to listen on (MC_HOST, default {HTTP_HOST})')
+    parser.add_argument('--port', type=int, default=HTTP_PORT, help=f'port to listen on (MC_PORT, default {HTTP_PORT})')
+    parser.add_argument('--workers', type=int, default=HTTP_WORKERS, help=f'HTTP worker threads (MC_HTTP_WORKERS, default {HTTP_WORKERS})')
+    parser.add_argument('--queue', type=int, default=HTTP_QUEUE, help=f'connections waiting for a worker before 503 (MC_HTTP_QUEUE, default {HTTP_QUEUE})')
+    parser.add_argument('--idle-timeout', type=float, default=HTTP_IDLE_TIMEOUT_S, help=f'seconds an idle keep-alive connection is kept (MC_HTTP_IDLE_TIMEOUT_S, default {HTTP_IDLE_TIMEOUT_S:g})')
+    args = parser.parse_args()
+
+    if args.compress_trail:
+        done = compress_trail_shards()
+        print(f"Compressed trail shards: {', '.join(done) if done else 'none'}")
+        raise SystemExit(0)
+
+    if args.migrate:
+        migrate_storage()
+        raise SystemExit(0)
+
+    if args.import_json:
+        try:
+            n = sqlite_import_json(args.import_json)
+        except ValueError as e:
+            raise SystemExit(f'Import aborted: {e}')
+        print(f'Imported {args.import_json} into {DATA_DB_FILE} ({n} rows written)')
+        raise SystemExit(0)
+    if args.export_json:
+        sqlite_export_json(args.export_json)
+        print(f'Exported {DATA_DB_FILE} to {args.export_json}')
+        raise SystemExit(0)
+
+    atexit.register(flush_data)
+    start_watchdog()
+    start_event_pump()
+    Handler.timeout = args.idle_timeout
+    server = PooledHTTPServer((args.host, args.port), Handler, workers=max(1, args.workers), queue_size=args.queue)
+    _HTTP['server'] = server
+    print(f'Mission Control server running on {args.host}:{args.port} ({max(1, args.workers)} workers)')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        flush_data()
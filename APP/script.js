@@ -92,6 +92,11 @@ let selectedAgentId = null;
 let refreshTimer = null;
 let autonomyTimer = null;
 let refreshMs = Number(localStorage.getItem('mc_refresh_ms') || 15000);
+let lastPolledDashboard = null;
+let boardMirror = null; // server columns at { version, boot }, patched from /api/dashboard/changes
+let lastAgents = [];
+let eventSource = null;
+let streamLive = false; // /api/events connected: polling is off until it drops
 let boardState = fallbackData.columns.map((c) => ({ name: c.name, items: [...(c.items || [])] }));
 let inboxMissions = [];
 let activityLog = [];
@@ -99,6 +104,8 @@ let executionsWindow = [];
 let selectedMissionKey = 'system';
 let telemetryState = { agents: [], summary: { activeSessions: 0 } };
 let opsMetrics = { throughputPerMin: 0, slaEffectivePct: 0 };
+let chatSeq = 0;
+let chatMessages = [];
 let showFailedOnly = false;
 let boardFilter = localStorage.getItem('mc_board_filter') || 'all';
 
@@ -589,10 +596,19 @@ const normalizeAgent = (agent) => ({
   memory: agent?.memory || '',
 });
 
+// Last ETag + body per URL: the server answers 304 while the board version is unchanged.
+const validatorCache = new Map();
+
 async function fetchJson(url) {
-  const res = await fetch(url, { cache: 'no-store' });
+  const cached = validatorCache.get(url);
+  const res = await fetch(url, { cache: 'no-store', headers: cached ? { 'If-None-Match': cached.etag } : {} });
+  if (res.status === 304 && cached) return cached.body;
   if (!res.ok) throw new Error('fetch failed');
-  return res.json();
+  const body = await res.json();
+  const etag = res.headers.get('ETag');
+  if (etag) validatorCache.set(url, { etag, body });
+  else validatorCache.delete(url);
+  return body;
 }
 
 async function fetchText(url) {
@@ -613,6 +629,34 @@ async function loadDashboard() {
   }
 }
 
+async function loadDashboardChanges() {
+  const qs = boardMirror ? `?since=${boardMirror.version}&boot=${encodeURIComponent(boardMirror.boot)}` : '';
+  return fetchJson(`/api/dashboard/changes${qs}`);
+}
+
+// Applies a delta (or full snapshot) to boardMirror. Returns the touched cards grouped by column,
+// for ingestDashboardTransitions, or null when nothing changed.
+function applyDashboardChanges(patch) {
+  if (patch.full || !boardMirror) {
+    boardMirror = { version: patch.version, boot: patch.boot, columns: patch.columns || [] };
+    return { columns: boardMirror.columns };
+  }
+  boardMirror.version = patch.version;
+  const changed = patch.changed || [];
+  const deleted = patch.deleted || [];
+  if (!changed.length && !deleted.length && !patch.layout) return null;
+
+  const byId = new Map();
+  boardMirror.columns.forEach((col) => (col.items || []).forEach((m) => byId.set(m.id, m)));
+  changed.forEach((m) => byId.set(m.id, m));
+  deleted.forEach((id) => byId.delete(id));
+  const layout = patch.layout || boardMirror.columns.map((col) => ({ name: col.name, ids: (col.items || []).map((m) => m.id) }));
+  boardMirror.columns = layout.map((col) => ({ name: col.name, items: col.ids.map((id) => byId.get(id)).filter(Boolean) }));
+
+  const touched = new Set(changed.map((m) => m.id));
+  return { columns: boardMirror.columns.map((col) => ({ name: col.name, items: col.items.filter((m) => touched.has(m.id)) })) };
+}
+
 async function loadAgentsDetails() {
   for (const url of ['/api/openclaw/agents/details', './openclaw-agents-details.json', '/api/openclaw/agents']) {
     try {
@@ -861,6 +905,32 @@ function saveAgentCfg(agentId = 'stark', cfg = {}) {
   localStorage.setItem(`mc_agentcfg_${agentId}`, JSON.stringify(cfg));
 }
 
+function renderAgentChat() {
+  if (!chatFeed) return;
+  chatFeed.innerHTML = chatMessages.length
+    ? chatMessages.map((m) => `<p class="muted" style="margin:6px 0"><strong>${escapeHtml(m.from || '—')}</strong>: ${escapeHtml(m.text || '')}</p>`).join('')
+    : '<p class="muted">Sem mensagens.</p>';
+}
+
+async function refreshAgentChat() {
+  if (!chatFeed) return;
+  try {
+    // Only messages after the last seen seq; the first call fetches the recent tail.
+    const d = await fetchJson(chatSeq ? `/api/chat?since=${chatSeq}` : '/api/chat?limit=80');
+    const seq = Number(d?.seq || 0);
+    if (seq < chatSeq) {
+      chatSeq = 0;
+      chatMessages = [];
+      return refreshAgentChat();
+    }
+    const fresh = Array.isArray(d?.messages) ? d.messages : [];
+    chatSeq = seq;
+    if (!fresh.length && chatFeed.childElementCount) return;
+    chatMessages = chatMessages.concat(fresh).slice(-80);
+    renderAgentChat();
+  } catch (_) {}
+}
+
 function renderCmdFeed(lines = []) {
   if (!cmdFeed) return;
   const out = (lines || []).slice(-6);
@@ -1895,18 +1965,51 @@ function setLiveTab(tab) {
   }
 }
 
+function applyBoardPatch(patch) {
+  const delta = applyDashboardChanges(patch);
+  // Render copies: board actions patch boardState cards in place.
+  if (delta) {
+    ingestDashboardTransitions(delta);
+    renderBoard(boardMirror.columns.map((col) => ({ name: col.name, items: col.items.map((m) => ({ ...m })) })));
+  }
+}
+
+async function refreshBoardFromChanges() {
+  let patch = null;
+  try {
+    patch = await loadDashboardChanges();
+  } catch (_) {}
+  if (!patch?.ok) return false;
+  applyBoardPatch(patch);
+  return true;
+}
+
+function stopRealtimeRefresh() {
+  if (refreshTimer) clearInterval(refreshTimer);
+  refreshTimer = null;
+}
+
 function startRealtimeRefresh() {
   if (refreshTimer) clearInterval(refreshTimer);
   refreshTimer = setInterval(async () => {
     // Avoid refreshing while dragging on desktop.
     if (draggedCard) return;
 
-    const dashboard = await loadDashboard();
-    ingestDashboardTransitions(dashboard);
-    renderBoard(dashboard.columns || fallbackData.columns);
+    if (!(await refreshBoardFromChanges())) {
+      const dashboard = await loadDashboard();
+      // Same object = 304 (board unchanged): nothing to re-render.
+      if (dashboard !== lastPolledDashboard) {
+        lastPolledDashboard = dashboard;
+        ingestDashboardTransitions(dashboard);
+        renderBoard(dashboard.columns || fallbackData.columns);
+      }
+    }
 
     const [agents] = await Promise.all([loadAgentsDetails(), loadTelemetry(), loadOpsMetrics()]);
-    if (agents.length) renderAgents(agents);
+    if (agents.length) {
+      lastAgents = agents;
+      renderAgents(agents);
+    }
     if (document.querySelector('#live-toolbar .chip.active')?.dataset?.liveTab === 'governance') {
       const gov = await loadGovernanceSummary();
       renderGovernance(gov);
@@ -1915,6 +2018,84 @@ function startRealtimeRefresh() {
   }, refreshMs);
 }
 
+// Push channel: while /api/events is open the board, runs, telemetry and chat arrive as events
+// and polling is stopped; when the stream drops, polling takes over until it reconnects
+// (EventSource resumes with Last-Event-ID by itself).
+function startEventStream() {
+  if (!window.EventSource) return false;
+  if (eventSource) eventSource.close();
+  const es = new EventSource('/api/events');
+  eventSource = es;
+  const on = (kind, fn) => es.addEventListener(kind, (e) => {
+    let d = null;
+    try {
+      d = JSON.parse(e.data);
+    } catch (_) {
+      return;
+    }
+    fn(d);
+  });
+
+  es.addEventListener('open', () => {
+    streamLive = true;
+    stopRealtimeRefresh();
+    void refreshBoardFromChanges();
+  });
+  es.addEventListener('error', () => {
+    if (!refreshTimer) startRealtimeRefresh();
+    streamLive = false;
+  });
+
+  on('card-changed', (d) => {
+    if (draggedCard) return;
+    if (boardMirror && boardMirror.boot === d.boot && boardMirror.version === d.since) applyBoardPatch(d);
+    else void refreshBoardFromChanges();
+    if (document.querySelector('#live-toolbar .chip.active')?.dataset?.liveTab === 'governance') {
+      loadGovernanceSummary().then(renderGovernance).catch(() => {});
+    }
+  });
+  on('resync', () => {
+    void refreshBoardFromChanges();
+    if (chatDrawer?.classList.contains('open')) void refreshAgentChat();
+  });
+  on('transition', (d) => {
+    ingestDashboardTransitions({ columns: [{ name: d.to, items: [{ id: d.missionId, title: d.title, latestTransition: d }] }] });
+  });
+  on('run-started', (d) => {
+    addLiveEvent('Execução iniciada', `${d.title || d.missionId}: ${d.run?.tool || 'run'}`, false, { missionKey: d.missionId, missionTitle: d.title });
+  });
+  on('run-finished', (d) => {
+    addLiveEvent('Execução finalizada', `${d.title || d.missionId}: ${d.run?.status || 'ok'}`, true, { missionKey: d.missionId, missionTitle: d.title });
+  });
+  on('telemetry', (d) => {
+    if (!Array.isArray(d?.agents)) return;
+    telemetryState = d;
+    if (lastAgents.length) renderAgents(lastAgents);
+    else updateHeaderMetrics();
+  });
+  on('agents', (d) => {
+    if (!Array.isArray(d?.agents)) return;
+    lastAgents = d.agents.map(normalizeAgent);
+    renderAgents(lastAgents);
+  });
+  on('ops', (d) => {
+    if (!d?.ok) return;
+    opsMetrics = d;
+    updateHeaderMetrics();
+  });
+  on('chat', (m) => {
+    if (!chatDrawer?.classList.contains('open')) return;
+    if (chatSeq && Number(m.seq) === chatSeq + 1) {
+      chatSeq = Number(m.seq);
+      chatMessages = chatMessages.concat([m]).slice(-80);
+      renderAgentChat();
+    } else {
+      void refreshAgentChat();
+    }
+  });
+  return true;
+}
+
 function setupUI() {
   const isMobile = window.matchMedia('(max-width: 768px)').matches;
   if (isMobile && !localStorage.getItem('mc_board_filter')) {
@@ -2027,6 +2208,7 @@ function setupUI() {
     settingsDrawer?.classList.remove('open');
     setChatTab('commands');
     renderCmdFeed(['Pronto. Crie uma missão delegada aqui.']);
+    refreshAgentChat();
 
     // Load default agent cfg
     const id = (agentCfgId?.value || 'stark').trim();
@@ -2216,7 +2398,7 @@ function setupUI() {
     localStorage.setItem('mc_api_board_state', API.boardState);
     localStorage.setItem('mc_api_autonomous', API.autonomous);
 
-    startRealtimeRefresh();
+    if (!streamLive) startRealtimeRefresh();
     await checkBackendConnection();
     showToast('Configurações salvas');
   });
@@ -2230,9 +2412,13 @@ async function init() {
   const [dashboard, agents, projects] = await Promise.all([loadDashboard(), loadAgentsDetails(), loadProjects(), loadMission(), loadTelemetry(), loadOpsMetrics()]);
   hydrateProjectSelect(projects);
   renderBoard(dashboard.columns || fallbackData.columns);
-  if (agents.length) renderAgents(agents);
+  if (agents.length) {
+    lastAgents = agents;
+    renderAgents(agents);
+  }
   addLiveEvent('Live inicializado', 'Histórico pronto para acompanhar o que foi feito.');
   startRealtimeRefresh();
+  startEventStream();
   startAutonomyLoop();
 }
 
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Compiled keyword classifier vs the per-function substring scans it replaced.
+
+Checks that both give the same area/kind/owner/score on a random corpus, then times
+classifying every text with the four old functions vs one classify_text() call. Each round
+starts with empty caches; the "cold" line clears the word cache before every text too (no
+word seen before, the worst case).
+
+Usage: python3 scripts/bench_classifier.py [--texts 5000] [--words 40] [--seed 7]
+"""
+import argparse
+import importlib.util
+import random
+import sys
+import time
+from pathlib import Path
+
+APP = Path(__file__).resolve().parent.parent
+
+
+def load_server():
+    spec = importlib.util.spec_from_file_location('app_server_bench', APP / 'app_server.py')
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+# The functions as they were before the rules table (reference for equality and timing).
+def old_infer_context_area(text):
+    t = (text or '').lower()
+    if any(k in t for k in ['yt-automator', 'yt automator', 'youtube', 'yt_automator']):
+        return 'yt_automator'
+    if any(k in t for k in ['escala']):
+        return 'escala'
+    if any(k in t for k in ['header', 'topbar', 'brand', 'mission control', 'titulo', 'título', 'métrica', 'metric', 'númer', 'numero', 'contagem', 'count']):
+        return 'topbar'
+    if any(k in t for k in ['kanban', 'board', 'coluna', 'inbox', 'assigned', 'review', 'done', 'fluxo']):
+        return 'board'
+    if any(k in t for k in ['live', 'histórico', 'historico', 'timeline', 'trajeto', 'evidência', 'evidence', 'proof']):
+        return 'live'
+    if any(k in t for k in ['agente', 'agents', 'jarvis', 'wanda', 'thanos', 'alfred', 'oráculo', 'oraculo', 'modelo', 'config']):
+        return 'agents'
+    if any(k in t for k in ['broadcast', 'comando', 'comandos', 'command']):
+        return 'broadcast'
+    if any(k in t for k in ['api', 'backend', 'server', 'endpoint', 'app_server.py']):
+        return 'backend'
+    return 'general'
+
+
+def old_compute_ingest_score(text, goal=''):
+    t = (text or '').lower()
+    g = (goal or '').lower()
+    revenue = autonomy = urgency = 2
+    if any(k in t or k in g for k in ['venda', 'convers', 'oferta', 'ticket', 'ltv', 'mrr', 'receita', 'monet']):
+        revenue += 2
+    if any(k in t for k in ['funnel', 'landing', 'copy', 'pricing', 'upsell']):
+        revenue += 1
+    if any(k in t or k in g for k in ['autom', 'workflow', 'agent', 'deleg', 'orquestr', 'autonom']):
+        autonomy += 2
+    if any(k in t for k in ['integra', 'api', 'pipeline', 'cron']):
+        autonomy += 1
+    if any(k in t for k in ['hoje', 'agora', 'urgente', 'bloqueio', 'erro', 'queda']):
+        urgency += 2
+    elif any(k in t for k in ['esta semana', 'sprint', 'prioridade']):
+        urgency += 1
+    revenue, autonomy, urgency = (max(1, min(5, x)) for x in (revenue, autonomy, urgency))
+    return revenue, autonomy, urgency, revenue + autonomy + urgency
+
+
+def old_infer_mission_kind(title, desc):
+    t = f"{title} {desc}".lower()
+    if 'sitegpt' in t and ('remova' in t or 'remove' in t):
+        return 'remove_sitegpt_badge'
+    if ('header' in t or 'mission control' in t) and any(k in t for k in ['icone', 'ícone', 'icon']):
+        return 'header_brand_icon'
+    if ('sessão live' in t or 'sessao live' in t or 'live panel' in t or 'trackeamento' in t or 'tracking' in t) and ('dashboard' in t or 'task' in t or 'tarefa' in t):
+        return 'live_tracking_center_plan'
+    if 'header' in t and ('numero' in t or 'número' in t):
+        return 'header_real_numbers'
+    if 'chat' in t and 'agente' in t:
+        return 'agent_chat_toggle'
+    if 'tela infinita' in t or 'scroll infinito' in t:
+        if 'doc' in t or 'bloco' in t:
+            return 'infinite_reading'
+        return 'dashboard_infinite_scroll'
+    if 'infinita' in t and 'leitura' in t:
+        return 'infinite_reading'
+    return 'manual_required'
+
+
+def old_infer_owner_simple(title, desc):
+    t = f"{title} {desc}".lower()
+    if any(k in t for k in ['api', 'backend', 'deploy', 'infra', 'server', 'banco', 'db', 'código', 'code', 'integra']):
+        return 'Thanos'
+    if any(k in t for k in ['ui', 'ux', 'frontend', 'front', 'layout', 'página', 'design', 'landing', 'tela', 'header', 'visual', 'icone', 'ícone']):
+        return 'Wanda'
+    return 'Alfred'
+
+
+def corpus(mod, n, words, seed):
+    rnd = random.Random(seed)
+    keywords = sorted(mod._CLASSIFIER['masks'])
+    filler = ['ajustar', 'o', 'card', 'para', 'mostrar', 'status', 'correto', 'na', 'semana', 'usuário', 'Missão',
+              'revisar', 'texto', 'botão', 'cliente', 'relatório', 'Ação', 'rápida', 'com', 'prova']
+    out = []
+    for _ in range(n):
+        parts = [rnd.choice(keywords).upper() if rnd.random() < .05 else rnd.choice(keywords) if rnd.random() < .15 else rnd.choice(filler)
+                 for _ in range(rnd.randint(3, words))]
+        out.append(' '.join(parts))
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--texts', type=int, default=5000)
+    parser.add_argument('--words', type=int, default=40)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    mod = load_server()
+    texts = corpus(mod, args.texts, args.words, args.seed)
+    goal = 'aumentar receita com automação'
+
+    def old_all(t):
+        return {
+            'area': old_infer_context_area(t),
+            'kind': old_infer_mission_kind(t, ''),
+            'owner': old_infer_owner_simple(t, ''),
+            'scores': old_compute_ingest_score(t, goal),
+        }
+
+    def new_all(t):
+        r = mod.classify_text(f"{t} ", goal)
+        return {
+            'area': r['area'],
+            'kind': r['kind'],
+            'owner': r['owner'],
+            'scores': (r['impactRevenue'], r['impactAutonomy'], r['urgency'], r['priorityScore']),
+        }
+
+    mismatches = [t for t in texts if old_all(t) != new_all(t)]
+    print(f"texts: {len(texts)}  mismatches: {len(mismatches)}")
+    for t in mismatches[:5]:
+        print('  ', t[:120], old_all(t), new_all(t))
+
+    # What creating + running a mission asks for: triage (kind, owner), the card fields
+    # (kind, owner) and the context area of the same title + desc.
+    def old_create(t):
+        old_infer_mission_kind(t, ''), old_infer_owner_simple(t, '')
+        old_infer_mission_kind(t, ''), old_infer_owner_simple(t, '')
+        old_infer_context_area(f"{t} ")
+
+    def new_create(t):
+        mod.infer_mission_kind(t, ''), mod.infer_owner_simple(t, '')
+        mod.infer_mission_kind(t, ''), mod.infer_owner_simple(t, '')
+        mod.infer_context_area(f"{t} ")
+
+    def new_cold(t):
+        mod._word_mask.cache_clear()
+        return new_all(t)
+
+    for name, fn in (('all signals, old functions', old_all), ('all signals, classify_text', new_all),
+                     ('all signals, cold', new_cold),
+                     ('mission creation, old', old_create), ('mission creation, compiled', new_create)):
+        best = None
+        for _ in range(3):
+            mod.keyword_mask.cache_clear()
+            mod._word_mask.cache_clear()
+            started = time.perf_counter()
+            for t in texts:
+                fn(t)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"{name:<30}{best * 1e6 / len(texts):>9.1f} us/text")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
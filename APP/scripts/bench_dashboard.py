@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""How GET /api/dashboard latency scales with the number of cards.
+
+Each size runs against a throwaway copy of app_server.py seeded with a synthetic board
+(scripts/bench_data.py), so the real data.json is never touched. The "scan" column times
+the old per-card timeline enrichment (filter + sort of the whole auditTrail per card)
+for comparison with the per-mission audit index.
+
+Usage: python3 scripts/bench_dashboard.py [--cards 250,500,1000,2000,4000] [--requests 20]
+"""
+import argparse
+import http.client
+import importlib.util
+import json
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE))
+from bench_data import synthetic_board  # noqa: E402
+
+
+def load_server(workdir, board):
+    shutil.copy(HERE.parent / 'app_server.py', workdir / 'app_server.py')
+    (workdir / 'data.json').write_text(json.dumps(board, ensure_ascii=False), encoding='utf-8')
+    spec = importlib.util.spec_from_file_location(f'app_server_bench_{id(workdir)}', workdir / 'app_server.py')
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    mod.WRITE_WINDOW_MS = 0
+    return mod
+
+
+def scan_enrichment(data):
+    trail = data.get('auditTrail') or []
+    started = time.perf_counter()
+    for col in data['columns']:
+        for m in col['items']:
+            tl = sorted((e for e in trail if str(e.get('missionId') or '').strip() == m['id']), key=lambda e: int(e.get('timestamp') or 0))
+            len(tl)
+    return time.perf_counter() - started
+
+
+def run(cards, requests):
+    board = synthetic_board(cards=cards, runs_per_mission=1)
+    with tempfile.TemporaryDirectory() as tmp:
+        mod = load_server(Path(tmp), board)
+
+        class QuietHandler(mod.Handler):
+            def log_message(self, *args):
+                pass
+
+        server = mod.PooledHTTPServer(('127.0.0.1', 0), QuietHandler, workers=4)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', server.server_address[1])
+            timings = []
+            size = 0
+            for i in range(requests + 1):
+                started = time.perf_counter()
+                conn.request('GET', '/api/dashboard')
+                body = conn.getresponse().read()
+                if i:  # first request pays the initial load
+                    timings.append(time.perf_counter() - started)
+                size = len(body)
+                conn.close()
+            scan_s = scan_enrichment(mod.read_data())
+        finally:
+            server.shutdown()
+            server.server_close()
+    timings.sort()
+    p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+    return statistics.median(timings), p95, size, scan_s
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cards', default='250,500,1000,2000,4000')
+    parser.add_argument('--requests', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'cards':>7}{'p50 ms':>10}{'p95 ms':>10}{'bytes':>14}{'scan ms':>10}")
+    for cards in [int(x) for x in args.cards.split(',') if x.strip()]:
+        p50, p95, size, scan_s = run(cards, args.requests)
+        print(f"{cards:>7}{p50 * 1000:>10.1f}{p95 * 1000:>10.1f}{size:>14,}{scan_s * 1000:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Synthetic Mission Control boards for the benchmark scripts in this folder."""
+import random
+
+COLUMNS = [
+    'Inbox', 'Assigned', 'In Progress', 'Review', 'Done', 'Blocked', 'Failed',
+    'Awaiting Monarca', 'Proof Pending', 'Needs Monarca Decision',
+]
+OWNERS = ['Stark', 'Jarvis', 'Thanos', 'Wanda', 'Alfred', 'Oráculo']
+WORDS = (
+    'revisar missão dashboard header api deploy proof evidência cliente receita automação '
+    'relatório bug corrigir página vendas integração webhook fila agente execução'
+).split()
+
+
+def _text(rng, n):
+    return ' '.join(rng.choice(WORDS) for _ in range(n))
+
+
+def synthetic_board(cards=2000, events=5000, runs_per_mission=4, seed=7):
+    """Board in the data.json shape: `cards` missions spread over the columns, an audit
+    trail of `events` transitions and `runs_per_mission` runs (2400-char I/O) per card."""
+    rng = random.Random(seed)
+    now = 1_790_000_000_000
+    columns = [{'name': name, 'items': []} for name in COLUMNS]
+    ids = []
+    for i in range(cards):
+        mid = f"m_{i:010x}"
+        ids.append(mid)
+        columns[rng.randrange(len(columns))]['items'].append({
+            'id': mid,
+            'missionId': mid,
+            'cardId': mid,
+            'title': f"#task_{i + 1} {_text(rng, 4)}",
+            'desc': _text(rng, 40),
+            'owner': rng.choice(OWNERS),
+            'riskLevel': rng.randrange(3),
+            'approved': rng.random() < 0.5,
+            'priorityScore': rng.randrange(15),
+            'createdAt': now - rng.randrange(10**9),
+            'updatedAt': now,
+            'execution': {'status': rng.choice(['queued', 'running', 'effective', 'failed']), 'evidence': [_text(rng, 6)]},
+        })
+    trail = []
+    for i in range(events):
+        trail.append({
+            'id': f"tr_{i:012x}",
+            'missionId': rng.choice(ids) if ids else 'unknown',
+            'from': rng.choice(COLUMNS).lower(),
+            'to': rng.choice(COLUMNS).lower(),
+            'actor': rng.choice(OWNERS).lower(),
+            'reason': 'move',
+            'timestamp': now - rng.randrange(10**8),
+        })
+    mission_runs = {}
+    for mid in ids:
+        mission_runs[mid] = [{
+            'id': f"run_{mid}_{j}",
+            'missionId': mid,
+            'tool': 'openclaw_agent',
+            'agent': rng.choice(OWNERS),
+            'input': _text(rng, 400)[:2400],
+            'output': _text(rng, 400)[:2400],
+            'status': rng.choice(['effective', 'failed', 'proof_pending']),
+            'startedAt': now - 60_000,
+            'endedAt': now,
+            'durationMs': 60_000,
+            'evidence': [_text(rng, 5)],
+        } for j in range(runs_per_mission)]
+    return {
+        'agents': [],
+        'columns': columns,
+        'feed': [],
+        'autonomous': False,
+        'missionIndex': {},
+        'auditTrail': trail,
+        'missionRuns': mission_runs,
+        'transitionKeys': {f"k{i}": now for i in range(events)},
+        'taskSeq': cards,
+        'approvals': [],
+        'externalRadar': {'signals': [], 'updatedAt': 0},
+    }
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Encode/decode time and size of the state serializers on a large synthetic board.
+
+Usage: python3 scripts/bench_serializer.py [--cards 2000] [--repeat 5]
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from bench_data import synthetic_board  # noqa: E402
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def candidates():
+    out = [
+        ('json indent=2 (old)', lambda o: json.dumps(o, ensure_ascii=False, indent=2).encode('utf-8'), json.loads),
+        ('json compact', lambda o: json.dumps(o, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), json.loads),
+    ]
+    if orjson is not None:
+        out.append(('orjson', orjson.dumps, orjson.loads))
+    if msgpack is not None:
+        out.append(('msgpack', lambda o: msgpack.packb(o, use_bin_type=True), lambda b: msgpack.unpackb(b, raw=False)))
+    return out
+
+
+def best_of(fn, arg, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(arg)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cards', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    board = synthetic_board(cards=args.cards)
+    print(f"board: {args.cards} cards, {len(board['auditTrail'])} audit events")
+    print(f"{'format':<22}{'encode ms':>12}{'decode ms':>12}{'bytes':>14}")
+    for name, encode, decode in candidates():
+        enc_s, payload = best_of(encode, board, args.repeat)
+        dec_s, decoded = best_of(decode, payload, args.repeat)
+        assert decoded == board, name
+        print(f"{name:<22}{enc_s * 1000:>12.1f}{dec_s * 1000:>12.1f}{len(payload):>14,}")
+    missing = [n for n, m in (('orjson', orjson), ('msgpack', msgpack)) if m is None]
+    if missing:
+        print(f"(not installed: {', '.join(missing)})")
+
+
+if __name__ == '__main__':
+    main()
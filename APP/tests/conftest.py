@@ -0,0 +1,83 @@
+"""Each test runs against its own copy of app_server.py in a temp dir (state files live next
+to the module), loaded under a fresh name so engines and caches never leak between tests."""
+import http.client
+import importlib.util
+import json
+import itertools
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+
+APP = Path(__file__).resolve().parent.parent
+_SEQ = itertools.count()
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """server(backend='json') -> module; calling it again reopens the same files, like a restart."""
+    shutil.copy(APP / 'app_server.py', tmp_path / 'app_server.py')
+
+    def load(backend='json'):
+        monkeypatch.setenv('MC_STORAGE', backend)
+        spec = importlib.util.spec_from_file_location(f'app_server_test_{next(_SEQ)}', tmp_path / 'app_server.py')
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+        mod.WRITE_WINDOW_MS = 0
+        return mod
+
+    return load
+
+
+@pytest.fixture
+def serve():
+    """serve(mod, **pool) -> PooledHTTPServer on a free port, shut down after the test."""
+    servers = []
+
+    def start(mod, **pool):
+        class QuietHandler(mod.Handler):
+            def log_message(self, *args):
+                pass
+
+        httpd = mod.PooledHTTPServer(('127.0.0.1', 0), QuietHandler, **pool)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        servers.append(httpd)
+        return httpd
+
+    yield start
+    for httpd in servers:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def fetch(httpd, path, payload=None, **headers):
+    """One request on a fresh connection: GET, or POST with a JSON `payload`. -> (response, body)."""
+    conn = http.client.HTTPConnection('127.0.0.1', httpd.server_address[1], timeout=30)
+    if payload is None:
+        conn.request('GET', path, headers=headers)
+    else:
+        conn.request('POST', path, body=json.dumps(payload), headers={'Content-Type': 'application/json', **headers})
+    resp = conn.getresponse()
+    body = resp.read()
+    conn.close()
+    return resp, body
+
+
+def add_mission(mod, data, mission_id, title, column='Inbox', **fields):
+    """Create a card the way the handlers do (locator, audit trail and dirty log included)."""
+    mission = {'id': mission_id, 'cardId': mission_id, 'title': title, 'desc': '', **fields}
+    mod.place_mission(data, mod.get_column(data, column, column), mission)
+    mod.record_transition(data, mission_id, 'broadcast', column.lower(), actor='test', reason='mission_created', title=title)
+    return mission
+
+
+def stored_view(mod, data):
+    """The persisted part of a state, with runs in their stored (list) layout."""
+    return {
+        'columns': data['columns'],
+        'auditTrail': data.get('auditTrail'),
+        'missionRuns': mod.stored_segment('missionRuns', data.get('missionRuns')),
+        'approvals': data.get('approvals'),
+        'taskSeq': data.get('taskSeq'),
+    }
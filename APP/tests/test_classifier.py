@@ -0,0 +1,49 @@
+import importlib.util
+import json
+import random
+
+import pytest
+
+from conftest import APP, fetch
+
+
+@pytest.fixture(scope='module')
+def reference():
+    """The per-function substring scans the compiled classifier replaced (kept in the bench)."""
+    spec = importlib.util.spec_from_file_location('bench_classifier_ref', APP / 'scripts' / 'bench_classifier.py')
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _texts(mod, n=400):
+    rnd = random.Random(11)
+    words = sorted(mod._CLASSIFIER['masks']) + ['integrapi', 'yt-automatorx', 'númeroS', 'Header', 'o', 'card', 'ação']
+    texts = [' '.join(rnd.choice(words) for _ in range(rnd.randint(1, 12))) for _ in range(n)]
+    # Keywords glued to each other or to other text, overlapping ones and line breaks.
+    return texts + ['apiserver', 'comandosagents', 'missioncontrol', 'mission\ncontrol', 'sessão  live', 'tela infinita doc', '']
+
+
+def test_matches_the_old_functions(server, reference):
+    mod = server()
+    goal = 'aumentar receita com automação'
+    for text in _texts(mod):
+        signals = mod.classify_text(text, goal)
+        assert signals['area'] == reference.old_infer_context_area(text), text
+        assert signals['kind'] == reference.old_infer_mission_kind(text, '') == mod.infer_mission_kind(text, ''), text
+        assert signals['owner'] == reference.old_infer_owner_simple(text, '') == mod.infer_owner_simple(text, ''), text
+        scores = (signals['impactRevenue'], signals['impactAutonomy'], signals['urgency'], signals['priorityScore'])
+        assert scores == reference.old_compute_ingest_score(text, goal) == mod.compute_ingest_score(text, goal), text
+
+
+def test_triage_batch_endpoint(server, serve, reference):
+    httpd = serve(server())
+    items = ['Remova o badge do SiteGPT', {'title': 'Header', 'desc': 'mostrar número real'}, {'text': 'deploy urgente hoje'}]
+    resp, body = fetch(httpd, '/api/triage/batch', {'items': items, 'goal': 'mais vendas'})
+    assert resp.status == 200
+    results = json.loads(body)['results']
+    assert [r['kind'] for r in results] == ['remove_sitegpt_badge', 'header_real_numbers', 'manual_required']
+    assert [r['owner'] for r in results] == ['Alfred', 'Wanda', 'Thanos']
+    assert results[2]['urgency'] == reference.old_compute_ingest_score('deploy urgente hoje', 'mais vendas')[2]
+
+    assert fetch(httpd, '/api/triage/batch', {'items': 'nope'})[0].status == 400
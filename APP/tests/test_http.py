@@ -0,0 +1,97 @@
+import gzip
+import http.client
+import json
+import socket
+import time
+
+from conftest import add_mission, fetch
+
+
+def test_telemetry_poll_keeps_dashboard_etag(server, serve):
+    mod = server()
+    data = mod.load_data()
+    add_mission(mod, data, 'm_1', 'Painel')
+    mod.save_data(data)
+    httpd = serve(mod)
+
+    resp, _ = fetch(httpd, '/api/dashboard')
+    etag = resp.getheader('ETag')
+    version = mod.state_version()
+    assert fetch(httpd, '/api/openclaw/telemetry')[0].status == 200
+    mod.pump_samples()
+    assert mod.state_version() == version
+    assert fetch(httpd, '/api/dashboard', **{'If-None-Match': etag})[0].status == 304
+
+
+def _until(check, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not check():
+        assert time.monotonic() < deadline, 'timed out'
+        time.sleep(0.01)
+
+
+def test_full_queue_is_shed_with_503(server, serve):
+    httpd = serve(server(), workers=1, queue_size=1)
+    address = ('127.0.0.1', httpd.server_address[1])
+    # An idle keep-alive connection holds the only worker; the next one waits in the queue.
+    busy = socket.create_connection(address)
+    _until(lambda: httpd.http_stats()['busy'] == 1)
+    waiting = socket.create_connection(address)
+    _until(lambda: httpd.http_stats()['queued'] == 1)
+
+    resp, body = fetch(httpd, '/api/health')
+    assert resp.status == 503 and resp.getheader('Retry-After') == '1'
+    assert json.loads(body)['error'] == 'overloaded'
+    assert httpd.http_stats()['shed'] == 1
+
+    busy.close()
+    waiting.sendall(b'GET /api/health HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n')
+    assert waiting.makefile('rb').readline().startswith(b'HTTP/1.1 200')
+    waiting.close()
+
+
+def test_keep_alive_reuses_the_connection(server, serve):
+    httpd = serve(server(), workers=2)
+    conn = http.client.HTTPConnection('127.0.0.1', httpd.server_address[1], timeout=10)
+    sockets = set()
+    for path in ('/api/health', '/api/dashboard', '/api/health'):
+        conn.request('GET', path)
+        resp = conn.getresponse()
+        resp.read()
+        assert resp.status == 200 and not resp.will_close
+        sockets.add(id(conn.sock))
+    conn.close()
+    assert len(sockets) == 1 and httpd.http_stats()['accepted'] == 1
+
+
+def test_gzip_variant_has_its_own_etag(server, serve):
+    mod = server()
+    data = mod.load_data()
+    for n in range(20):
+        add_mission(mod, data, f'm_{n}', f'Card {n}', desc='texto repetido ' * 10)
+    mod.save_data(data)
+    httpd = serve(mod)
+
+    plain, plain_body = fetch(httpd, '/api/dashboard')
+    assert len(plain_body) >= mod.COMPRESS_MIN_BYTES and plain.getheader('Content-Encoding') is None
+    resp, body = fetch(httpd, '/api/dashboard', **{'Accept-Encoding': 'gzip'})
+    etag = resp.getheader('ETag')
+    assert resp.getheader('Content-Encoding') == 'gzip' and resp.getheader('Vary') == 'Accept-Encoding'
+    assert etag == plain.getheader('ETag')[:-1] + '-gzip"'
+    assert gzip.decompress(body) == plain_body
+
+    hits = mod.compression_stats()['cacheHits']
+    assert fetch(httpd, '/api/dashboard', **{'Accept-Encoding': 'gzip'})[1] == body
+    assert mod.compression_stats()['cacheHits'] == hits + 1
+
+    resp, body = fetch(httpd, '/api/dashboard', **{'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert resp.status == 304 and resp.getheader('ETag') == etag and body == b''
+
+
+def test_small_bodies_are_not_compressed(server, serve):
+    mod = server()
+    httpd = serve(mod)
+    resp, body = fetch(httpd, '/api/health', **{'Accept-Encoding': 'gzip, br'})
+    assert resp.status == 200 and len(body) < mod.COMPRESS_MIN_BYTES
+    assert resp.getheader('Content-Encoding') is None and resp.getheader('Vary') is None
+    assert json.loads(body)['ok'] and mod.compression_stats()['responses'] == 0
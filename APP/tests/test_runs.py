@@ -0,0 +1,43 @@
+import json
+
+from conftest import add_mission
+
+
+def _ids(mod, data, mission_id):
+    return [r['id'] for r in mod.get_mission_runs(data, mission_id, 100)]
+
+
+def test_ring_wraps_around_newest_first(server):
+    mod = server()
+    data = mod.load_data()
+    add_mission(mod, data, 'm_1', 'Com runs')
+    total = mod.RUN_HISTORY_MAX + 5
+    for n in range(total):
+        mod.upsert_mission_run(data, 'm_1', f'r{n}', {'status': 'running'})
+    expected = [f'r{n}' for n in range(total - 1, 4, -1)]
+    assert _ids(mod, data, 'm_1') == expected
+
+    # Updating a run keeps its place; an overwritten run is gone from the index.
+    mod.upsert_mission_run(data, 'm_1', 'r10', {'status': 'effective'})
+    assert _ids(mod, data, 'm_1') == expected
+    assert 'r0' not in data['runIndex']['m_1']
+    assert next(r for r in mod.get_mission_runs(data, 'm_1', 100) if r['id'] == 'r10')['status'] == 'effective'
+
+
+def test_runs_are_stored_and_served_as_lists(server, tmp_path):
+    mod = server()
+    data = mod.load_data()
+    add_mission(mod, data, 'm_1', 'Com runs')
+    for n in range(mod.RUN_HISTORY_MAX + 2):
+        mod.upsert_mission_run(data, 'm_1', f'r{n}', {'status': 'effective'})
+    mod.save_data(data, durable=True)
+
+    stored = json.loads((tmp_path / 'data.segments' / 'missionRuns.json').read_text(encoding='utf-8'))
+    assert [r['id'] for r in stored['m_1']][:2] == [f'r{mod.RUN_HISTORY_MAX + 1}', f'r{mod.RUN_HISTORY_MAX}']
+    assert len(stored['m_1']) == mod.RUN_HISTORY_MAX
+    assert 'missionRuns' not in json.loads(mod.dashboard_view()[1])
+
+    mod = server()
+    data = mod.read_data()
+    assert isinstance(data['missionRuns']['m_1'], dict)
+    assert _ids(mod, data, 'm_1') == [r['id'] for r in stored['m_1']]
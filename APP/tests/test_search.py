@@ -0,0 +1,70 @@
+from conftest import add_mission
+
+
+def _hits(mod, query):
+    return [r['missionId'] for r in mod.search_missions(query)['results']]
+
+
+def _edit(mod, mission_id, **fields):
+    data = mod.load_data()
+    col, idx, mission = mod.find_mission_ref(data, mission_id)
+    mission.update(fields)
+    col['items'][idx] = mission
+    mod.touch_missions(data, mission_id)
+    mod.save_data(data)
+
+
+def test_search_follows_mutations(server):
+    mod = server()
+    data = mod.load_data()
+    add_mission(mod, data, 'm_1', 'Migração do banco', desc='trocar índices')
+    add_mission(mod, data, 'm_2', 'Outra coisa')
+    mod.save_data(data)
+    assert _hits(mod, 'migracao banco') == ['m_1']
+
+    _edit(mod, 'm_2', comments=[{'text': 'cuidado com o rollback'}])
+    assert _hits(mod, 'rollback') == ['m_2']
+
+    data = mod.load_data()
+    mod.upsert_mission_run(data, 'm_1', 'r1', {'output': 'rollback executado'})
+    mod.save_data(data)
+    assert sorted(_hits(mod, 'rollback')) == ['m_1', 'm_2']
+
+    mod.append_trail_entry('m_2', 'Outra coisa', 'peixe no trajeto')
+    assert _hits(mod, 'peixe') == ['m_2']
+
+    data = mod.load_data()
+    col, idx, _ = mod.find_mission_ref(data, 'm_1')
+    mod.take_mission(data, col, idx)
+    mod.save_data(data)
+    assert _hits(mod, 'banco') == []
+
+
+def test_saves_reindex_only_touched_missions(server):
+    mod = server()
+    data = mod.load_data()
+    for n in range(20):
+        add_mission(mod, data, f'm_{n}', f'Card {n}')
+    mod.save_data(data)
+    assert _hits(mod, 'card') and mod.state_version() == mod._SEARCH['version']
+
+    reindexed = mod._SEARCH['reindexed']
+    _edit(mod, 'm_3', desc='agora com girafa')
+    assert mod._SEARCH['version'] == mod.state_version()
+    assert mod._SEARCH['reindexed'] - reindexed == 1
+    assert _hits(mod, 'girafa') == ['m_3']
+
+
+def test_reload_from_storage_resyncs(server, tmp_path):
+    mod = server()
+    data = mod.load_data()
+    add_mission(mod, data, 'm_1', 'Título antigo')
+    mod.save_data(data, durable=True)
+    assert _hits(mod, 'antigo') == ['m_1']
+
+    # Edited outside the server: the next read reloads and the index is rebuilt.
+    board = (tmp_path / 'data.json').read_text(encoding='utf-8').replace('Título antigo', 'Título novo')
+    (tmp_path / 'data.json').write_text(board, encoding='utf-8')
+    mod.invalidate_state_cache()
+    assert _hits(mod, 'antigo') == []
+    assert _hits(mod, 'novo') == ['m_1']
@@ -0,0 +1,118 @@
+import json
+
+import pytest
+
+from conftest import add_mission, stored_view
+
+
+def _populate(mod):
+    data = mod.load_data()
+    for i in range(3):
+        add_mission(mod, data, f'm_{i}', f'Missão {i}', comments=[{'text': f'comentário {i}'}])
+        mod.upsert_mission_run(data, f'm_{i}', f'run_{i}', {'status': 'effective', 'output': 'ok'})
+    data['approvals'].append({'id': 'apr_1', 'missionId': 'm_0', 'decision': 'approved'})
+    mod.save_data(data, durable=True)
+    return mod.read_data()
+
+
+@pytest.mark.parametrize('backend', ['json', 'journal', 'sqlite'])
+def test_round_trip(server, backend):
+    first = server(backend)
+    before = stored_view(first, _populate(first))
+    mod = server(backend)
+    after = mod.read_data()
+    assert stored_view(mod, after) == before
+    assert mod.find_mission_ref(after, 'm_2')[2]['comments'] == [{'text': 'comentário 2'}]
+
+
+def test_sqlite_export_import(server, tmp_path):
+    mod = server('sqlite')
+    before = stored_view(mod, _populate(mod))
+    out = tmp_path / 'export.json'
+    mod.sqlite_export_json(out)
+    exported = json.loads(out.read_text(encoding='utf-8'))
+    assert exported['missionRuns']['m_0'][0]['id'] == 'run_0'
+
+    (tmp_path / 'data.db').unlink()
+    for extra in tmp_path.glob('data.db-*'):
+        extra.unlink()
+    mod = server('sqlite')
+    mod.read_data()
+    mod.sqlite_import_json(out)
+    assert stored_view(mod, mod.read_data()) == before
+
+
+def test_import_refuses_split_board_without_segments(server, tmp_path):
+    mod = server('sqlite')
+    board = tmp_path / 'board.json'
+    board.write_text(json.dumps({'columns': [{'name': 'Inbox', 'items': [{'id': 'm_1', 'title': 't'}]}]}), encoding='utf-8')
+    with pytest.raises(ValueError):
+        mod.sqlite_import_json(board)
+
+    # A single-file board from before the history split still imports.
+    board.write_text(json.dumps({'columns': [{'name': 'Inbox', 'items': []}], 'auditTrail': []}), encoding='utf-8')
+    assert mod.sqlite_import_json(board) >= 0
+
+
+def test_journal_replays_up_to_a_torn_line(server, tmp_path):
+    mod = server('journal')
+    before = stored_view(mod, _populate(mod))
+    journal = tmp_path / 'data.journal.jsonl'
+    good_size = journal.stat().st_size
+    with open(journal, 'ab') as f:
+        f.write(b'{"seq":99,"at":1,"sources":[],"ops":[["missions","m_x",{"id":"m_x"')
+
+    mod = server('journal')
+    assert stored_view(mod, mod.read_data()) == before
+    assert journal.stat().st_size == good_size
+
+
+def test_journal_compaction_keeps_state(server, tmp_path):
+    mod = server('journal')
+    before = stored_view(mod, _populate(mod))
+    assert mod.journal_compact()
+    assert (tmp_path / 'data.journal.jsonl').stat().st_size == 0
+
+    mod = server('journal')
+    assert stored_view(mod, mod.read_data()) == before
+
+
+def test_single_file_board_is_migrated_and_split(server, tmp_path):
+    board = {
+        'schemaVersion': 3,
+        'columns': [{'name': 'Inbox', 'items': [{'id': 'm_1', 'title': 'Antiga'}]}],
+        'auditTrail': [{'missionId': 'm_1', 'from': 'broadcast', 'to': 'inbox', 'timestamp': 1}],
+        'telemetryCache': {'updatedAt': 1, 'payload': {'agents': []}},
+    }
+    (tmp_path / 'data.json').write_text(json.dumps(board), encoding='utf-8')
+    mod = server()
+    assert [m['name'] for m in mod.migrate_storage()] == ['prune_transition_keys', 'ring_mission_runs', 'drop_telemetry_cache']
+
+    stored = json.loads((tmp_path / 'data.json').read_text(encoding='utf-8'))
+    assert stored['schemaVersion'] == mod.SCHEMA_VERSION
+    assert 'auditTrail' not in stored and 'telemetryCache' not in stored
+    assert mod.load_data()['auditTrail'][0]['missionId'] == 'm_1'
+
+
+def test_handlers_copy_only_what_they_touch(server):
+    mod = server()
+    before = stored_view(mod, _populate(mod))
+
+    data = mod.load_data(segments=())
+    assert not set(mod.ALL_SEGMENTS) & set(data)
+    mod.find_mission_ref(data, 'm_1')[2]['comments'].append({'text': 'só o quadro'})
+    mod.touch_missions(data, 'm_1')
+    mod.save_data(data)
+    after = stored_view(mod, mod.read_data())
+    assert {k: v for k, v in after.items() if k != 'columns'} == {k: v for k, v in before.items() if k != 'columns'}
+
+    cached = mod.read_data()
+    trail = cached['auditTrail']
+    data = mod.load_data(segments=mod.TRANSITION_SEGMENTS)
+    # Audit rows are never edited: the copy shares them, but not the list or the index.
+    assert data['auditTrail'] is not trail and data['auditTrail'][0] is trail[0]
+    mod.record_transition(data, 'm_1', 'inbox', 'review', actor='test')
+    assert len(trail) == len(before['auditTrail'])
+    assert len(cached['auditIndex']['byMission']['m_1']) == 1
+    mod.save_data(data)
+    assert [e['to'] for e in mod.get_mission_timeline(mod.read_data(), 'm_1')] == ['inbox', 'review']
@@ -0,0 +1,120 @@
+import collections
+import http.client
+import json
+
+from conftest import add_mission, fetch
+
+
+def _edit(mod, mission_id, **fields):
+    data = mod.load_data(segments=())
+    mod.find_mission_ref(data, mission_id)[2].update(fields)
+    mod.touch_missions(data, mission_id)
+    mod.save_data(data)
+
+
+def _board(mod, *titles):
+    data = mod.load_data()
+    for n, title in enumerate(titles, 1):
+        add_mission(mod, data, f'm_{n}', title)
+    mod.save_data(data)
+
+
+def test_delta_after_mutation(server, serve):
+    mod = server()
+    _board(mod, 'Primeira', 'Segunda')
+    first = mod.dashboard_changes(None)
+    assert first['full'] and [m['id'] for m in first['columns'][0]['items']] == ['m_2', 'm_1']
+
+    _edit(mod, 'm_1', desc='nova descrição')
+    delta = mod.dashboard_changes(first['version'], first['boot'])
+    assert not delta['full'] and 'layout' not in delta and delta['deleted'] == []
+    assert [(m['id'], m['desc']) for m in delta['changed']] == [('m_1', 'nova descrição')]
+
+    data = mod.load_data(segments=mod.TRANSITION_SEGMENTS)
+    col, idx, mission = mod.find_mission_ref(data, 'm_2')
+    mod.take_mission(data, col, idx)
+    mod.place_mission(data, mod.get_column(data, 'Review', 'Review'), mission)
+    mod.save_data(data)
+    data = mod.load_data(segments=())
+    col, idx, _ = mod.find_mission_ref(data, 'm_1')
+    mod.take_mission(data, col, idx)
+    mod.save_data(data)
+
+    httpd = serve(mod)
+    resp, body = fetch(httpd, f"/api/dashboard/changes?since={delta['version']}&boot={delta['boot']}")
+    changes = json.loads(body)
+    assert resp.status == 200 and not changes['full']
+    assert changes['deleted'] == ['m_1'] and [m['id'] for m in changes['changed']] == ['m_2']
+    assert {c['name']: c['ids'] for c in changes['layout']}['Review'] == ['m_2']
+    assert fetch(httpd, '/api/dashboard/changes?since=x')[0].status == 400
+
+
+def test_old_cursor_gets_a_full_snapshot(server):
+    mod = server()
+    _board(mod, 'Primeira', 'Segunda')
+    mod._DASHBOARD['changes'] = collections.deque(maxlen=2)
+    old = mod.dashboard_changes(None)
+    for n in range(3):
+        _edit(mod, 'm_1', desc=f'edição {n}')
+        mod.dashboard_view()
+
+    for since, boot in ((old['version'], old['boot']), (mod.state_version(), 'outro-boot'), (10 ** 9, None)):
+        snapshot = mod.dashboard_changes(since, boot)
+        assert snapshot['full'], (since, boot)
+        items = {m['id']: m for col in snapshot['columns'] for m in col['items']}
+        assert sorted(items) == ['m_1', 'm_2'] and items['m_1']['desc'] == 'edição 2'
+    assert not mod.dashboard_changes(mod.state_version() - 1)['full']
+
+
+def _open_stream(httpd, last_event_id=None):
+    conn = http.client.HTTPConnection('127.0.0.1', httpd.server_address[1], timeout=10)
+    conn.request('GET', '/api/events', headers={'Last-Event-ID': last_event_id} if last_event_id else {})
+    resp = conn.getresponse()
+    assert resp.status == 200 and resp.getheader('Content-Type').startswith('text/event-stream')
+    return conn, resp
+
+
+def _frames(resp, n):
+    """The next `n` events of a stream as (id, event, data); retry hints and pings are skipped."""
+    frames, fields = [], {}
+    while len(frames) < n:
+        line = resp.fp.readline().decode('utf-8').rstrip('\n')
+        if line:
+            key, _, value = line.partition(': ')
+            fields[key] = value
+        elif 'event' in fields:
+            frames.append((fields['id'], fields['event'], json.loads(fields['data'])))
+            fields = {}
+        else:
+            fields = {}
+    return frames
+
+
+def test_sse_resumes_from_last_event_id(server, serve):
+    mod = server()
+    _board(mod, 'Primeira')
+    httpd = serve(mod)
+    mod.pump_board()  # baseline, publishes nothing
+    mod.publish_event('telemetry', {'n': 1})
+    resume_from = f'{mod._BOOT_ID}-{mod._EVENTS["seq"]}'
+    _edit(mod, 'm_1', desc='mudou')
+    mod.pump_board()
+    mod.publish_event('telemetry', {'n': 2})
+
+    conn, resp = _open_stream(httpd, resume_from)
+    (first_id, kind, body), (_, kind2, body2) = _frames(resp, 2)
+    assert kind == 'card-changed' and [m['id'] for m in body['changed']] == ['m_1']
+    assert first_id == f'{mod._BOOT_ID}-{int(resume_from.rpartition("-")[2]) + 1}'
+    assert (kind2, body2) == ('telemetry', {'n': 2})
+    # Still live after the backlog.
+    mod.publish_event('telemetry', {'n': 3})
+    assert _frames(resp, 1)[0][1:] == ('telemetry', {'n': 3})
+    conn.close()
+
+    # An id from another boot, or one that fell out of the log, gets a single resync.
+    mod._EVENTS['log'] = collections.deque(list(mod._EVENTS['log'])[-1:], maxlen=1)
+    for stale in ('deadbeef-1', f'{mod._BOOT_ID}-1'):
+        conn, resp = _open_stream(httpd, stale)
+        _, kind, body = _frames(resp, 1)[0]
+        assert kind == 'resync' and body['boot'] == mod._BOOT_ID
+        conn.close()
@@ -0,0 +1,49 @@
+from conftest import add_mission
+
+
+def _board(data):
+    return [{'name': c['name'], 'items': [dict(m) for m in c['items']]} for c in data['columns']]
+
+
+def _forbid_rescan(monkeypatch, mod):
+    def scan(data):
+        raise AssertionError('title index rescanned')
+    monkeypatch.setattr(mod, '_scan_title_index', scan)
+
+
+def test_title_lookups_never_rescan(server, monkeypatch):
+    mod = server()
+    data = mod.load_data()
+    add_mission(mod, data, 'm_1', 'Deploy')
+    add_mission(mod, data, 'm_2', 'Backup')
+    add_mission(mod, data, 'm_3', 'backup ')
+    mod.find_mission_id_by_title_unique(data, 'deploy')
+    _forbid_rescan(monkeypatch, mod)
+    assert mod.find_mission_id_by_title_unique(data, 'Deploy') == 'm_1'
+    assert mod.find_mission_id_by_title_unique(data, 'nada') is None
+    assert mod.find_mission_id_by_title_unique(data, 'BACKUP') is None
+
+    col, idx, _ = mod.find_mission_ref(data, 'm_3')
+    mod.take_mission(data, col, idx)
+    assert mod.find_mission_id_by_title_unique(data, 'backup') == 'm_2'
+
+
+def test_board_merge_keeps_the_title_index(server, monkeypatch):
+    mod = server()
+    data = mod.load_data()
+    add_mission(mod, data, 'm_1', 'Deploy')
+    add_mission(mod, data, 'm_2', 'Backup')
+    mod.find_mission_id_by_title_unique(data, 'deploy')
+    board = _board(data)
+    board[0]['items'] = [m for m in board[0]['items'] if m['id'] != 'm_2']
+    board[0]['items'].append({'id': 'm_9', 'title': 'Novo do cliente'})
+    board[0]['items'][0]['title'] = 'Renomeado no cliente'
+
+    _forbid_rescan(monkeypatch, mod)
+    mod.merge_board_with_canonical(data, board)
+    mod.build_mission_index(data, titles=False)
+    assert mod.find_mission_id_by_title_unique(data, 'novo do cliente') == 'm_9'
+    assert mod.find_mission_id_by_title_unique(data, 'backup') is None
+    # The canonical title wins over the client's copy.
+    assert mod.find_mission_id_by_title_unique(data, 'deploy') == 'm_1'
+    assert mod.find_mission_id_by_title_unique(data, 'renomeado no cliente') is None
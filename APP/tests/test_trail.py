@@ -0,0 +1,59 @@
+import pytest
+
+
+@pytest.fixture
+def trail(server):
+    mod = server()
+    for mission_id, title in (('m_a', 'Primeira'), ('m_b', 'Segunda'), ('m_a', 'Primeira')):
+        for n in range(3):
+            mod.append_trail_entry(mission_id, title, f'{title} passo {n}')
+    return mod
+
+
+def _texts(mod, mission_id):
+    return [e['text'] for e in mod.get_mission_trail(mission_id)]
+
+
+def test_index_finds_every_block_of_a_card(trail):
+    assert _texts(trail, 'm_a') == [f'Primeira passo {n}' for n in range(3)] * 2
+    assert _texts(trail, 'm_b') == [f'Segunda passo {n}' for n in range(3)]
+    shard = trail.trail_shard_name()
+    idx = (trail.TRAIL_DIR / f'{shard}.idx').read_text(encoding='utf-8').splitlines()
+    assert [line.split('\t')[1] for line in idx] == ['m_a', 'm_b', 'm_a']
+
+
+def test_block_missing_from_the_index_is_recovered(server, trail):
+    shard = trail.trail_shard_name()
+    # Crash between the .md and the .idx append: the block is on disk but not indexed.
+    with open(trail.TRAIL_DIR / f'{shard}.md', 'ab') as f:
+        f.write(f'\n{trail.TRAIL_MARKER}m_c — Perdida\n- Status: criado\n- Trajeto:\n  - [t] sobrou\n'.encode('utf-8'))
+    mod = server()
+    assert _texts(mod, 'm_c') == ['sobrou']
+    assert _texts(mod, 'm_a')[-1] == 'Primeira passo 2'
+
+
+def test_compressed_shard_is_read_through_the_gzmap(server, trail):
+    shard = trail.trail_shard_name()
+    before = {mid: _texts(trail, mid) for mid in ('m_a', 'm_b')}
+    page = trail.render_trail_markdown()
+    for ext in ('.md', '.idx'):
+        (trail.TRAIL_DIR / f'{shard}{ext}').rename(trail.TRAIL_DIR / f'2020-01{ext}')
+
+    mod = server()
+    mod.TRAIL_GZIP_CHUNK = 64  # several members, so a card's range skips some of them
+    assert mod.compress_trail_shards() == ['2020-01']
+    assert not (mod.TRAIL_DIR / '2020-01.md').exists()
+    assert len(mod._TRAIL['gz']['2020-01']) > 1
+
+    mod = server()
+    assert {mid: _texts(mod, mid) for mid in ('m_a', 'm_b')} == before
+    assert mod.render_trail_markdown() == page
+
+
+def test_rendered_page_follows_appends(trail):
+    page = trail.render_trail_markdown()
+    assert trail.render_trail_markdown() is page
+    trail.append_trail_entry('m_b', 'Segunda', 'mais uma')
+    page = trail.render_trail_markdown()
+    section = next(s for s in page.split('\n\n') if s.startswith(f'{trail.TRAIL_MARKER}m_b'))
+    assert section.splitlines()[-1].endswith('mais uma')